@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# measures build cost of a configuration containing a 50000-element list
+# of objects (such as a routing table) of which only a few elements are
+# accessed, and the cost of `toDictionary()` over the same configuration.
+#
+# run from the repository root:
+#
+#   python -m benchmarks.ConfigurationListBenchmarks
+##
+
+import json
+import src as appsettings2
+import timeit
+
+def createJson(count:int = 50000) -> str:
+    return json.dumps({
+        'Routes': [ { 'Path': f'/route/{i}', 'Upstream': f'http://svc{i % 64}:8080', 'Timeout': 30 } for i in range(count) ]
+    })
+
+def measure(name:str, text:str, number:int = 5, **kwargs) -> None:
+    def build():
+        configuration = appsettings2.ConfigurationBuilder(**kwargs)\
+            .addJson(json=text)\
+            .build()
+        configuration.Routes[12345].Upstream
+        return configuration
+    configuration = build()
+    elapsed = timeit.timeit(build, number=number) / number
+    print(f'{name:<24} {elapsed * 1000:>9.3f} ms/build')
+    elapsed = timeit.timeit(configuration.toDictionary, number=number) / number
+    print(f'{name:<24} {elapsed * 1000:>9.3f} ms/toDictionary')
+
+if __name__ == '__main__':
+    text = createJson()
+    measure('lazy list', text)
+    measure('readonly lists', text, readonlyLists=True)
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# measures pickle size and round-trip time of a configuration with 100000
+# leaf values, `copy.copy()` and `copy.deepcopy()` of the same
+# configuration, and the cost of sending it to a `ProcessPoolExecutor`
+# worker and back.
+#
+# run from the repository root:
+#
+#   python -m benchmarks.ConfigurationPickleBenchmarks
+##
+
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import pickle
+import src as appsettings2
+import time
+import timeit
+
+def createConfiguration(count:int = 100000) -> appsettings2.Configuration:
+    # 1000 tenants, each with 100 leaf values across nested sections
+    tenants = {}
+    for i in range(count // 100):
+        tenants[f'tenant{i}'] = {
+            'Database': { f'Option{j}': f'value{j}' for j in range(40) },
+            'Limits': { f'Limit{j}': j * 10 for j in range(40) },
+            'Features': { f'Feature{j}': j % 2 == 0 for j in range(20) }
+        }
+    return appsettings2.Configuration.fromDictionary({ 'Tenants': tenants })
+
+def echo(configuration:appsettings2.Configuration) -> appsettings2.Configuration:
+    return configuration
+
+def measure(name:str, fn:callable, number:int = 5) -> None:
+    elapsed = timeit.timeit(fn, number=number) / number
+    print(f'{name:<24} {elapsed * 1000:>9.3f} ms')
+
+if __name__ == '__main__':
+    configuration = createConfiguration()
+    data = pickle.dumps(configuration, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f'{"pickle size":<24} {len(data) / 1024:>9.1f} KiB')
+    measure('pickle.dumps', lambda: pickle.dumps(configuration, protocol=pickle.HIGHEST_PROTOCOL))
+    measure('pickle.loads', lambda: pickle.loads(data))
+    measure('copy.copy', lambda: copy.copy(configuration))
+    measure('copy.deepcopy', lambda: copy.deepcopy(configuration))
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        executor.submit(echo, None).result()
+        number = 5
+        start = time.perf_counter()
+        for i in range(number):
+            executor.submit(echo, configuration).result()
+        elapsed = (time.perf_counter() - start) / number
+        print(f'{"ProcessPoolExecutor":<24} {elapsed * 1000:>9.3f} ms/round-trip')
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# measures the cost of reading a value (by attribute, via the indexer, and
+# via `get()`) from a configuration of 8000 keys, unprofiled, profiled, and
+# profiled with sampling.
+#
+# run from the repository root:
+#
+#   python -m benchmarks.ConfigurationProfilerBenchmarks
+##
+
+import json
+import src as appsettings2
+import timeit
+
+def createJson(count:int = 8000) -> str:
+    return json.dumps({
+        f'Section{i}': { f'Key{j}': j for j in range(count // 100) } for i in range(100)
+    })
+
+def measure(name:str, text:str, number:int = 1000000, profiler:appsettings2.ConfigurationProfiler = None) -> None:
+    configuration = appsettings2.ConfigurationBuilder(profiler=profiler)\
+        .addJson(json=text)\
+        .build()
+    section = configuration.Section42
+    for method, fn in (('attribute', lambda: section.Key7), ('indexer', lambda: configuration['Section42:Key7']), ('get', lambda: configuration.get('Section42:Key7'))):
+        elapsed = timeit.timeit(fn, number=number) / number
+        print(f'{name:<24} {elapsed * 1000000000:>9.1f} ns/{method}')
+
+if __name__ == '__main__':
+    text = createJson()
+    measure('unprofiled', text)
+    measure('profiled', text, profiler=appsettings2.ConfigurationProfiler())
+    measure('profiled (1 in 100)', text, profiler=appsettings2.ConfigurationProfiler(sampleRate=100))
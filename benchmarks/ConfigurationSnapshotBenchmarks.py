@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# measures the cost of loading a configuration with 100000 leaf values
+# from a binary snapshot (`Configuration.loadb()`) against building the
+# equivalent configuration from JSON with `JsonConfigurationProvider`,
+# and the cost of opening and querying the same snapshot in-place with
+# `FrozenConfiguration`.
+#
+# run from the repository root:
+#
+#   python -m benchmarks.ConfigurationSnapshotBenchmarks
+##
+
+import json
+import src as appsettings2
+import timeit
+
+def createDictionary(count:int = 100000) -> dict:
+    # 1000 tenants, each with 100 leaf values across nested sections
+    tenants = {}
+    for i in range(count // 100):
+        tenants[f'tenant{i}'] = {
+            'Database': { f'Option{j}': f'value{j}' for j in range(40) },
+            'Limits': { f'Limit{j}': j * 10 for j in range(40) },
+            'Features': { f'Feature{j}': j % 2 == 0 for j in range(20) }
+        }
+    return { 'Tenants': tenants }
+
+def measure(name:str, fn:callable, number:int = 5) -> float:
+    elapsed = timeit.timeit(fn, number=number) / number
+    print(f'{name:<24} {elapsed * 1000:>9.3f} ms')
+    return elapsed
+
+if __name__ == '__main__':
+    source = createDictionary()
+    text = json.dumps(source)
+    data = appsettings2.Configuration.fromDictionary(source).dumpb()
+    print(f'{"json size":<24} {len(text) / 1024:>9.1f} KiB')
+    print(f'{"snapshot size":<24} {len(data) / 1024:>9.1f} KiB')
+    a = measure('addJson().build()', lambda: appsettings2.ConfigurationBuilder().addJson(json=text).build())
+    b = measure('loadb()', lambda: appsettings2.Configuration.loadb(data))
+    print(f'{"speedup":<24} {a / b:>9.1f} x')
+    measure('FrozenConfiguration.get', lambda: appsettings2.FrozenConfiguration(data).get('Tenants:tenant500:Limits:Limit7'), number=1000)
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# measures build cost of `EnvironmentConfigurationProvider` against a
+# synthetic 2000-variable environment, most of which are Kubernetes-style
+# service-link variables which are irrelevant to the application.
+#
+# run from the repository root:
+#
+#   python -m benchmarks.EnvironmentConfigurationProviderBenchmarks
+##
+
+import src as appsettings2
+import timeit
+
+class DatabaseSettings:
+    Host:str
+    Port:int
+
+class AppSettings:
+    Database:DatabaseSettings
+    MaxBatchSize:int
+
+def createEnvironment(count:int = 2000) -> dict[str, str]:
+    environ = {
+        'MYAPP__Database__Host': 'localhost',
+        'MYAPP__Database__Port': '5432',
+        'MYAPP__MaxBatchSize': '100'
+    }
+    i = 0
+    while len(environ) < count:
+        environ[f'SVC{i}_SERVICE_HOST'] = f'10.0.{i // 256}.{i % 256}'
+        environ[f'SVC{i}_SERVICE_PORT'] = '8080'
+        environ[f'SVC{i}_PORT_8080_TCP_ADDR'] = f'10.0.{i // 256}.{i % 256}'
+        environ[f'SVC{i}_PORT_8080_TCP_PORT'] = '8080'
+        i += 1
+    return environ
+
+def measure(name:str, environ:dict[str, str], number:int = 20, **kwargs) -> None:
+    def build():
+        return appsettings2.ConfigurationBuilder()\
+            .addProvider(appsettings2.providers.EnvironmentConfigurationProvider(environ=environ, **kwargs))\
+            .build()
+    configuration = build()
+    elapsed = timeit.timeit(build, number=number) / number
+    print(f'{name:<24} {elapsed * 1000:>9.3f} ms/build {len(configuration):>6} top-level keys')
+
+if __name__ == '__main__':
+    environ = createEnvironment()
+    print(f'environment: {len(environ)} variables')
+    measure('unfiltered', environ)
+    measure('include+strip', environ, include=['MYAPP__'], strip=True)
+    measure('exclude', environ, exclude=['SVC'])
+    measure('include+strip+schema', environ, include=['MYAPP__'], strip=True, schema=AppSettings)
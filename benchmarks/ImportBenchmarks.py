@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# measures the cost of `import appsettings2` in a fresh interpreter (as
+# reported by `python -X importtime`), alone and followed by the import
+# (and use) of each provider, and lists the notable dependencies each imports.
+#
+# run from the repository root:
+#
+#   python -m benchmarks.ImportBenchmarks
+##
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+DEPENDENCIES = ( 'yaml', 'tomllib', 'json', 'unicodedata', 'sqlite3', 'http.client', 'concurrent.futures', 'multiprocessing', 'logging', 'inspect' )
+
+SCENARIOS = {
+    'import appsettings2': 'import appsettings2',
+    '+ Environment': 'import appsettings2; appsettings2.ConfigurationBuilder().addEnvironment().build()',
+    '+ Json': 'import appsettings2; appsettings2.JsonConfigurationProvider',
+    '+ Toml': 'import appsettings2; appsettings2.ConfigurationBuilder().addToml(toml="a = 1").build()',
+    '+ Yaml': 'import appsettings2; appsettings2.ConfigurationBuilder().addYaml(yaml="a: 1").build()',
+    '+ Directory': 'import appsettings2; appsettings2.DirectoryConfigurationProvider',
+    '+ Http': 'import appsettings2; appsettings2.HttpConfigurationProvider',
+    '+ Sqlite': 'import appsettings2; appsettings2.SqliteConfigurationProvider'
+}
+
+def importtime(path:str, script:str) -> tuple[dict[str, int], str]:
+    """Runs `script` in a fresh interpreter, returning the cumulative time (in microseconds) of each top-level import, and stdout."""
+    result = subprocess.run([ sys.executable, '-X', 'importtime', '-c', script ], cwd=path, capture_output=True, text=True, check=True)
+    imports = {}
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        # NOTE: nested imports are indented beneath the import which caused them
+        if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith('  '):
+            imports[fields[2].strip()] = int(fields[1])
+    return (imports, result.stdout)
+
+def measure(path:str, code:str, number:int = 7) -> tuple[float, list[str]]:
+    # NOTE: imports performed by interpreter startup (`site`, `encodings`, etc) are excluded
+    startup = importtime(path, 'pass')[0]
+    script = f'import sys; _ = set(sys.modules); {code}; print(",".join(m for m in {DEPENDENCIES!r} if m in sys.modules and m not in _))'
+    samples = []
+    for _ in range(number):
+        imports, stdout = importtime(path, script)
+        samples.append(sum(v for k, v in imports.items() if k not in startup))
+    return (statistics.median(samples) / 1000, [m for m in stdout.strip().split(',') if m])
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as path:
+        # NOTE: the package is located in `src/`, and is made importable as `appsettings2` via a symlink
+        os.symlink(os.path.abspath('src'), os.path.join(path, 'appsettings2'))
+        for name, code in SCENARIOS.items():
+            elapsed, dependencies = measure(path, code)
+            print(f'{name:<24} {elapsed:>9.3f} ms  {" ".join(dependencies)}')
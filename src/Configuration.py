@@ -1,62 +1,288 @@
 # SPDX-FileCopyrightText: © 2024 Shaun Wilson
 # SPDX-License-Identifier: MIT
 
-import logging
+import array
+import copy
+from .ConfigurationAccessor import ConfigurationAccessor
 from .ConfigurationException import ConfigurationException
-import json
+from .ConfigurationList import ConfigurationList, ConfigurationTuple
+from .ConfigurationMetrics import BindMetrics, ConfigurationMetrics
+from .KeyPathFilter import KeyPathFilter
+from .SettingsSchema import SettingsSchema
+import fnmatch
+import functools
 import re
+import time
 import types
 import typing
-import unicodedata
+import weakref
 
 type any = typing.Any
 Configuration = typing.ForwardRef('Configuration')
 
+_MISSING = object()
+
+def _toArray(value:list) -> array.array|None:
+    """Converts a homogeneous `int` or `float` list to an `array.array`, otherwise returns None."""
+    if len(value) == 0:
+        return None
+    etype = type(value[0])
+    if etype is not int and etype is not float:
+        return None
+    for e in value:
+        if type(e) is not etype:
+            return None
+    try:
+        return array.array('q' if etype is int else 'd', value)
+    except OverflowError:
+        return None
+
+def _copyRaw(value:any) -> any:
+    """Copies the `dict` and `list` containers of a raw (as parsed) value."""
+    if isinstance(value, dict):
+        return { k: _copyRaw(v) for k, v in value.items() }
+    elif isinstance(value, list):
+        return [_copyRaw(e) for e in value]
+    return value
+
+@functools.lru_cache(maxsize=4096)
+def _parseKey(key:str) -> tuple[str, ...]:
+    return tuple(key.upper().replace(':', '__').split('__'))
+
+@functools.lru_cache(maxsize=256)
+def _parsePattern(pattern:str) -> tuple:
+    parts = []
+    for part in _parseKey(pattern):
+        if part == '*':
+            parts.append(None)
+        elif '*' in part or '?' in part or '[' in part:
+            parts.append(re.compile(fnmatch.translate(part)))
+        else:
+            parts.append(part)
+    return tuple(parts)
+
+def _unpickle(options:dict, data:dict) -> Configuration:
+    """Reconstructs a pickled :py:class:`~appsettings2.Configuration`, see :py:meth:`Configuration.__reduce__`."""
+    return Configuration(**options)._Configuration__populate(data, None)
+
 class Configuration:
     """
     The :py:class:`~appsettings2.Configuration` class is how applications access configuration data populated by :py:class:`~appsettings2.providers.ConfigurationProvider` objects. It exposes configuration data through dynamic object attributes as well as a dictionary-like interface.
     """
 
+    __accessors:dict[str, weakref.WeakSet]
+    __conversions:dict[tuple[str, type], tuple[any, any]]
+    __index:'ConfigurationIndex'
+    __interpolator:'ConfigurationInterpolator'
     __key_scrub_re:re.Pattern
+    __keyfilter:KeyPathFilter
     __keys:dict[str, str]
+    __metrics:ConfigurationMetrics
+    __name:str
     __normalize:bool
+    __numericArrays:bool
+    __observer:typing.Callable[[str], None]
+    __parent:Configuration
+    __readonlyLists:bool
 
-    def __init__(self, *, normalize:bool = False, scrubkeys:bool = False):
+    def __init__(self, *, normalize:bool = False, scrubkeys:bool = False, keyfilter:KeyPathFilter = None, readonlyLists:bool = False, numericArrays:bool = False, metrics:ConfigurationMetrics = None):
         """
         :param normalize: Option indicating whether or not attribute names should be normalized to upper-case on the resulting :py:class:`~appsettings2.Configuration` object, defaults to False.
         :param scrubkeys: Option indicating whether or not attribute names should be scrubbed to be compatible with the Python lexer, defaults to False.
+        :param keyfilter: Optional :py:class:`~appsettings2.KeyPathFilter` projecting which keys may be set, keys which are not selected are silently discarded by :py:meth:`set`, defaults to None.
+        :param readonlyLists: Option indicating whether or not `list` values are stored as compact, read-only :py:class:`~appsettings2.ConfigurationTuple` objects rather than :py:class:`~appsettings2.ConfigurationList` objects, defaults to False.
+        :param numericArrays: Option indicating whether or not `list` values consisting only of `int` (or only of `float`) elements are stored as compact `array.array` objects, defaults to False. See :py:meth:`bind` and :py:meth:`get` for binding arrays to `list[int]`, `list[float]`, `array.array`, and `memoryview` types.
+        :param metrics: Optional :py:class:`~appsettings2.ConfigurationMetrics` which records the duration of each :py:meth:`bind`, defaults to None. Metrics are not copied, pickled or serialized with the configuration.
         """
+        self.__accessors = None
+        self.__conversions = None
+        self.__index = None
+        self.__interpolator = None
+        self.__keyfilter = keyfilter
         self.__keys = {}
-        self.__logger = logging.getLogger('appsettings2')
+        self.__metrics = metrics
+        self.__name = None
         self.__normalize = normalize
+        self.__numericArrays = numericArrays
+        self.__observer = None
+        self.__parent = None
+        self.__readonlyLists = readonlyLists
         self.__key_scrub_re = None if not scrubkeys else re.compile(r'[^A-Za-z0-9_]', re.IGNORECASE | re.UNICODE)
 
+    def __assign(self, key:str, value:any) -> None:
+        """Assigns `value` to the (single part) `key` of this :py:class:`~appsettings2.Configuration`."""
+        k = self.__keys.get(key.upper())
+        if k is not None:
+            key = k
+        else:
+            self.__keys[key.upper()] = key
+        if isinstance(value, Configuration):
+            value.__parent = self
+            value.__name = key
+        setattr(self, self.__scrub_key(key), value)
+        self.__changed(key)
+
+    def __bind(self, target:object, key:str|None) -> any:
+        if key is None:
+            return self.__recursiveBind(target, self)
+        else:
+            source = self.get(key)
+            sourceType = type(source)
+            if isinstance(source, Configuration) or sourceType is dict:
+                return self.__recursiveBind(target, source)
+            else:
+                raise ConfigurationException(f'Bind of source type `{type(source)}` is not supported.')
+
+    def __changed(self, key:str) -> None:
+        """Notifies the root of the configuration tree, if it is being interpolated or has accessors, that `key` has been set or deleted."""
+        o = self
+        while o.__parent is not None:
+            o = o.__parent
+        # NOTE: most configurations have no index, interpolator or accessors, in which case the path of `key` is never built
+        if o.__index is None and o.__interpolator is None and o.__accessors is None:
+            return
+        p = self
+        while p.__parent is not None:
+            key = f'{p.__name}:{key}'
+            p = p.__parent
+        if o.__index is not None:
+            o.__index.invalidate(key)
+        if o.__interpolator is not None:
+            o.__interpolator.invalidate(key)
+        if o.__accessors is not None:
+            o.__refreshAccessors(key)
+
+    def __convert(self, value:any, hint:type) -> any:
+        if hint is bool or hint is int or hint is float or hint is str:
+            return SettingsSchema.convert(value, hint)
+        elif hint is dict or typing.get_origin(hint) is dict:
+            return value.toDictionary() if isinstance(value, Configuration) else value
+        elif hint is memoryview:
+            if isinstance(value, array.array | memoryview):
+                return memoryview(value).toreadonly()
+            # NOTE: lists which were not stored as arrays (see `numericArrays`) are converted, if homogeneous
+            v = _toArray(list(value.raw()) if isinstance(value, ConfigurationList | ConfigurationTuple) else value) if isinstance(value, list | tuple) else None
+            if v is None:
+                raise ConfigurationException(f'Conversion to type `{hint}` from `{type(value)}` is not supported.')
+            return memoryview(v).toreadonly()
+        elif hint is array.array:
+            if isinstance(value, array.array):
+                return array.array(value.typecode, value)
+            try:
+                return array.array('d', value)
+            except (TypeError, OverflowError) as ex:
+                raise ConfigurationException(f'Conversion to type `{hint}` from `{type(value)}` is not supported.') from ex
+        elif hint is list:
+            return list(value)
+        elif typing.get_origin(hint) is list:
+            elementType = typing.get_args(hint)[0]
+            if isinstance(value, array.array) and value.typecode == ('q' if elementType is int else 'd' if elementType is float else None):
+                return value.tolist()
+            return [self.__convert(e, elementType) for e in (value.raw() if isinstance(value, ConfigurationList | ConfigurationTuple) else value)]
+        elif isinstance(value, Configuration | dict):
+            try:
+                return self.__recursiveBind(hint(), value)
+            except (TypeError, ValueError) as ex:
+                raise ConfigurationException(f'Conversion to type `{hint}` failed: {ex}') from ex
+        elif isinstance(value, hint):
+            return value
+        raise ConfigurationException(f'Conversion to type `{hint}` from `{type(value)}` is not supported.')
+
+    def __copy__(self) -> Configuration:
+        # NOTE: the tree of Configuration nodes is copied (each node has a single parent), values are shared
+        names = {}
+        return self.__spawn(True).__populate(self.__snapshot(names), None, names)
+
+    def __deepcopy__(self, memo:dict) -> Configuration:
+        c = self.__spawn(True)
+        memo[id(self)] = c
+        names = {}
+        return c.__populate(self.__snapshot(names), lambda v: copy.deepcopy(v, memo), names)
+
     def __delitem__(self, key:str) -> None:
         key = key.upper()
         k = self.__keys.get(key)
         if k is not None:
-            delattr(self, k)
+            self.__releasing(k)
+            delattr(self, self.__scrub_key(k))
             self.__keys.pop(key)
+            self.__changed(k)
 
-    def __getitem__(self, key:str) -> any:
+    def __getIndex(self, prefix:str) -> tuple['ConfigurationIndex', str, int]:
+        """Gets the index of the configuration tree (creating it if necessary), `prefix` relative to the root of the tree, and the length of the path of this :py:class:`~appsettings2.Configuration` within the tree."""
+        from .ConfigurationIndex import ConfigurationIndex
+        o = self
+        path = None
+        while o.__parent is not None:
+            path = o.__name if path is None else f'{o.__name}:{path}'
+            o = o.__parent
+        if o.__index is None:
+            o.__index = ConfigurationIndex(o)
+        if path is None:
+            return (o.__index, prefix, 0)
+        return (o.__index, f'{path}:{prefix}' if prefix else path, len(path) + 1)
+
+    def __getitem__(self, key:str|tuple[str, type]) -> any:
         """
-        Gets the configuration data associated with the specified `key`.
+        Gets the configuration data associated with the specified `key`, optionally converted to a type, for example ``config['Database:Port', int]``.
 
-        :param key: The configuration key to get data for. Supports `__` and `:` hierarchical delimiters.
+        :param key: The configuration key to get data for, or a `(key, type)` tuple, see :py:meth:`get`. Supports `__` and `:` hierarchical delimiters.
         :return: The configuration data associated with `key`, otherwise raises `KeyError` if `key` was not found.
         """
-        parts = key.replace(':', '__').split('__')
-        o = self
-        for part in parts:
-            if o == self:
-                k = self.__keys.get(part.upper())
-                if k is None:
-                    raise KeyError()
-                else:
-                    o = getattr(o, self.__scrub_key(k))
+        if isinstance(key, tuple):
+            key, hint = key
+        else:
+            hint = None
+        value = self.get(key, _MISSING, hint)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __getMany(self, entries:list[tuple[int, tuple[str, ...]]], depth:int, results:list[any]) -> None:
+        groups = {}
+        for entry in entries:
+            group = groups.get(entry[1][depth])
+            if group is None:
+                groups[entry[1][depth]] = [entry]
             else:
-                o = o[part]
-        return o
+                group.append(entry)
+        for part, group in groups.items():
+            k = self.__keys.get(part)
+            if k is None:
+                continue
+            value = getattr(self, self.__scrub_key(k))
+            children = None
+            for entry in group:
+                if len(entry[1]) == depth + 1:
+                    results[entry[0]] = value
+                elif isinstance(value, Configuration):
+                    if children is None:
+                        children = []
+                    children.append(entry)
+            if children is not None:
+                value.__getMany(children, depth + 1, results)
+
+    def __getTyped(self, part:str, default:any, hint:type) -> any:
+        k = self.__keys.get(part.upper())
+        if k is None:
+            return default
+        value = getattr(self, self.__scrub_key(k))
+        if hint is None or value is None:
+            return value
+        elif isinstance(value, Configuration | list | array.array):
+            # NOTE: not cached, a subtree (or list) can be modified without replacing it
+            return self.__convert(value, hint)
+        ck = (part.upper(), hint)
+        if self.__conversions is None:
+            self.__conversions = {}
+        else:
+            cached = self.__conversions.get(ck)
+            if cached is not None and cached[0] is value:
+                return cached[1]
+        converted = self.__convert(value, hint)
+        # NOTE: keyed by the identity of the raw value, so any assignment to the key invalidates the converted value
+        self.__conversions[ck] = (value, converted)
+        return converted
 
     def __iter__(self):
         return iter(self.__keys.values())
@@ -64,6 +290,75 @@ class Configuration:
     def __len__(self) -> int:
         return len(self.__keys)
 
+    def __merge(self, source:Configuration) -> None:
+        for key in [k for k in self.__keys.values() if not source.has_key(k)]:
+            del self[key]
+        for key, value in source.items():
+            k = self.__keys.get(key.upper())
+            current = None if k is None else getattr(self, self.__scrub_key(k))
+            if isinstance(current, Configuration) and isinstance(value, Configuration):
+                current.__merge(value)
+            elif k is None or type(current) is not type(value) or current != value:
+                # NOTE: `source` was already projected, so values are assigned without consulting the key filter
+                self.__assign(key, value)
+
+    def __options(self, root:bool) -> dict:
+        options = {}
+        if self.__normalize:
+            options['normalize'] = True
+        if self.__key_scrub_re is not None:
+            options['scrubkeys'] = True
+        if self.__readonlyLists:
+            options['readonlyLists'] = True
+        if self.__numericArrays:
+            options['numericArrays'] = True
+        if root and self.__keyfilter is not None:
+            options['keyfilter'] = self.__keyfilter
+        return options
+
+    def __populate(self, source:dict, copier:typing.Callable[[any], any]|None, names:dict[str, str] = None) -> Configuration:
+        """Populates this (empty) :py:class:`~appsettings2.Configuration` from a dictionary produced by :py:meth:`__snapshot` (or an equivalent, such as :py:meth:`~appsettings2.FrozenConfiguration.toDictionary`) without re-parsing keys or values, `source` must have been produced by a Configuration with the same options."""
+        if names is None:
+            names = {}
+        keys = self.__keys
+        attributes = vars(self)
+        for key, value in source.items():
+            vtype = type(value)
+            if vtype is dict:
+                value = self.__spawn(False).__populate(value, copier, names)
+                value.__parent = self
+                value.__name = key
+            elif vtype is list:
+                numbers = _toArray(value) if self.__numericArrays else None
+                if numbers is not None:
+                    value = numbers
+                else:
+                    elements = value if copier is None else [copier(e) for e in value]
+                    factory = functools.partial(Configuration.fromDictionary, **self.__options(False))
+                    value = ConfigurationTuple(elements, factory) if self.__readonlyLists else ConfigurationList(elements, factory)
+            elif copier is not None:
+                value = copier(value)
+            keys[key.upper()] = key
+            # NOTE: keys repeat across the nodes of most trees, so attribute names are scrubbed once per distinct key
+            name = names.get(key)
+            if name is None:
+                name = names[key] = self.__scrub_key(key)
+            attributes[name] = value
+        return self
+
+    def __profileNodes(self, prefix:str|None, nodes:list[tuple[Configuration, dict[str, str]]]) -> None:
+        names = {}
+        attributes = vars(self)
+        for k in self.__keys.values():
+            name = self.__scrub_key(k)
+            key = k if prefix is None else f'{prefix}:{k}'
+            value = attributes[name]
+            if isinstance(value, Configuration):
+                value.__profileNodes(key, nodes)
+            else:
+                names[name] = key
+        nodes.append((self, names))
+
     def __recursiveBind(self, target:object, source:Configuration|dict) -> any:
         if target is None:
             return None
@@ -72,6 +367,12 @@ class Configuration:
         else:
             targetTypeHints = typing.get_type_hints(target)
         names = set(dir(target) | targetTypeHints.keys())
+        if isinstance(source, dict):
+            # NOTE: raw (unconverted) list elements, keys are matched case-insensitively as they would be by a Configuration
+            raw = { k.upper(): v for k, v in source.items() }
+            lookup = lambda aname: raw.get(aname.upper())
+        else:
+            lookup = source.get
         for aname in names:
             if aname.startswith('_'):
                 continue
@@ -79,7 +380,7 @@ class Configuration:
             if isinstance(lval, types.FunctionType) or isinstance(lval, types.MethodType):
                 continue
             ahint = targetTypeHints.get(aname)
-            rval = source.get(aname)
+            rval = lookup(aname)
             if ahint is None:
                 # attr has no type hints, attempt to treat as a property
                 prop = getattr(type(target), aname)
@@ -88,7 +389,8 @@ class Configuration:
                         lval = getattr(target, aname)
                     except AttributeError:
                         lval = None
-                        self.__logger.debug(f'Failed to bind {aname}', exc_info=True)
+                        import logging
+                        logging.getLogger('appsettings2').debug(f'Failed to bind {aname}', exc_info=True)
                 if (not hasattr(prop, 'fset')) or (getattr(prop, 'fset') is None):
                     # NOTE: lval is not settable
                     if lval is None or not issubclass(type(lval), list):
@@ -113,9 +415,12 @@ class Configuration:
             elif ahint is str:
                 v = str(rval)
                 setattr(target, aname, v)
-            elif isinstance(rval, Configuration):
+            elif ahint is memoryview or ahint is array.array:
+                # NOTE: a memoryview of an `array.array` value is a zero-copy, read-only view
+                setattr(target, aname, self.__convert(rval, ahint))
+            elif isinstance(rval, Configuration | dict):
                 if typing.get_origin(ahint) is dict:
-                    lval = rval.toDictionary()
+                    lval = rval.toDictionary() if isinstance(rval, Configuration) else _copyRaw(rval)
                     setattr(target, aname, lval)
                 else:
                     if lval is None:
@@ -127,7 +432,11 @@ class Configuration:
                 if lval is None:
                     lval = ahint()
                     setattr(target, aname, lval)
-                for e in rval:
+                if isinstance(rval, array.array) and rval.typecode == ('q' if elementType is int else 'd' if elementType is float else None):
+                    # NOTE: a single bulk conversion rather than converting element-by-element
+                    lval.extend(rval.tolist())
+                    continue
+                for e in (rval.raw() if isinstance(rval, ConfigurationList | ConfigurationTuple) else rval):
                     v = self.__recursiveBindType(elementType, e)
                     lval.append(v)
             else:
@@ -149,29 +458,127 @@ class Configuration:
         else:
             raise ConfigurationException(f'Recursive bind to type `{elementType}` from `{type(source)}` is not supported.')
 
+    def __reduce__(self) -> tuple:
+        # NOTE: the tree is pickled as nested plain data, and options are pickled once (rather than the attributes, loggers and compiled expressions of every node)
+        return (_unpickle, (self.__options(True), self.__snapshot()))
+
+    def __refreshAccessors(self, key:str) -> None:
+        k = ':'.join(KeyPathFilter.split(key))
+        prefix = k + ':'
+        for path, accessors in list(self.__accessors.items()):
+            if path == k or path.startswith(prefix) or k.startswith(path + ':'):
+                if len(accessors) == 0:
+                    self.__accessors.pop(path)
+                for accessor in list(accessors):
+                    accessor.refresh()
+
+    def __releasing(self, key:str|None) -> None:
+        """Notifies the interpolator of the configuration tree, if any, that `key` (or, if None, every key of this :py:class:`~appsettings2.Configuration`) is about to be deleted, which raises if other values refer to it."""
+        o = self
+        while o.__parent is not None:
+            o = o.__parent
+        if o.__interpolator is None:
+            return
+        p = self
+        while p.__parent is not None:
+            key = p.__name if key is None else f'{p.__name}:{key}'
+            p = p.__parent
+        o.__interpolator.release(key)
+
     def __scrub_key(self, key:str) -> str:
         """Scrubs a key for use as an attribute/identifier according to the Python lexer/standard."""
         key = key.replace(':', '__').replace('.', '_')
-        return key if None == self.__key_scrub_re else \
-            self.__key_scrub_re.sub(
-                self.__scrub_uc,
-                unicodedata.normalize(
-                    'NFKC',
-                    key))
+        if None == self.__key_scrub_re:
+            return key
+        # NOTE: imported only when scrubbing, so that the (unscrubbed) hot path of `set` does not execute an import
+        import unicodedata
+        return self.__key_scrub_re.sub(
+            self.__scrub_uc,
+            unicodedata.normalize(
+                'NFKC',
+                key))
 
     def __scrub_uc(self, m:re.Match) -> str:
+        import unicodedata
         match unicodedata.category(m[0]):
             case 'Lu' | 'Ll' | 'Lt' | 'Lm' | 'Lo' | 'Nl' | 'Mn' | 'Mc' | 'Nd' | 'Pc' :
                 return m[0]
             case _:
                 return '_'
 
+    def __select(self, pattern:tuple, depth:int, prefix:str, results:dict[str, any]) -> None:
+        p = pattern[depth]
+        if p is None:
+            candidates = self.__keys.values()
+        elif isinstance(p, str):
+            k = self.__keys.get(p)
+            candidates = () if k is None else (k,)
+        else:
+            candidates = [k for u, k in self.__keys.items() if p.match(u) is not None]
+        last = depth == len(pattern) - 1
+        for k in candidates:
+            value = getattr(self, self.__scrub_key(k))
+            key = k if prefix is None else f'{prefix}:{k}'
+            if last:
+                results[key] = value
+            elif isinstance(value, Configuration):
+                value.__select(pattern, depth + 1, key, results)
+
     def __setitem__(self, key:str, value:any) -> None:
         self.set(key, value)
 
+    def __snapshot(self, names:dict[str, str] = None) -> dict:
+        if names is None:
+            names = {}
+        attributes = vars(self)
+        result = {}
+        for k in self.__keys.values():
+            name = names.get(k)
+            if name is None:
+                name = names[k] = self.__scrub_key(k)
+            v = attributes[name]
+            vtype = type(v)
+            if vtype is Configuration or isinstance(v, Configuration):
+                v = v.__snapshot(names)
+            elif vtype is ConfigurationList or vtype is ConfigurationTuple:
+                v = [e.__snapshot(names) if isinstance(e, Configuration) else e for e in v.raw()]
+            result[k] = v
+        return result
+
+    def __spawn(self, root:bool) -> Configuration:
+        return Configuration(**self.__options(root))
+
     def __str__(self) -> str:
+        import json
         return json.dumps(self.toDictionary())
 
+    def accessor(self, key:str, type:type = None, default:any = None) -> ConfigurationAccessor:
+        """
+        Gets a :py:class:`~appsettings2.ConfigurationAccessor` handle for the specified `key`, for reading a value repeatedly (such as in a loop) without repeating the key lookup and type conversion.
+
+        The handle resolves `key` once and keeps its converted value in the :py:attr:`~appsettings2.ConfigurationAccessor.value` attribute, which is only refreshed when `key` (or a key above or beneath it) is set, deleted, or reloaded.
+
+        :param key: The configuration key to access. Supports `__` and `:` hierarchical delimiters.
+        :param type: Optional type the value is converted to, as by :py:meth:`get`, defaults to None which does not convert the value.
+        :param default: The value of the accessor while `key` does not exist, defaults to None.
+        :return: A :py:class:`~appsettings2.ConfigurationAccessor` for `key`.
+        """
+        o = self
+        while o.__parent is not None:
+            key = f'{o.__name}:{key}'
+            o = o.__parent
+        accessor = ConfigurationAccessor(o, key, type, default)
+        if o.__accessors is None:
+            o.__accessors = {}
+        k = ':'.join(KeyPathFilter.split(key))
+        accessors = o.__accessors.get(k)
+        if accessors is None:
+            # NOTE: accessors are weakly referenced, discarding a handle unregisters it
+            accessors = weakref.WeakSet()
+            o.__accessors[k] = accessors
+        accessors.add(accessor)
+        return accessor
+
     def bind(self, target:object, key:str|None = None) -> any:
         """
         Binds the configuration values into the target object.
@@ -183,63 +590,149 @@ class Configuration:
         """
         if not target:
             raise ConfigurationException('Missing required argument: target')
-        if key is None:
-            return self.__recursiveBind(target, self)
-        else:
-            source = self.get(key)
-            sourceType = type(source)
-            if sourceType is Configuration or sourceType is dict:
-                return self.__recursiveBind(target, source)
-            else:
-                raise ConfigurationException(f'Bind of source type `{type(source)}` is not supported.')
+        metrics = self.getMetrics()
+        if metrics is None:
+            return self.__bind(target, key)
+        start = time.perf_counter()
+        result = self.__bind(target, key)
+        elapsed = time.perf_counter() - start
+        targetType = type(target)
+        metrics.record(BindMetrics(f'{targetType.__module__}.{targetType.__qualname__}', key, elapsed))
+        return result
 
     def clear(self) -> None:
+        self.__releasing(None)
         while len(self.__keys) > 0:
             t = self.__keys.popitem()
-            delattr(self, t[1])
+            delattr(self, self.__scrub_key(t[1]))
+            self.__changed(t[1])
+
+    def countWithPrefix(self, prefix:str = None) -> int:
+        """
+        Counts the keys at or beneath `prefix`, see :py:meth:`keysWithPrefix`.
+
+        :param prefix: The key prefix. Supports `__` and `:` hierarchical delimiters.
+        :return: The number of keys at or beneath `prefix`.
+        """
+        index, prefix, _ = self.__getIndex(prefix)
+        return index.count(prefix)
+
+    def dumpb(self) -> bytes:
+        """
+        Serializes the configuration into a compact, versioned binary format, see :py:meth:`loadb`.
+
+        The format is that of :py:class:`~appsettings2.FrozenConfiguration`, so a serialized configuration can also be queried in-place (for example from an ``mmap`` of a file) without loading it.
+
+        :return: The serialized configuration.
+        """
+        from .FrozenConfiguration import FrozenConfiguration
+        return FrozenConfiguration.freeze(self, options=self.__options(False))
 
     @staticmethod
-    def fromDictionary(source:dict, *, normalize:bool = False, scrubkeys:bool = False) -> Configuration:
+    def fromDictionary(source:dict, *, normalize:bool = False, scrubkeys:bool = False, readonlyLists:bool = False, numericArrays:bool = False) -> Configuration:
         """
         Constructs a :py:class:`~appsettings2.Configuration` instance from the supplied dictionary `source`.
 
         :param source: The dictionary object to populate from.
         :param normalize: Option indicating whether or not attribute names should be normalized to upper-case on the resulting :py:class:`~appsettings2.Configuration` object, defaults to False.
         :param scrubkeys: Option indicating whether or not attribute names should be scrubbed to be compatible with the Python lexer, defaults to False.
+        :param readonlyLists: Option indicating whether or not `list` values are stored as read-only :py:class:`~appsettings2.ConfigurationTuple` objects, defaults to False.
+        :param numericArrays: Option indicating whether or not homogeneous numeric `list` values are stored as `array.array` objects, defaults to False.
         :return: A :py:class:`~appsettings2.Configuration` object derived from the `source` parameter.
         """
-        config:Configuration = Configuration(normalize=normalize, scrubkeys=scrubkeys)
+        config:Configuration = Configuration(normalize=normalize, scrubkeys=scrubkeys, readonlyLists=readonlyLists, numericArrays=numericArrays)
         for kvp in source.items():
             v = kvp[1]
             if issubclass(type(v), dict):
-                v = Configuration.fromDictionary(v, normalize=normalize, scrubkeys=scrubkeys)
+                v = Configuration.fromDictionary(v, normalize=normalize, scrubkeys=scrubkeys, readonlyLists=readonlyLists, numericArrays=numericArrays)
             config.set(kvp[0], v)
         return config
 
-    def get(self, key:str, default:any = None) -> any:
+    def get(self, key:str, default:any = None, type:type = None) -> any:
         """
-        Gets the configuration data associated with the specified `key`.
+        Gets the configuration data associated with the specified `key`, optionally converted to `type`.
+
+        Conversions follow the same rules as :py:meth:`bind`, with the addition of parsing `bool` from common literals (see :py:meth:`~appsettings2.SettingsSchema.convert`.) Converted scalar values are cached, so repeated reads of an unchanged key do not convert the value again.
 
         :param key: The configuration key to get data for. Supports `__` and `:` hierarchical delimiters.
         :param default: The value to be returned if `key` does not exist, defaults to None
-        :return: The configuration data associated with `key`, otherwise `default`.
+        :param type: Optional type to convert the value to, such as `int`, `bool`, `list[int]`, `dict`, or a settings class to bind, defaults to None which returns the value as-is.
+        :return: The configuration data associated with `key`, otherwise `default`. Raises `ConfigurationException` if the value cannot be converted.
         """
         parts = key.replace(':', '__').split('__')
         o = self
-        for part in parts:
-            if o == self:
-                k = self.__keys.get(part.upper())
-                if k is None:
-                    return default
-                else:
-                    o = getattr(o, self.__scrub_key(k))
-            else:
-                o = o.get(part, default)
-        return o
+        for i in range(len(parts) - 1):
+            k = o.__keys.get(parts[i].upper())
+            if k is None:
+                return default
+            o = getattr(o, o.__scrub_key(k))
+            if not isinstance(o, Configuration):
+                return default
+        return o.__getTyped(parts[-1], default, type)
+
+    def getKeyFilter(self) -> KeyPathFilter|None:
+        """
+        Gets the :py:class:`~appsettings2.KeyPathFilter` projecting which keys may be set, if any. Providers may consult it to avoid reading subtrees which would be discarded.
+
+        :return: The `keyfilter` the :py:class:`~appsettings2.Configuration` was constructed with (see :py:meth:`setKeyFilter`), otherwise None.
+        """
+        return self.__keyfilter
+
+    def getMetrics(self) -> ConfigurationMetrics|None:
+        """
+        Gets the :py:class:`~appsettings2.ConfigurationMetrics` recording the binds of this configuration, if any, see :py:class:`~appsettings2.ConfigurationBuilder`.
+
+        :return: The `metrics` the root :py:class:`~appsettings2.Configuration` was constructed with, otherwise None.
+        """
+        o = self
+        while o.__parent is not None:
+            o = o.__parent
+        return o.__metrics
+
+    def getMany(self, keys:list[str], default:any = None) -> tuple[any, ...]:
+        """
+        Gets the configuration data associated with each of the specified `keys`, in a single traversal of the configuration where keys sharing a common prefix are resolved together.
+
+        :param keys: The configuration keys to get data for. Supports `__` and `:` hierarchical delimiters.
+        :param default: The value returned for any key which does not exist, defaults to None.
+        :return: A tuple containing the configuration data associated with each key, in the same order as `keys`.
+        """
+        results = [default] * len(keys)
+        self.__getMany([(i, _parseKey(key)) for i, key in enumerate(keys)], 0, results)
+        return tuple(results)
+
+    def getOptions(self) -> dict[str, bool]:
+        """
+        Gets the options (`normalize`, `scrubkeys`, `readonlyLists`, and `numericArrays`) of this configuration, see :py:meth:`~appsettings2.FrozenConfiguration.getOptions`.
+
+        :return: A dictionary of the options which are set, suitable for passing to the :py:class:`~appsettings2.Configuration` constructor.
+        """
+        return self.__options(False)
 
     def has_key(self, key:str) -> bool:
         return self.__keys.get(key.upper()) is not None
 
+    def hasPrefix(self, prefix:str) -> bool:
+        """
+        Determines whether any key exists at or beneath `prefix`, see :py:meth:`keysWithPrefix`.
+
+        :param prefix: The key prefix. Supports `__` and `:` hierarchical delimiters.
+        :return: True if a key exists at or beneath `prefix`, otherwise False.
+        """
+        index, prefix, _ = self.__getIndex(prefix)
+        return index.count(prefix) > 0
+
+    def interpolate(self) -> None:
+        """
+        Resolves ``${Key}`` references within string values, for example ``"https://${Services:Api:Host}:${Services:Api:Port}"``. A value consisting of a single reference, such as ``"${Services:Api:Port}"``, resolves to the referenced value without converting it to a string. ``$${`` escapes a literal ``${``.
+
+        References are resolved once, in dependency order, and the results are stored in place of the original values. Afterwards, setting (or deleting) a key through this :py:class:`~appsettings2.Configuration` re-resolves only the values which depend on that key. Circular and unresolved references raise `ConfigurationException`.
+        """
+        from .ConfigurationInterpolator import ConfigurationInterpolator
+        if self.__interpolator is None:
+            self.__interpolator = ConfigurationInterpolator(self)
+        self.__interpolator.resolve()
+
     def items(self) -> list[tuple[str,any]]:
         it = []
         for k in self.keys():
@@ -250,11 +743,83 @@ class Configuration:
     def keys(self) -> list[str]:
         return self.__keys.values()
 
+    def keysWithPrefix(self, prefix:str = None) -> list[str]:
+        """
+        Gets the (`:` delimited) keys of all values at or beneath `prefix`, for example ``keysWithPrefix('Features:Beta')`` returns ``Features:Beta:Search`` but not ``Features:BetaSearch``.
+
+        The first call creates an index of all keys in the configuration tree, the index is then maintained as keys are set and deleted, so enumerating a prefix only visits the keys beneath it.
+
+        :param prefix: The key prefix. Supports `__` and `:` hierarchical delimiters, defaults to None which gets all keys.
+        :return: A list of keys, relative to this :py:class:`~appsettings2.Configuration`, ordered by their upper-cased parts.
+        """
+        index, prefix, offset = self.__getIndex(prefix)
+        keys = index.keys(prefix)
+        return keys if offset == 0 else [k[offset:] for k in keys]
+
+    @staticmethod
+    def loadb(data:bytes|bytearray|memoryview, *, verify:bool = True) -> Configuration:
+        """
+        Constructs a :py:class:`~appsettings2.Configuration` from data serialized by :py:meth:`dumpb`, with the options of the serialized configuration.
+
+        :param data: The serialized configuration, any object supporting the buffer protocol.
+        :param verify: Optional parameter indicating whether the checksum of `data` is verified, defaults to True.
+        :return: A :py:class:`~appsettings2.Configuration` object. Raises `ConfigurationException` if `data` is truncated or corrupt.
+        """
+        from .FrozenConfiguration import FrozenConfiguration
+        frozen = FrozenConfiguration(data, verify=verify)
+        options = frozen.getOptions()
+        return Configuration(**options).__populate(frozen.toDictionary(), None)
+
     def pop(self, key:str) -> any:
         value = self[key]
         del self[key]
         return value
 
+    def profile(self, profiler:'ConfigurationProfiler') -> 'ConfigurationProfiler':
+        """
+        Starts counting reads of the values of this configuration with `profiler`, see :py:class:`~appsettings2.ConfigurationProfiler`. Call :py:meth:`~appsettings2.ConfigurationProfiler.detach` to stop.
+
+        Only the values this configuration has when profiling starts are counted, :py:meth:`~appsettings2.ConfigurationBuilder.reload` (of a builder constructed with a `profiler`) profiles the reloaded values.
+
+        :param profiler: The :py:class:`~appsettings2.ConfigurationProfiler` to count reads with.
+        :return: The `profiler`, for method chaining.
+        """
+        if self.__parent is not None:
+            raise ConfigurationException('Only the root of a configuration can be profiled.')
+        nodes = []
+        self.__profileNodes(None, nodes)
+        profiler.attach(nodes)
+        return profiler
+
+    def reload(self, source:Configuration) -> None:
+        """
+        Replaces the configuration data of this :py:class:`~appsettings2.Configuration` with the configuration data of `source`, in-place.
+
+        Existing child :py:class:`~appsettings2.Configuration` objects are updated rather than replaced, keys which do not exist in `source` are deleted, and only keys whose values differ are set, so only the accessors of changed keys are refreshed. If `source` was interpolated, subsequent changes continue to re-resolve its references. See also :py:meth:`~appsettings2.ConfigurationBuilder.reload`.
+
+        :param source: The :py:class:`~appsettings2.Configuration` to reload from, `source` should not be used afterward.
+        """
+        self.__interpolator = None
+        self.__merge(source)
+        if source.__interpolator is not None:
+            self.__interpolator = source.__interpolator
+            source.__interpolator = None
+            self.__interpolator.attach(self)
+
+    def select(self, *patterns:str) -> dict[str, any]:
+        """
+        Gets the configuration data of every key matching the specified patterns, such as ``'Services:*:Url'``.
+
+        Each part of a pattern may contain `fnmatch`-style wildcards and only matches keys at that depth; parts without wildcards are looked up directly rather than matched against every key.
+
+        :param patterns: One or more key patterns. Supports `__` and `:` hierarchical delimiters.
+        :return: A dictionary mapping the (`:` delimited) key of each match to its configuration data.
+        """
+        results = {}
+        for pattern in patterns:
+            self.__select(_parsePattern(pattern), 0, None, results)
+        return results
+
     def set(self, key:str, value:any) -> None:
         """
         Sets the configuration data for the specified `key`.
@@ -262,6 +827,18 @@ class Configuration:
         :param key: The key to associate the configuration data.
         :param value: The configuration data so be associated with `key`.
         """
+        if self.__observer is not None:
+            self.__observer(key)
+        if self.__keyfilter is not None:
+            kparts = KeyPathFilter.split(key)
+            if not self.__keyfilter.isSelected(kparts):
+                if not (isinstance(value, dict) and self.__keyfilter.canDescend(kparts)):
+                    return
+                value = self.__keyfilter.prune(value, kparts)
+                if len(value) == 0:
+                    return
+            elif isinstance(value, dict):
+                value = self.__keyfilter.prune(value, kparts)
         if self.__normalize:
             key = key.upper()
         parts = key.replace(':', '__').split('__')
@@ -270,40 +847,54 @@ class Configuration:
             if o == self:
                 k = self.__keys.get(parts[i].upper())
                 if k is None:
-                    c = Configuration(normalize=self.__normalize, scrubkeys=(None != self.__key_scrub_re))
+                    c = Configuration(normalize=self.__normalize, scrubkeys=(None != self.__key_scrub_re), readonlyLists=self.__readonlyLists, numericArrays=self.__numericArrays)
+                    c.__parent = self
+                    c.__name = parts[i]
                     setattr(o, self.__scrub_key(parts[i]), c)
                     self.__keys[parts[i].upper()] = parts[i]
+                    self.__changed(parts[i])
                     o = c
                 else:
                     o = getattr(self, self.__scrub_key(k))
             else:
                 if not o.has_key(parts[i]):
-                    c = Configuration(normalize=self.__normalize, scrubkeys=(None != self.__key_scrub_re))
+                    c = Configuration(normalize=self.__normalize, scrubkeys=(None != self.__key_scrub_re), readonlyLists=self.__readonlyLists, numericArrays=self.__numericArrays)
                     o.set(parts[i], c)
                     o = c
                 else:
                     o = o.get(parts[i])
+        key = parts[-1]
+        if o != self:
+            o.set(key, value)
+            return
         vtype = type(value)
         if issubclass(vtype, dict):
-            value = Configuration.fromDictionary(value, normalize=self.__normalize, scrubkeys=self.__key_scrub_re is not None)
-        elif issubclass(vtype, list):
-            l = []
-            for e in value:
-                if issubclass(type(e), dict):
-                    l.append(Configuration.fromDictionary(e, normalize=self.__normalize, scrubkeys=self.__key_scrub_re is not None))
-                else:
-                    l.append(e)
-            value = l
-        key = parts[-1]
-        if o == self:
-            k = self.__keys.get(key.upper())
-            if k is not None:
-                setattr(self, self.__scrub_key(k), value)
+            value = Configuration.fromDictionary(value, normalize=self.__normalize, scrubkeys=self.__key_scrub_re is not None, readonlyLists=self.__readonlyLists, numericArrays=self.__numericArrays)
+        elif issubclass(vtype, list) or vtype is ConfigurationTuple:
+            numbers = _toArray(value) if self.__numericArrays else None
+            if numbers is not None:
+                value = numbers
             else:
-                self.__keys[key.upper()] = key
-                setattr(self, self.__scrub_key(key), value)
-        else:
-            o.set(key, value)
+                # NOTE: `dict` elements are converted to Configuration objects lazily, as they are accessed
+                factory = functools.partial(Configuration.fromDictionary, normalize=self.__normalize, scrubkeys=self.__key_scrub_re is not None, readonlyLists=self.__readonlyLists, numericArrays=self.__numericArrays)
+                value = ConfigurationTuple(value, factory) if self.__readonlyLists else ConfigurationList(value, factory)
+        self.__assign(key, value)
+
+    def setKeyFilter(self, keyfilter:KeyPathFilter|None) -> None:
+        """
+        Sets the :py:class:`~appsettings2.KeyPathFilter` projecting which keys may be set, see the `keyfilter` parameter of the constructor. Called by :py:class:`~appsettings2.ConfigurationBuilder`, which removes its selection once providers have populated the configuration.
+
+        :param keyfilter: The :py:class:`~appsettings2.KeyPathFilter`, or None to accept every key.
+        """
+        self.__keyfilter = keyfilter
+
+    def setObserver(self, observer:typing.Callable[[str], None]|None) -> None:
+        """
+        Sets a callable invoked with the key of each :py:meth:`set` (or indexer assignment) of this :py:class:`~appsettings2.Configuration`, sets of child configurations are not observed. Called by :py:class:`~appsettings2.ConfigurationBuilder` to count the values set by each provider, see :py:class:`~appsettings2.ConfigurationMetrics`.
+
+        :param observer: The callable to invoke, or None to stop observing.
+        """
+        self.__observer = observer
 
     def toDictionary(self) -> dict:
         """
@@ -316,6 +907,11 @@ class Configuration:
             v = getattr(self, self.__scrub_key(k))
             if isinstance(v, Configuration):
                 result[k] = v.toDictionary()
+            elif isinstance(v, array.array):
+                result[k] = v.tolist()
+            elif isinstance(v, ConfigurationList | ConfigurationTuple):
+                # NOTE: elements which have not been accessed are copied without being converted to Configuration objects
+                result[k] = [e.toDictionary() if isinstance(e, Configuration) else _copyRaw(e) for e in v.raw()]
             elif issubclass(type(v), list):
                 tmp = []
                 for e in v:
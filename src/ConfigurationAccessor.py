@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .ConfigurationException import ConfigurationException
+import typing
+
+type any = typing.Any
+Configuration = typing.ForwardRef('Configuration')
+
+class ConfigurationAccessor:
+    """
+    A handle to the (optionally typed) value of a single configuration key, see :py:meth:`~appsettings2.Configuration.accessor`.
+
+    The value is resolved and converted once, then kept in the :py:attr:`value` attribute. The handle is refreshed only when its key (or a key above or beneath it) is set or deleted, including when the :py:class:`~appsettings2.Configuration` is reloaded, so reading :py:attr:`value` costs the same as reading any other attribute.
+    """
+
+    value:any
+    """The current value of the key, converted to the accessor type, otherwise the accessor default if the key does not exist."""
+
+    __configuration:Configuration
+    __default:any
+    __key:str
+    __type:type
+
+    def __init__(self, configuration:Configuration, key:str, hint:type, default:any):
+        self.__configuration = configuration
+        self.__default = default
+        self.__key = key
+        self.__type = hint
+        self.value = self.__resolve()
+
+    def __call__(self) -> any:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f'ConfigurationAccessor({self.__key!r}, value={self.value!r})'
+
+    @property
+    def key(self) -> str:
+        """The configuration key the accessor reads."""
+        return self.__key
+
+    def __resolve(self) -> any:
+        v = self.__configuration.get(self.__key, None, self.__type)
+        return self.__default if v is None else v
+
+    def refresh(self) -> None:
+        """
+        Re-reads and converts the value of the key. Called automatically when the key changes.
+
+        If the new value cannot be converted to the accessor type the previous value is kept, and a warning is logged, so that a bad value cannot abort the :py:meth:`~appsettings2.Configuration.set` (or :py:meth:`~appsettings2.Configuration.reload`) which changed it.
+        """
+        try:
+            self.value = self.__resolve()
+        except (ConfigurationException, TypeError, ValueError):
+            # NOTE: conversions raise `ConfigurationException`, but the constructors of settings classes may raise anything
+            import logging
+            logging.getLogger('appsettings2').warning(f'Failed to refresh accessor `{self.__key}`, keeping its previous value.', exc_info=True)
@@ -3,28 +3,124 @@
 
 from .Configuration import Configuration
 from .ConfigurationException import ConfigurationException
-from .providers import *
+from .ConfigurationMetrics import BuildMetrics, ConfigurationMetrics, ProviderMetrics
+from .ConfigurationProfiler import ConfigurationProfiler
+from .KeyPathFilter import KeyPathFilter
+from .SettingsSchema import SettingsSchema
+from . import providers
+from .providers import ConfigurationProvider
+import time
 import typing
 
 type FileDescriptor = int
 type any = typing.Any
 
+class _ConfigurationCounter:
+    """Observes the `set` calls made by a provider, see :py:meth:`~appsettings2.Configuration.setObserver`, counting them for :py:class:`~appsettings2.ConfigurationMetrics` and optionally recording the provider as the layer which set each key for :py:class:`~appsettings2.ConfigurationProfiler`."""
+
+    __layer:str
+    __layers:dict[str, str]|None
+    count:int
+
+    def __init__(self, layer:str, layers:dict[str, str]|None):
+        self.__layer = layer
+        self.__layers = layers
+        self.count = 0
+
+    def __call__(self, key:str) -> None:
+        self.count += 1
+        if self.__layers is not None:
+            # NOTE: re-inserted, so that layers are ordered from least to most recently set
+            self.__layers.pop(key, None)
+            self.__layers[key] = self.__layer
+
 class ConfigurationBuilder:
     """
     Builds a :py:class:`~appsettings2.Configuration` object from one or more :py:class:`~appsettings2.providers.ConfigurationProvider` instances.
     """
 
+    __interpolate:bool
+    __keyfilter:KeyPathFilter
+    __metrics:ConfigurationMetrics
+    __measured:dict[int, tuple[int, float, float]]
     __normalize:bool
+    __numericArrays:bool
+    __profiler:ConfigurationProfiler
+    __readonlyLists:bool
     __providers:list[ConfigurationProvider]
+    __selection:list[str]
 
-    def __init__(self, *, normalize:bool = False, scrubkeys:bool = False):
+    def __init__(self, *, normalize:bool = False, scrubkeys:bool = False, interpolate:bool = False, readonlyLists:bool = False, numericArrays:bool = False, metrics:ConfigurationMetrics = None, profiler:ConfigurationProfiler = None):
         """
         :param normalize: Option indicating whether or not attribute names should be normalized to upper-case on the resulting :py:class:`~appsettings2.Configuration` object, defaults to False.
         :param scrubkeys: Option indicating whether or not attribute names should be scrubbed to be compatible with the Python lexer, defaults to False.
+        :param interpolate: Option indicating whether or not ``${Key}`` references are resolved once all providers have populated the :py:class:`~appsettings2.Configuration`, see :py:meth:`~appsettings2.Configuration.interpolate`, defaults to False.
+        :param readonlyLists: Option indicating whether or not `list` values are stored as compact, read-only :py:class:`~appsettings2.ConfigurationTuple` objects, defaults to False.
+        :param numericArrays: Option indicating whether or not `list` values consisting only of `int` (or only of `float`) elements are stored as compact `array.array` objects, defaults to False.
+        :param metrics: Optional :py:class:`~appsettings2.ConfigurationMetrics` which records a :py:class:`~appsettings2.BuildMetrics` for each build, and the binds of each built :py:class:`~appsettings2.Configuration`, defaults to None which does not instrument builds.
+        :param profiler: Optional :py:class:`~appsettings2.ConfigurationProfiler` which counts reads of the values of each built (or reloaded) :py:class:`~appsettings2.Configuration`, and of the values set by each provider, defaults to None which does not profile.
         """
+        self.__interpolate = interpolate
         self.__normalize = normalize
+        self.__numericArrays = numericArrays
+        self.__profiler = profiler
+        self.__readonlyLists = readonlyLists
         self.__scrubkeys = scrubkeys
+        self.__keyfilter = None
+        self.__measured = {}
+        self.__metrics = metrics
         self.__providers = []
+        self.__selection = None
+
+    def __build(self) -> Configuration:
+        if self.__keyfilter is None and self.__selection is not None:
+            # NOTE: the filter is reused across builds so providers can recognize (and cache against) it
+            self.__keyfilter = KeyPathFilter(self.__selection)
+        configuration = Configuration(normalize=self.__normalize, scrubkeys=self.__scrubkeys, keyfilter=self.__keyfilter, readonlyLists=self.__readonlyLists, numericArrays=self.__numericArrays, metrics=self.__metrics)
+        if self.__metrics is not None or self.__profiler is not None:
+            return self.__measure(configuration)
+        for provider in self.__providers:
+            provider.populateConfiguration(configuration)
+        # NOTE: the selection projects what providers populate, the built configuration accepts any key
+        configuration.setKeyFilter(None)
+        if self.__interpolate:
+            configuration.interpolate()
+        return configuration
+
+    def __measure(self, configuration:Configuration) -> Configuration:
+        """Populates (and interpolates) `configuration` as :py:meth:`build` does, recording a :py:class:`~appsettings2.BuildMetrics` and the layer which set each key."""
+        start = time.perf_counter()
+        results = []
+        layers = None if self.__profiler is None else {}
+        for provider in self.__providers:
+            metrics = provider.getMetrics()
+            # NOTE: reading and parsing are reported since the previous build, which for the first build includes any performed by the provider's constructor
+            bytesRead, readTime, parseTime = self.__measured.get(id(provider), (0, 0.0, 0.0))
+            readStart, parseStart = metrics.readTime, metrics.parseTime
+            counter = _ConfigurationCounter(metrics.getDescription(), layers)
+            # NOTE: providers populate the configuration itself, observed only for the duration of their population
+            configuration.setObserver(counter)
+            t0 = time.perf_counter()
+            try:
+                provider.populateConfiguration(configuration)
+            finally:
+                configuration.setObserver(None)
+            elapsed = time.perf_counter() - t0
+            # NOTE: merging is whatever the provider did while populating which it did not report as reading or parsing
+            mergeTime = max(0.0, elapsed - (metrics.readTime - readStart) - (metrics.parseTime - parseStart))
+            results.append(ProviderMetrics(metrics.name, metrics.source, bytesRead=metrics.bytesRead - bytesRead, readTime=metrics.readTime - readTime, parseTime=metrics.parseTime - parseTime, mergeTime=mergeTime, keys=counter.count))
+            self.__measured[id(provider)] = (metrics.bytesRead, metrics.readTime, metrics.parseTime)
+        configuration.setKeyFilter(None)
+        interpolateTime = 0.0
+        if self.__interpolate:
+            t0 = time.perf_counter()
+            configuration.interpolate()
+            interpolateTime = time.perf_counter() - t0
+        if self.__metrics is not None:
+            self.__metrics.record(BuildMetrics(results, interpolateTime, time.perf_counter() - start))
+        if self.__profiler is not None:
+            self.__profiler.setLayers(layers)
+        return configuration
 
     def addProvider(self, provider:ConfigurationProvider) -> 'ConfigurationBuilder':
         """
@@ -39,22 +135,69 @@ class ConfigurationBuilder:
         self.__providers.append(provider)
         return self
     
-    def addCommandLine(self, argv=None) -> 'ConfigurationBuilder':
+    def addCommandLine(self, argv=None, *, schema:type|dict[str, type]|SettingsSchema = None) -> 'ConfigurationBuilder':
         """
         Adds a :py:class:`~appsettings2.providers.CommandLineConfigurationProvider`, optionally overriding ``argv``.
 
         :param argv: Optional override of ``sys.argv``, defaults to None.
+        :param schema: Optional settings class, dictionary mapping keys to types, or :py:class:`~appsettings2.SettingsSchema` used to convert values, defaults to None.
+        :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
+        """
+        return self.addProvider(providers.CommandLineConfigurationProvider(argv=argv, schema=schema))
+
+    def addDirectory(self, path:str, pattern:str = '*.{json,yaml,yml,toml}', *, required:bool = True) -> 'ConfigurationBuilder':
+        """
+        Adds a :py:class:`~appsettings2.providers.DirectoryConfigurationProvider`.
+
+        :param path: Path to a directory containing configuration files.
+        :param pattern: Optional `fnmatch`-style file name pattern, supports brace expansion such as ``*.{json,toml}``, defaults to ``*.{json,yaml,yml,toml}``.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified directory is missing, defaults to True.
         :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
         """
-        return self.addProvider(CommandLineConfigurationProvider(argv=argv))
+        return self.addProvider(providers.DirectoryConfigurationProvider(path, pattern=pattern, required=required))
 
-    def addEnvironment(self) -> 'ConfigurationBuilder':
+    def addDotEnv(self, filepath:str = None, *, dotenv:str = None, fd:FileDescriptor = None, required:bool = True, expand:bool = True) -> 'ConfigurationBuilder':
+        """
+        Adds a :py:class:`~appsettings2.providers.DotEnvConfigurationProvider`.
+        The `filepath`, `dotenv`, and `fd` parameters are mutually exclusive.
+
+        :param filepath: Optional path to a .env file used as a configuration source, defaults to None.
+        :param dotenv: Optional .env formatted string used as a configuration source, defaults to None.
+        :param fd: Optional file descriptor (int) to be used as a configuration source, defaults to None.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified configuration source is missing, defaults to True.
+        :param expand: Option indicating whether or not ``${VAR}`` references are expanded, defaults to True.
+        :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
+        """
+        return self.addProvider(providers.DotEnvConfigurationProvider(filepath=filepath, dotenv=dotenv, fd=fd, required=required, expand=expand))
+
+    def addEnvironment(self, *, include:list[str] = None, exclude:list[str] = None, strip:bool = False, schema:type|dict[str, type]|SettingsSchema = None) -> 'ConfigurationBuilder':
         """
         Adds a :py:class:`~appsettings2.providers.EnvironmentConfigurationProvider`.
 
+        :param include: Optional list of (case-insensitive) name prefixes, only variables starting with one of these prefixes are loaded, defaults to None which loads all variables.
+        :param exclude: Optional list of (case-insensitive) name prefixes, variables starting with one of these prefixes are not loaded, defaults to None.
+        :param strip: Option indicating whether or not the matching `include` prefix is removed from the variable name to form the configuration key, defaults to False.
+        :param schema: Optional settings class (or :py:class:`~appsettings2.SettingsSchema`), only variables which would be bound to the settings class are loaded, defaults to None.
         :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
         """
-        return self.addProvider(EnvironmentConfigurationProvider())
+        return self.addProvider(providers.EnvironmentConfigurationProvider(include=include, exclude=exclude, strip=strip, schema=schema))
+
+    def addHttp(self, url:str, *, keys:list[str] = None, batchSize:int = 50, headers:dict[str, str] = None, timeout:float = 10.0, retries:int = 3, backoff:float = 0.5, poolSize:int = 4, required:bool = True) -> 'ConfigurationBuilder':
+        """
+        Adds an :py:class:`~appsettings2.providers.HttpConfigurationProvider`.
+
+        :param url: The ``http`` or ``https`` url of the key-value service.
+        :param keys: Optional list of keys to request, defaults to None which requests the whole document at `url`.
+        :param batchSize: Optional maximum number of keys per request, 1 requests each key individually, defaults to 50.
+        :param headers: Optional headers sent with every request (for example, ``Authorization``), defaults to None.
+        :param timeout: Optional connect and read timeout in seconds, defaults to 10.0.
+        :param retries: Optional number of times a failed request is retried, defaults to 3.
+        :param backoff: Optional delay in seconds before the first retry, doubled for each subsequent retry, defaults to 0.5.
+        :param poolSize: Optional maximum number of pooled (and concurrent) connections, defaults to 4.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the service cannot be reached, defaults to True.
+        :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
+        """
+        return self.addProvider(providers.HttpConfigurationProvider(url, keys=keys, batchSize=batchSize, headers=headers, timeout=timeout, retries=retries, backoff=backoff, poolSize=poolSize, required=required))
 
     def addJson(self, filepath:str = None, *, json:str = None, fd:FileDescriptor = None, required:bool = True) -> 'ConfigurationBuilder':
         """
@@ -67,7 +210,49 @@ class ConfigurationBuilder:
         :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified configuration source is missing, defaults to True.
         :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
         """
-        return self.addProvider(JsonConfigurationProvider(filepath=filepath, json=json, fd=fd, required=required))
+        return self.addProvider(providers.JsonConfigurationProvider(filepath=filepath, json=json, fd=fd, required=required))
+
+    def addJsonStream(self, filepath:str = None, *, json:str = None, fd:FileDescriptor = None, stream:typing.TextIO = None, required:bool = True, include:list[str] = None, exclude:list[str] = None) -> 'ConfigurationBuilder':
+        """
+        Adds a :py:class:`~appsettings2.providers.JsonStreamConfigurationProvider`.
+        The `filepath`, `json`, `fd`, and `stream` parameters are mutually exclusive.
+
+        :param filepath: Optional path to a JSON file used as a configuration source, defaults to None.
+        :param json: Optional JSON string used as a configuration source, defaults to None.
+        :param fd: Optional file descriptor (int) to be used as a configuration source, defaults to None.
+        :param stream: Optional text file object to be used as a configuration source, defaults to None.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified configuration source is missing, defaults to True.
+        :param include: Optional list of key patterns to be loaded, defaults to None which loads all keys.
+        :param exclude: Optional list of key patterns to be skipped, defaults to None.
+        :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
+        """
+        return self.addProvider(providers.JsonStreamConfigurationProvider(filepath=filepath, json=json, fd=fd, stream=stream, required=required, include=include, exclude=exclude))
+
+    def addKeyPerFile(self, path:str, *, prefix:str = None, required:bool = True) -> 'ConfigurationBuilder':
+        """
+        Adds a :py:class:`~appsettings2.providers.KeyPerFileConfigurationProvider`.
+
+        :param path: Path to a directory containing one file per key.
+        :param prefix: Optional key prefix applied to every key, defaults to None.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified directory is missing, defaults to True.
+        :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
+        """
+        return self.addProvider(providers.KeyPerFileConfigurationProvider(path, prefix=prefix, required=required))
+
+    def addSqlite(self, filepath:str, *, table:str = 'Configuration', keyColumn:str = 'key', valueColumn:str = 'value', versionColumn:str = None, prefix:str = None, required:bool = True) -> 'ConfigurationBuilder':
+        """
+        Adds a :py:class:`~appsettings2.providers.SqliteConfigurationProvider`.
+
+        :param filepath: Path to a SQLite database file.
+        :param table: Optional name of the table to read, defaults to 'Configuration'.
+        :param keyColumn: Optional name of the key column, defaults to 'key'.
+        :param valueColumn: Optional name of the value column, defaults to 'value'.
+        :param versionColumn: Optional name of a monotonically increasing version column (or ``rowid``) enabling incremental re-reads, defaults to None.
+        :param prefix: Optional key prefix, only keys starting with `prefix` (case-sensitive) are read, defaults to None.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified database file is missing, defaults to True.
+        :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
+        """
+        return self.addProvider(providers.SqliteConfigurationProvider(filepath, table=table, keyColumn=keyColumn, valueColumn=valueColumn, versionColumn=versionColumn, prefix=prefix, required=required))
 
     def addToml(self, filepath:str = None, *, toml:str = None, fd:FileDescriptor = None, required:bool = True) -> 'ConfigurationBuilder':
         """
@@ -80,9 +265,9 @@ class ConfigurationBuilder:
         :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified configuration source is missing, defaults to True.
         :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
         """
-        return self.addProvider(TomlConfigurationProvider(filepath=filepath, toml=toml, fd=fd, required=required))
+        return self.addProvider(providers.TomlConfigurationProvider(filepath=filepath, toml=toml, fd=fd, required=required))
 
-    def addYaml(self, filepath:str = None, *, yaml:str = None, fd:FileDescriptor = None, required:bool = True) -> 'ConfigurationBuilder':
+    def addYaml(self, filepath:str = None, *, yaml:str = None, fd:FileDescriptor = None, required:bool = True, documents:list[int] = None, selector:dict[str, any] = None) -> 'ConfigurationBuilder':
         """
         Adds a :py:class:`~appsettings2.providers.YamlConfigurationProvider`.
         The `filepath`, `yaml`, and `fd` parameters are mutually exclusive.
@@ -91,9 +276,11 @@ class ConfigurationBuilder:
         :param yaml: Optional YAML string used as a configuration source, defaults to None.
         :param fd: Optional file descriptor (int) to be used as a configuration source, defaults to None.
         :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified configuration source is missing, defaults to True.
+        :param documents: Optional list of zero-based document indexes to be loaded from a multi-document YAML stream, defaults to None which loads all documents.
+        :param selector: Optional dictionary of configuration keys and values, only documents which contain all of the specified key-value pairs are loaded, defaults to None which loads all documents.
         :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
         """
-        return self.addProvider(YamlConfigurationProvider(filepath=filepath, yaml=yaml, fd=fd, required=required))
+        return self.addProvider(providers.YamlConfigurationProvider(filepath=filepath, yaml=yaml, fd=fd, required=required, documents=documents, selector=selector))
 
     def build(self) -> Configuration:
         """
@@ -101,7 +288,43 @@ class ConfigurationBuilder:
 
         :return: A `Configuration` object, populated with configuration data.
         """
-        configuration = Configuration(normalize=self.__normalize, scrubkeys=self.__scrubkeys)
-        for provider in self.__providers:
-            provider.populateConfiguration(configuration)
+        configuration = self.__build()
+        if self.__profiler is not None:
+            configuration.profile(self.__profiler)
+        return configuration
+
+    def reload(self, configuration:Configuration) -> Configuration:
+        """
+        Builds a new `Configuration` object using the providers which have been added to the builder, then reloads the existing `configuration` from it in-place, see :py:meth:`~appsettings2.Configuration.reload`.
+
+        References to `configuration` (and any :py:class:`~appsettings2.ConfigurationAccessor` handles created from it) remain valid and observe the reloaded configuration data. Note that only providers which read their source when populating (such as :py:class:`~appsettings2.providers.DirectoryConfigurationProvider`, :py:class:`~appsettings2.providers.HttpConfigurationProvider`, :py:class:`~appsettings2.providers.KeyPerFileConfigurationProvider`, and :py:class:`~appsettings2.providers.SqliteConfigurationProvider`) observe changes to their source.
+
+        :param configuration: A `Configuration` object previously built by this builder.
+        :return: The original `configuration` object, modified in-place.
+        """
+        if self.__profiler is None:
+            configuration.reload(self.__build())
+            return configuration
+        # NOTE: the values read while reloading are not counted, and the reloaded values are profiled
+        self.__profiler.detach()
+        configuration.reload(self.__build())
+        configuration.profile(self.__profiler)
         return configuration
+
+    def select(self, *patterns:str) -> 'ConfigurationBuilder':
+        """
+        Projects the configuration onto the specified key patterns, such as ``'Database'`` or ``'Cache:*'``.
+        Can be called multiple times to select additional patterns.
+
+        Keys which are not selected are discarded while providers populate the :py:class:`~appsettings2.Configuration`, so unselected subtrees never become :py:class:`~appsettings2.Configuration` objects. The selection only applies while building (and reloading), keys set on the built configuration are not filtered. See :py:class:`~appsettings2.KeyPathFilter` for pattern syntax.
+
+        :param patterns: One or more key patterns to be selected.
+        :return: Returns :py:class:`~appsettings2.ConfigurationBuilder` for method chaining.
+        """
+        if len(patterns) == 0:
+            raise ConfigurationException('Missing required argument: patterns')
+        if self.__selection is None:
+            self.__selection = []
+        self.__selection.extend(patterns)
+        self.__keyfilter = None
+        return self
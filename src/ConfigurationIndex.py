@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .Configuration import Configuration
+from .KeyPathFilter import KeyPathFilter
+import typing
+
+type any = typing.Any
+
+_MISSING = object()
+
+class _TrieNode:
+
+    __slots__ = ('children', 'count', 'key')
+
+    children:dict[str, '_TrieNode']
+    count:int
+    key:str
+
+    def __init__(self):
+        self.children = {}
+        self.count = 0
+        self.key = None
+
+class ConfigurationIndex:
+    """
+    A trie of the (case-normalized) keys of a :py:class:`~appsettings2.Configuration`, see :py:meth:`~appsettings2.Configuration.keysWithPrefix`.
+
+    Each node tracks the number of keys beneath it, so prefix counts and existence checks cost a lookup of the prefix, and prefix enumeration only visits the nodes beneath the prefix. The trie is maintained incrementally as keys are set and deleted.
+    """
+
+    __configuration:Configuration
+    __root:_TrieNode
+
+    def __init__(self, configuration:Configuration):
+        self.__configuration = configuration
+        self.__root = _TrieNode()
+        for key, value in configuration.items():
+            self.__add(key, [key.upper()], value)
+
+    def __add(self, key:str, parts:list[str], value:any) -> None:
+        if isinstance(value, Configuration):
+            for k, v in value.items():
+                parts.append(k.upper())
+                self.__add(f'{key}:{k}', parts, v)
+                parts.pop()
+            return
+        path = [self.__root]
+        for part in parts:
+            node = path[-1].children.get(part)
+            if node is None:
+                node = _TrieNode()
+                path[-1].children[part] = node
+            path.append(node)
+        if path[-1].key is None:
+            for node in path:
+                node.count += 1
+        path[-1].key = key
+
+    def __find(self, prefix:str) -> _TrieNode|None:
+        node = self.__root
+        if prefix:
+            for part in KeyPathFilter.split(prefix):
+                node = node.children.get(part)
+                if node is None:
+                    return None
+        return node
+
+    def __remove(self, parts:list[str]) -> None:
+        path = [self.__root]
+        for part in parts:
+            node = path[-1].children.get(part)
+            if node is None:
+                return
+            path.append(node)
+        count = path[-1].count
+        for node in path:
+            node.count -= count
+        # NOTE: prune the removed node, and any ancestors left without keys
+        for i in range(len(parts), 0, -1):
+            if path[i].count > 0:
+                break
+            del path[i - 1].children[parts[i - 1]]
+
+    def count(self, prefix:str) -> int:
+        """Gets the number of keys at or beneath `prefix`."""
+        node = self.__find(prefix)
+        return 0 if node is None else node.count
+
+    def invalidate(self, key:str) -> None:
+        """
+        Notifies the index that `key` has been set (or deleted), re-indexing the keys at or beneath `key`.
+
+        :param key: The configuration key which has changed.
+        """
+        parts = KeyPathFilter.split(key)
+        self.__remove(parts)
+        value = self.__configuration.get(key, _MISSING)
+        if value is not _MISSING:
+            self.__add(key, parts, value)
+
+    def keys(self, prefix:str) -> list[str]:
+        """Gets the keys at or beneath `prefix`, ordered by (case-normalized) key."""
+        node = self.__find(prefix)
+        results = []
+        if node is not None and node.count > 0:
+            pending = [node]
+            while len(pending) > 0:
+                node = pending.pop()
+                if node.key is not None:
+                    results.append(node.key)
+                if len(node.children) > 0:
+                    pending.extend(node.children[k] for k in sorted(node.children, reverse=True))
+        return results
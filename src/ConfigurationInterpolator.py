@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .Configuration import Configuration
+from .ConfigurationException import ConfigurationException
+from .KeyPathFilter import KeyPathFilter
+import re
+import typing
+
+type any = typing.Any
+
+_TOKENS = re.compile(r'\$\$\{|\$\{([^{}]+)\}')
+_MISSING = object()
+
+class ConfigurationInterpolator:
+    """
+    Resolves ``${Key}`` references in the string values of a :py:class:`~appsettings2.Configuration`, see :py:meth:`~appsettings2.Configuration.interpolate`.
+
+    The templates (string values containing references) and the reference graph between them are retained, so when a key is later changed only the templates which depend on it, directly or transitively, are resolved again.
+    """
+
+    __configuration:Configuration
+    __dependents:dict[str, set[str]]
+    __suspended:bool
+    __templates:dict[str, tuple[str, str, list[str]]]
+
+    def __init__(self, configuration:Configuration):
+        self.__configuration = configuration
+        self.__dependents = {}
+        self.__suspended = False
+        self.__templates = {}
+
+    @staticmethod
+    def __normalize(key:str) -> str:
+        return ':'.join(KeyPathFilter.split(key.strip()))
+
+    @staticmethod
+    def __ancestors(key:str) -> typing.Iterator[str]:
+        i = key.rfind(':')
+        while i > 0:
+            key = key[:i]
+            yield key
+            i = key.rfind(':')
+
+    def __add(self, key:str, template:str) -> str:
+        k = ConfigurationInterpolator.__normalize(key)
+        refs = []
+        for m in _TOKENS.finditer(template):
+            if m[1] is not None:
+                ref = ConfigurationInterpolator.__normalize(m[1])
+                refs.append(ref)
+                dependents = self.__dependents.get(ref)
+                if dependents is None:
+                    self.__dependents[ref] = dependents = set()
+                dependents.add(k)
+        self.__templates[k] = (key, template, refs)
+        return k
+
+    def __remove(self, k:str) -> None:
+        key, template, refs = self.__templates.pop(k)
+        for ref in refs:
+            dependents = self.__dependents.get(ref)
+            if dependents is not None:
+                dependents.discard(k)
+                if len(dependents) == 0:
+                    self.__dependents.pop(ref)
+
+    def __scan(self, key:str, value:any, found:list[str]) -> None:
+        if isinstance(value, str):
+            if '${' in value:
+                found.append(self.__add(key, value))
+        elif isinstance(value, Configuration):
+            for k, v in value.items():
+                self.__scan(f'{key}:{k}' if key else k, v, found)
+
+    def __affected(self, changed:list[str]) -> set[str]:
+        """Gets the templates which transitively depend upon the `changed` keys, including any `changed` keys which are templates themselves."""
+        affected = set(k for k in changed if k in self.__templates)
+        pending = list(changed)
+        while len(pending) > 0:
+            k = pending.pop()
+            # NOTE: a reference depends on `k` if it refers to `k`, a subtree containing `k`, or a key within `k`
+            refs = [k]
+            refs.extend(ConfigurationInterpolator.__ancestors(k))
+            prefix = k + ':'
+            refs.extend(ref for ref in self.__dependents if ref.startswith(prefix))
+            for ref in refs:
+                for dependent in self.__dependents.get(ref, ()):
+                    if dependent not in affected:
+                        affected.add(dependent)
+                        pending.append(dependent)
+        return affected
+
+    def __order(self, affected:set[str]) -> list[str]:
+        """Topologically sorts the `affected` templates so every template is resolved after the templates it refers to."""
+        byAncestor = {}
+        for k in affected:
+            for ancestor in ConfigurationInterpolator.__ancestors(k):
+                byAncestor.setdefault(ancestor, []).append(k)
+        edges = {}
+        indegree = {}
+        for k in affected:
+            indegree.setdefault(k, 0)
+            for ref in self.__templates[k][2]:
+                requires = byAncestor.get(ref, [])
+                if ref in affected:
+                    requires = [ref] + requires
+                for r in requires:
+                    edges.setdefault(r, []).append(k)
+                    indegree[k] += 1
+        ordered = [k for k, n in indegree.items() if n == 0]
+        i = 0
+        while i < len(ordered):
+            for k in edges.get(ordered[i], ()):
+                indegree[k] -= 1
+                if indegree[k] == 0:
+                    ordered.append(k)
+            i += 1
+        if len(ordered) < len(affected):
+            raise ConfigurationException(f'Circular reference: {self.__describeCycle(set(k for k, n in indegree.items() if n > 0), edges)}')
+        return ordered
+
+    def __describeCycle(self, remaining:set[str], edges:dict[str, list[str]]) -> str:
+        # NOTE: every remaining template is on, or downstream of, a cycle; walking backwards from any of them must revisit a template
+        reverse = {}
+        for r, ks in edges.items():
+            if r in remaining:
+                for k in ks:
+                    if k in remaining:
+                        reverse.setdefault(k, []).append(r)
+        path = [next(iter(sorted(remaining)))]
+        seen = { path[0]: 0 }
+        while True:
+            k = reverse[path[-1]][0]
+            if k in seen:
+                cycle = path[seen[k]:] + [k]
+                break
+            seen[k] = len(path)
+            path.append(k)
+        return ' -> '.join(self.__templates[k][0] for k in cycle)
+
+    def __resolve(self, affected:set[str]) -> None:
+        configuration = self.__configuration
+        self.__suspended = True
+        try:
+            for k in self.__order(affected):
+                key, template, refs = self.__templates[k]
+                m = _TOKENS.fullmatch(template)
+                if m is not None and m[1] is not None:
+                    # NOTE: a template consisting of a single reference resolves to the referenced value, preserving its type
+                    value = self.__lookup(key, m[1])
+                    if isinstance(value, Configuration):
+                        value = value.toDictionary()
+                else:
+                    value = _TOKENS.sub(lambda m: '${' if m[1] is None else str(self.__lookup(key, m[1])), template)
+                configuration.set(key, value)
+        finally:
+            self.__suspended = False
+
+    def __lookup(self, key:str, ref:str) -> any:
+        value = self.__configuration.get(ref.strip(), _MISSING)
+        if value is _MISSING:
+            raise ConfigurationException(f'Unresolved reference `${{{ref}}}` in `{key}`.')
+        return value
+
+    def attach(self, configuration:Configuration) -> None:
+        """
+        Re-targets the interpolator at `configuration`, which has been reloaded from the configuration the interpolator resolved.
+
+        :param configuration: The reloaded :py:class:`~appsettings2.Configuration`.
+        """
+        self.__configuration = configuration
+
+    def invalidate(self, key:str) -> None:
+        """
+        Notifies the interpolator that `key` has been set (or deleted), resolving any templates at or beneath `key` and any templates which depend on `key`.
+
+        :param key: The configuration key which has changed.
+        """
+        if self.__suspended:
+            return
+        k = ConfigurationInterpolator.__normalize(key)
+        prefix = k + ':'
+        for t in [t for t in self.__templates if t == k or t.startswith(prefix)]:
+            self.__remove(t)
+        found = []
+        self.__scan(key, self.__configuration.get(key), found)
+        found.append(k)
+        self.__resolve(self.__affected(found))
+
+    def release(self, key:str|None) -> None:
+        """
+        Notifies the interpolator that `key` is about to be deleted, forgetting any templates at or beneath `key`. Raises `ConfigurationException`, before anything is deleted, if any other template depends on `key`.
+
+        :param key: The configuration key which is to be deleted, or None if every key is to be deleted.
+        """
+        if self.__suspended:
+            return
+        if key is None:
+            self.__templates.clear()
+            self.__dependents.clear()
+            return
+        k = ConfigurationInterpolator.__normalize(key)
+        prefix = k + ':'
+        removed = [t for t in self.__templates if t == k or t.startswith(prefix)]
+        dependents = sorted(t for t in self.__affected([k]) if t != k and not t.startswith(prefix))
+        if len(dependents) > 0:
+            raise ConfigurationException(f'Cannot delete `{key}`, it is referenced by `{"`, `".join(self.__templates[t][0] for t in dependents)}`.')
+        for t in removed:
+            self.__remove(t)
+
+    def resolve(self) -> None:
+        """Finds and resolves all templates in the configuration."""
+        self.__templates.clear()
+        self.__dependents.clear()
+        found = []
+        self.__scan(None, self.__configuration, found)
+        self.__resolve(set(found))
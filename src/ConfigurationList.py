@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import typing
+
+type any = typing.Any
+Configuration = typing.ForwardRef('Configuration')
+
+class ConfigurationList(list):
+    """
+    A `list` value of a :py:class:`~appsettings2.Configuration` whose `dict` elements are kept as-is (as parsed by a provider) until they are accessed, at which point each element is converted to a :py:class:`~appsettings2.Configuration` once.
+    """
+
+    __factory:typing.Callable[[dict], Configuration]
+
+    def __init__(self, source:typing.Iterable, factory:typing.Callable[[dict], Configuration]):
+        """
+        :param source: The elements of the list.
+        :param factory: A callable converting a `dict` element to a :py:class:`~appsettings2.Configuration`.
+        """
+        super().__init__(source.raw() if isinstance(source, ConfigurationList | ConfigurationTuple) else source)
+        self.__factory = factory
+
+    def __getitem__(self, index:int|slice) -> any:
+        if isinstance(index, slice):
+            return [self.__wrap(i) for i in range(*index.indices(len(self)))]
+        return self.__wrap(index)
+
+    def __iter__(self) -> typing.Iterator[any]:
+        for i in range(len(self)):
+            yield self.__wrap(i)
+
+    def __reversed__(self) -> typing.Iterator[any]:
+        for i in range(len(self) - 1, -1, -1):
+            yield self.__wrap(i)
+
+    def __wrap(self, index:int) -> any:
+        e = list.__getitem__(self, index)
+        if isinstance(e, dict):
+            e = self.__factory(e)
+            list.__setitem__(self, index, e)
+        return e
+
+    def pop(self, index:int = -1) -> any:
+        e = self.__wrap(index)
+        list.pop(self, index)
+        return e
+
+    def raw(self) -> typing.Iterator[any]:
+        """Iterates the elements of the list without converting `dict` elements to :py:class:`~appsettings2.Configuration` objects."""
+        return list.__iter__(self)
+
+class ConfigurationTuple(tuple):
+    """
+    A compact, read-only alternative to :py:class:`~appsettings2.ConfigurationList`, see the `readonlyLists` option of :py:class:`~appsettings2.Configuration`.
+
+    Elements are stored as a `tuple`, `dict` elements are converted to :py:class:`~appsettings2.Configuration` objects when they are first accessed.
+    """
+
+    __factory:typing.Callable[[dict], Configuration]
+    __wrapped:dict[int, Configuration]
+
+    def __new__(cls, source:typing.Iterable, factory:typing.Callable[[dict], Configuration]):
+        """
+        :param source: The elements of the tuple.
+        :param factory: A callable converting a `dict` element to a :py:class:`~appsettings2.Configuration`.
+        """
+        instance = super().__new__(cls, source.raw() if isinstance(source, ConfigurationList | ConfigurationTuple) else source)
+        instance.__factory = factory
+        instance.__wrapped = None
+        return instance
+
+    def __getitem__(self, index:int|slice) -> any:
+        if isinstance(index, slice):
+            return tuple(self.__wrap(i) for i in range(*index.indices(len(self))))
+        return self.__wrap(index)
+
+    def __getnewargs__(self) -> tuple:
+        return (tuple(self.raw()), self.__factory)
+
+    def __iter__(self) -> typing.Iterator[any]:
+        for i in range(len(self)):
+            yield self.__wrap(i)
+
+    def __reversed__(self) -> typing.Iterator[any]:
+        for i in range(len(self) - 1, -1, -1):
+            yield self.__wrap(i)
+
+    def __wrap(self, index:int) -> any:
+        e = tuple.__getitem__(self, index)
+        if isinstance(e, dict):
+            if index < 0:
+                index += len(self)
+            if self.__wrapped is None:
+                self.__wrapped = {}
+            wrapped = self.__wrapped.get(index)
+            if wrapped is None:
+                wrapped = self.__factory(e)
+                self.__wrapped[index] = wrapped
+            return wrapped
+        return e
+
+    def raw(self) -> typing.Iterator[any]:
+        """Iterates the elements of the tuple without converting `dict` elements to :py:class:`~appsettings2.Configuration` objects."""
+        return tuple.__iter__(self)
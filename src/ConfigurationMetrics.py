@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import collections
+import os
+import time
+import typing
+
+type any = typing.Any
+
+class ProviderMetrics:
+    """
+    The read, parse and merge metrics of a single :py:class:`~appsettings2.providers.ConfigurationProvider`, see :py:class:`~appsettings2.ConfigurationMetrics`.
+
+    Times are in seconds. :py:class:`~appsettings2.providers.DirectoryConfigurationProvider` parses files concurrently and reports the read and parse times of its files summed across workers (so they may exceed the duration of the build), :py:class:`~appsettings2.providers.HttpConfigurationProvider` reports decoding as part of reading, :py:class:`~appsettings2.providers.JsonStreamConfigurationProvider` parses its source as it is merged and reports parsing as part of merging, and providers which neither read nor parse (such as :py:class:`~appsettings2.providers.EnvironmentConfigurationProvider`) only report merge times.
+    """
+
+    name:str
+    source:str|None
+    bytesRead:int
+    readTime:float
+    parseTime:float
+    mergeTime:float
+    keys:int
+
+    def __init__(self, name:str, source:str = None, *, bytesRead:int = 0, readTime:float = 0.0, parseTime:float = 0.0, mergeTime:float = 0.0, keys:int = 0):
+        """
+        :param name: The name of the provider, such as ``JsonConfigurationProvider``.
+        :param source: Optional description of the provider's source, such as a file path or url, defaults to None.
+        """
+        self.name = name
+        self.source = source
+        self.bytesRead = bytesRead
+        self.readTime = readTime
+        self.parseTime = parseTime
+        self.mergeTime = mergeTime
+        self.keys = keys
+
+    def addParse(self, elapsed:float) -> None:
+        """Records `elapsed` seconds spent parsing."""
+        self.parseTime += elapsed
+
+    def addRead(self, size:int, elapsed:float) -> None:
+        """Records `size` bytes read in `elapsed` seconds."""
+        self.bytesRead += size
+        self.readTime += elapsed
+
+    def getDescription(self) -> str:
+        """Gets the name of the provider, followed by its source (if any) in parentheses."""
+        return self.name if self.source is None else f'{self.name}({self.source})'
+
+    def read(self, file:typing.IO) -> str|bytes:
+        """
+        Reads the remainder of `file`, recording the bytes read and the time taken.
+
+        :param file: A file object.
+        :return: The contents of `file`.
+        """
+        start = time.perf_counter()
+        data = file.read()
+        elapsed = time.perf_counter() - start
+        try:
+            size = os.fstat(file.fileno()).st_size
+        except (OSError, ValueError):
+            size = 0
+        # NOTE: the size of pipes (and of in-memory files) is unknown, so the length of their contents is recorded instead
+        self.addRead(size if size > 0 else len(data), elapsed)
+        return data
+
+    def toDictionary(self) -> dict[str, any]:
+        return {
+            'name': self.name,
+            'source': self.source,
+            'bytesRead': self.bytesRead,
+            'readTime': self.readTime,
+            'parseTime': self.parseTime,
+            'mergeTime': self.mergeTime,
+            'keys': self.keys
+        }
+
+class BuildMetrics:
+    """
+    The metrics of a single :py:meth:`~appsettings2.ConfigurationBuilder.build` (or :py:meth:`~appsettings2.ConfigurationBuilder.reload`), see :py:class:`~appsettings2.ConfigurationMetrics`.
+
+    Each provider reports the reading and parsing it performed since the previous build, including any performed when the provider was constructed, and `keys` counts the values it set (including values which override those of earlier providers). `totalTime` is the duration of the build itself, so it excludes any reading and parsing performed by provider constructors.
+    """
+
+    providers:list[ProviderMetrics]
+    interpolateTime:float
+    totalTime:float
+
+    def __init__(self, providers:list[ProviderMetrics], interpolateTime:float, totalTime:float):
+        self.providers = providers
+        self.interpolateTime = interpolateTime
+        self.totalTime = totalTime
+
+    def __str__(self) -> str:
+        lines = [f'{"provider":<40} {"bytes":>10} {"read":>12} {"parse":>12} {"merge":>12} {"keys":>8}']
+        for p in self.providers:
+            name = p.getDescription()
+            lines.append(f'{name[-40:]:<40} {p.bytesRead:>10} {p.readTime * 1000:>9.3f} ms {p.parseTime * 1000:>9.3f} ms {p.mergeTime * 1000:>9.3f} ms {p.keys:>8}')
+        if self.interpolateTime > 0:
+            lines.append(f'{"(interpolate)":<40} {"":>10} {"":>12} {"":>12} {self.interpolateTime * 1000:>9.3f} ms')
+        lines.append(f'{"(total)":<40} {self.getBytesRead():>10} {"":>12} {"":>12} {self.totalTime * 1000:>9.3f} ms {self.getKeys():>8}')
+        return '\n'.join(lines)
+
+    def getBytesRead(self) -> int:
+        return sum(p.bytesRead for p in self.providers)
+
+    def getKeys(self) -> int:
+        return sum(p.keys for p in self.providers)
+
+    def toDictionary(self) -> dict[str, any]:
+        return {
+            'providers': [p.toDictionary() for p in self.providers],
+            'interpolateTime': self.interpolateTime,
+            'totalTime': self.totalTime
+        }
+
+class BindMetrics:
+    """
+    The metrics of a single :py:meth:`~appsettings2.Configuration.bind`, see :py:class:`~appsettings2.ConfigurationMetrics`.
+    """
+
+    type:str
+    key:str|None
+    bindTime:float
+
+    def __init__(self, type:str, key:str|None, bindTime:float):
+        """
+        :param type: The qualified name of the bound target's type.
+        :param key: The configuration key bound from, or None if the configuration root was bound.
+        :param bindTime: The time taken to bind, in seconds.
+        """
+        self.type = type
+        self.key = key
+        self.bindTime = bindTime
+
+    def toDictionary(self) -> dict[str, any]:
+        return {
+            'type': self.type,
+            'key': self.key,
+            'bindTime': self.bindTime
+        }
+
+class ConfigurationMetrics:
+    """
+    Records :py:class:`~appsettings2.BuildMetrics` for each build of a :py:class:`~appsettings2.ConfigurationBuilder`, and :py:class:`~appsettings2.BindMetrics` for each :py:meth:`~appsettings2.Configuration.bind` of the configurations it builds.
+
+    Metrics are only recorded for builders constructed with a `metrics` argument, other builders (and the configurations they build) are not instrumented. Each recorded metric is also passed to the optional `callback`, for example to forward it to a metrics pipeline.
+    """
+
+    __binds:collections.deque[BindMetrics]
+    __builds:collections.deque[BuildMetrics]
+    __callback:typing.Callable[[BuildMetrics|BindMetrics], None]|None
+
+    def __init__(self, callback:typing.Callable[[BuildMetrics|BindMetrics], None] = None, *, history:int = 100):
+        """
+        :param callback: Optional callable invoked with each :py:class:`~appsettings2.BuildMetrics` and :py:class:`~appsettings2.BindMetrics` as it is recorded, defaults to None.
+        :param history: Optional maximum number of builds (and, separately, of binds) retained, defaults to 100.
+        """
+        self.__binds = collections.deque(maxlen=history)
+        self.__builds = collections.deque(maxlen=history)
+        self.__callback = callback
+
+    def clear(self) -> None:
+        """Discards all recorded metrics."""
+        self.__binds.clear()
+        self.__builds.clear()
+
+    def getBinds(self) -> list[BindMetrics]:
+        """Gets the recorded binds, oldest first."""
+        return list(self.__binds)
+
+    def getBuilds(self) -> list[BuildMetrics]:
+        """Gets the recorded builds, oldest first."""
+        return list(self.__builds)
+
+    def getReport(self) -> dict[str, any]:
+        """
+        Gets a report of the recorded metrics, suitable for serializing as JSON.
+
+        :return: A dictionary containing each recorded build (``builds``), and the count, total and maximum bind times (``binds``) of each bound type.
+        """
+        binds = {}
+        for bind in self.__binds:
+            entry = binds.get(bind.type)
+            if entry is None:
+                entry = binds[bind.type] = { 'count': 0, 'totalTime': 0.0, 'maxTime': 0.0 }
+            entry['count'] += 1
+            entry['totalTime'] += bind.bindTime
+            entry['maxTime'] = max(entry['maxTime'], bind.bindTime)
+        return {
+            'builds': [b.toDictionary() for b in self.__builds],
+            'binds': binds
+        }
+
+    def record(self, metrics:BuildMetrics|BindMetrics) -> None:
+        """
+        Records `metrics`, and passes them to the callback (if any).
+
+        :param metrics: The :py:class:`~appsettings2.BuildMetrics` or :py:class:`~appsettings2.BindMetrics` to record.
+        """
+        if isinstance(metrics, BindMetrics):
+            self.__binds.append(metrics)
+        else:
+            self.__builds.append(metrics)
+        if self.__callback is not None:
+            self.__callback(metrics)
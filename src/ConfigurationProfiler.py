@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .Configuration import Configuration
+from .ConfigurationException import ConfigurationException
+from .KeyPathFilter import KeyPathFilter
+import typing
+
+type any = typing.Any
+
+class ConfigurationProfiler:
+    """
+    Counts reads of the values of a :py:class:`~appsettings2.Configuration`, see :py:meth:`~appsettings2.Configuration.profile`, for finding hot keys (candidates for binding once, or for an accessor) and keys which are never read (candidates for pruning).
+
+    Reads made through :py:meth:`~appsettings2.Configuration.get`, the indexer, attributes, and :py:meth:`~appsettings2.Configuration.bind` are counted, as are reads made by methods which read every value (such as :py:meth:`~appsettings2.Configuration.toDictionary`). Only values are counted, reading a subtree (such as ``config.Database``) is not counted as a read.
+
+    Profiling is opt-in: the nodes of a profiled configuration are given a subclass of :py:class:`~appsettings2.Configuration` which counts attribute reads, other configurations are not affected. When constructed with a `sampleRate` greater than 1 only every n-th read is counted, and counts are estimated from the sample.
+    """
+
+    __counts:dict[str, int]
+    __countdown:list[int]
+    __keys:dict[str, None]
+    __layers:dict[tuple[str, ...], tuple[int, str]]
+    __names:dict[int, dict[str, str]]
+    __nodes:list[Configuration]
+    __sampleRate:int
+    __type:type
+
+    def __init__(self, *, sampleRate:int = 1):
+        """
+        :param sampleRate: Optional sampling interval, only every `sampleRate`-th read is counted, defaults to 1 which counts every read.
+        """
+        if sampleRate < 1:
+            raise ConfigurationException(f'Invalid sampleRate: {sampleRate}')
+        self.__counts = {}
+        self.__countdown = [sampleRate]
+        self.__keys = {}
+        self.__layers = {}
+        self.__names = {}
+        self.__nodes = []
+        self.__sampleRate = sampleRate
+        self.__type = self.__createType()
+
+    def __createType(self) -> type:
+        counts = self.__counts
+        countdown = self.__countdown
+        names = self.__names
+        sampleRate = self.__sampleRate
+        getattribute = object.__getattribute__
+        # NOTE: methods, and the private attributes of each node, are never configuration keys
+        members = frozenset(dir(Configuration)) | frozenset(Configuration.__annotations__)
+        def __getattribute__(node:Configuration, name:str) -> any:
+            value = getattribute(node, name)
+            if name not in members:
+                keys = names.get(id(node))
+                key = None if keys is None else keys.get(name)
+                if key is not None:
+                    if sampleRate > 1:
+                        countdown[0] -= 1
+                        if countdown[0] > 0:
+                            return value
+                        countdown[0] = sampleRate
+                    counts[key] = counts.get(key, 0) + 1
+            return value
+        return type(Configuration.__name__, (Configuration,), { '__getattribute__': __getattribute__, '__module__': Configuration.__module__, '__qualname__': Configuration.__qualname__ })
+
+    def __layerOf(self, key:str) -> str|None:
+        # NOTE: a value belongs to the layer which most recently set it, or set any subtree containing it (keys are case-insensitive)
+        parts = tuple(KeyPathFilter.split(key.upper()))
+        result = None
+        for i in range(1, len(parts) + 1):
+            entry = self.__layers.get(parts[:i])
+            if entry is not None and (result is None or entry[0] > result[0]):
+                result = entry
+        return None if result is None else result[1]
+
+    def attach(self, nodes:list[tuple[Configuration, dict[str, str]]]) -> None:
+        """
+        Starts counting reads of the specified nodes, replacing any previously attached nodes, counts are retained. Called by :py:meth:`~appsettings2.Configuration.profile`, which should be used instead.
+
+        :param nodes: A list of `(node, names)` pairs, where `names` maps the attribute name of each value of `node` to its configuration key.
+        """
+        self.detach()
+        for node, names in nodes:
+            self.__names[id(node)] = names
+            self.__keys.update(dict.fromkeys(names.values()))
+            self.__nodes.append(node)
+            node.__class__ = self.__type
+
+    def detach(self) -> None:
+        """Stops counting reads of the attached configuration, counts are retained."""
+        for node in self.__nodes:
+            node.__class__ = Configuration
+        self.__keys.clear()
+        self.__names.clear()
+        self.__nodes.clear()
+
+    def getHotKeys(self, count:int = 20) -> list[tuple[str, int]]:
+        """
+        Gets the most frequently read keys.
+
+        :param count: Optional maximum number of keys, defaults to 20.
+        :return: A list of `(key, reads)` pairs, most frequently read first.
+        """
+        reads = sorted(self.getReads().items(), key=lambda kvp: kvp[1], reverse=True)
+        return [kvp for kvp in reads[:count] if kvp[1] > 0]
+
+    def getLayerReads(self) -> dict[str, int]:
+        """
+        Gets the number of reads of the values set by each provider, see :py:class:`~appsettings2.ConfigurationBuilder`.
+
+        :return: A dictionary of provider descriptions and read counts, values which were not set by a provider (such as values set directly) are counted as ``(none)``.
+        """
+        results = {}
+        for key, reads in self.getReads().items():
+            layer = self.__layerOf(key) or '(none)'
+            results[layer] = results.get(layer, 0) + reads
+        return results
+
+    def getReads(self) -> dict[str, int]:
+        """
+        Gets the (estimated, if sampled) number of reads of each key.
+
+        :return: A dictionary of every key of the attached configuration, and every key read while profiling, and its read count.
+        """
+        results = dict.fromkeys(self.__keys, 0)
+        for key, count in self.__counts.items():
+            results[key] = count * self.__sampleRate
+        return results
+
+    def getReport(self, count:int = 20) -> dict[str, any]:
+        """
+        Gets a report of the profile, suitable for serializing as JSON.
+
+        :param count: Optional maximum number of hot keys, defaults to 20.
+        :return: A dictionary containing the hot keys (``hotKeys``), the keys which were never read (``unreadKeys``), and the reads of each provider's values (``layers``).
+        """
+        return {
+            'sampleRate': self.__sampleRate,
+            'hotKeys': [{ 'key': k, 'reads': n } for k, n in self.getHotKeys(count)],
+            'unreadKeys': self.getUnreadKeys(),
+            'layers': self.getLayerReads()
+        }
+
+    def getUnreadKeys(self) -> list[str]:
+        """
+        Gets the keys of the attached configuration which have not been read, when sampling these are keys which were not sampled.
+
+        :return: A list of keys.
+        """
+        return [k for k in self.__keys if k not in self.__counts]
+
+    def reset(self) -> None:
+        """Discards all read counts."""
+        self.__counts.clear()
+        self.__countdown[0] = self.__sampleRate
+
+    def setLayers(self, layers:dict[str, str]) -> None:
+        """
+        Sets which provider set each key, used to attribute reads to providers. Called by :py:class:`~appsettings2.ConfigurationBuilder`.
+
+        :param layers: A dictionary of keys and provider descriptions, ordered from least to most recently set.
+        """
+        self.__layers = {tuple(KeyPathFilter.split(k.upper())): (i, layer) for i, (k, layer) in enumerate(layers.items())}
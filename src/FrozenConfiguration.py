@@ -0,0 +1,417 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .Configuration import Configuration
+from .ConfigurationException import ConfigurationException
+from .ConfigurationList import ConfigurationList, ConfigurationTuple
+from .SettingsSchema import SettingsSchema
+import array
+import json
+import struct
+import typing
+import zlib
+
+type any = typing.Any
+
+_MAGIC = b'AS2C'
+_VERSION = 3
+_MISSING = object()
+
+# NOTE: all integers are little-endian; the layout is a header followed by values, each value is a one byte tag followed by its payload.
+#
+#   header:  magic(4) version(u16) flags(u16) generation(u64) root(u32) length(u32) checksum(u32), flags are the options of the frozen Configuration (see `_OPTIONS`),
+#            length is that of the header and values, and checksum is the crc32 of the values
+#   'N' None, 'T' True, 'F' False
+#   'i' int64, 'I' length(u32) + decimal digits (ints which do not fit in 64 bits)
+#   'd' float64
+#   's' length(u32) + utf-8
+#   'a' typecode(1) + count(u32) + padding to 8 bytes + count * 8 bytes (`array.array` of 'q' or 'd')
+#   'L' count(u32) + count * offset(u32)
+#   'O' count(u32) + count * entry + count * index(u32), entries are in key order, indexes are of entries sorted by upper-cased (utf-8) key:
+#       entry: key offset(u32) + length(u16), value offset(u32)
+_HEADER = struct.Struct('<4sHHQIII')
+_ENTRY = struct.Struct('<IHI')
+_U32 = struct.Struct('<I')
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+_OPTIONS = ('normalize', 'scrubkeys', 'readonlyLists', 'numericArrays')
+# NOTE: the errors raised when decoding a malformed buffer, which are raised as `ConfigurationException`
+_DECODE_ERRORS = (IndexError, ValueError, struct.error)
+
+class _Encoder:
+
+    buffer:bytearray
+    __strings:dict[bytes, int]
+    __values:dict[str, int]
+
+    def __init__(self):
+        self.buffer = bytearray(_HEADER.size)
+        self.__strings = {}
+        self.__values = {}
+
+    def __bytes(self, data:bytes) -> int:
+        offset = self.__strings.get(data)
+        if offset is None:
+            offset = len(self.buffer)
+            self.buffer += data
+            self.__strings[data] = offset
+        return offset
+
+    def __object(self, items:typing.Iterable[tuple[str, any]]) -> int:
+        entries = []
+        for key, value in items:
+            voffset = self.value(value)
+            k = key.encode('utf-8')
+            if len(k) > 0xFFFF:
+                raise ConfigurationException(f'Key too long: {key[:64]}...')
+            entries.append((key.upper().encode('utf-8'), self.__bytes(k), len(k), voffset))
+        order = sorted(range(len(entries)), key=lambda i: entries[i][0])
+        offset = len(self.buffer)
+        self.buffer += b'O' + _U32.pack(len(entries))
+        for _, koffset, klen, voffset in entries:
+            self.buffer += _ENTRY.pack(koffset, klen, voffset)
+        self.buffer += struct.pack(f'<{len(order)}I', *order)
+        return offset
+
+    def value(self, value:any) -> int:
+        buffer = self.buffer
+        offset = len(buffer)
+        if value is None:
+            buffer += b'N'
+        elif value is True:
+            buffer += b'T'
+        elif value is False:
+            buffer += b'F'
+        elif isinstance(value, int):
+            if -0x8000000000000000 <= value <= 0x7FFFFFFFFFFFFFFF:
+                buffer += b'i' + _I64.pack(value)
+            else:
+                digits = str(value).encode('ascii')
+                buffer += b'I' + _U32.pack(len(digits)) + digits
+        elif isinstance(value, float):
+            buffer += b'd' + _F64.pack(value)
+        elif isinstance(value, str):
+            # NOTE: identical strings are stored once
+            existing = self.__values.get(value)
+            if existing is not None:
+                return existing
+            data = value.encode('utf-8')
+            buffer += b's' + _U32.pack(len(data)) + data
+            self.__values[value] = offset
+        elif isinstance(value, Configuration | FrozenConfiguration):
+            return self.__object(value.items())
+        elif isinstance(value, dict):
+            return self.__object(value.items())
+        elif isinstance(value, array.array) and value.typecode in ('q', 'd'):
+            buffer += b'a' + value.typecode.encode('ascii') + _U32.pack(len(value))
+            buffer += bytes(-len(buffer) % 8)
+            buffer += value.tobytes()
+        elif isinstance(value, memoryview) and value.format in ('q', 'd'):
+            return self.value(array.array(value.format, value))
+        elif isinstance(value, list | tuple):
+            elements = value.raw() if isinstance(value, ConfigurationList | ConfigurationTuple) else value
+            offsets = [self.value(e) for e in elements]
+            offset = len(buffer)
+            buffer += b'L' + _U32.pack(len(offsets)) + struct.pack(f'<{len(offsets)}I', *offsets)
+        else:
+            raise ConfigurationException(f'Values of type `{type(value)}` cannot be frozen.')
+        return offset
+
+class FrozenConfiguration:
+    """
+    A read-only, :py:class:`~appsettings2.Configuration`-compatible view of a configuration tree serialized by :py:meth:`freeze`.
+
+    The serialized layout is compact and position-independent, values are decoded from the underlying buffer (`bytes`, `mmap`, or shared memory) as they are accessed, and keys are found by binary search, so a view holds no per-key state. See :py:class:`~appsettings2.SharedConfiguration` for sharing a frozen configuration between processes.
+    """
+
+    __buffer:memoryview
+    __count:int
+    __flags:int
+    __generation:int
+    __offset:int
+
+    def __init__(self, buffer:bytes|bytearray|memoryview, *, verify:bool = False, offset:int = None, generation:int = None, flags:int = None):
+        """
+        :param buffer: A buffer containing a configuration serialized by :py:meth:`freeze`.
+        :param verify: Optional parameter indicating whether the checksum of the serialized configuration is verified, which reads the whole buffer, defaults to False. The length of the serialized configuration is always verified.
+        :param offset: Reserved for sub-views, defaults to None which reads the root of the serialized configuration.
+        :param generation: Reserved for sub-views, defaults to None.
+        :param flags: Reserved for sub-views, defaults to None.
+        """
+        buffer = memoryview(buffer).toreadonly()
+        if buffer.format != 'B':
+            buffer = buffer.cast('B')
+        if offset is None:
+            if len(buffer) < _HEADER.size:
+                raise ConfigurationException('Invalid frozen configuration.')
+            magic, version, flags, generation, offset, length, checksum = _HEADER.unpack_from(buffer, 0)
+            if magic != _MAGIC:
+                raise ConfigurationException('Invalid frozen configuration.')
+            if version != _VERSION:
+                raise ConfigurationException(f'Unsupported frozen configuration version: {version}')
+            # NOTE: the buffer may be longer than the serialized configuration (such as a page-aligned shared memory segment), but never shorter
+            if len(buffer) < length:
+                raise ConfigurationException(f'Truncated frozen configuration, expected {length} bytes but found {len(buffer)}.')
+            buffer = buffer[:length]
+            if verify and zlib.crc32(buffer[_HEADER.size:]) != checksum:
+                raise ConfigurationException('Corrupt frozen configuration, checksum mismatch.')
+        if offset >= len(buffer) or buffer[offset] != 0x4F:
+            raise ConfigurationException('Invalid frozen configuration.')
+        object.__setattr__(self, '_FrozenConfiguration__buffer', buffer)
+        object.__setattr__(self, '_FrozenConfiguration__count', _U32.unpack_from(buffer, offset + 1)[0])
+        object.__setattr__(self, '_FrozenConfiguration__flags', flags)
+        object.__setattr__(self, '_FrozenConfiguration__generation', generation)
+        object.__setattr__(self, '_FrozenConfiguration__offset', offset)
+
+    def __convert(self, value:any, hint:type) -> any:
+        if hint is bool or hint is int or hint is float or hint is str:
+            return SettingsSchema.convert(value, hint)
+        elif hint is dict or typing.get_origin(hint) is dict:
+            return value.toDictionary() if isinstance(value, FrozenConfiguration) else value
+        elif hint is memoryview:
+            if isinstance(value, memoryview):
+                return value
+            try:
+                return memoryview(array.array('d', value)).toreadonly()
+            except (TypeError, OverflowError) as ex:
+                raise ConfigurationException(f'Conversion to type `{hint}` from `{type(value)}` is not supported.') from ex
+        elif hint is list:
+            return list(value)
+        elif typing.get_origin(hint) is list:
+            elementType = typing.get_args(hint)[0]
+            if isinstance(value, memoryview) and value.format == ('q' if elementType is int else 'd' if elementType is float else None):
+                return value.tolist()
+            return [self.__convert(e, elementType) for e in value]
+        elif isinstance(value, FrozenConfiguration):
+            return value.bind(hint())
+        return value
+
+    def __decode(self, offset:int) -> any:
+        buffer = self.__buffer
+        tag = buffer[offset]
+        if tag == 0x73: # 's'
+            length = _U32.unpack_from(buffer, offset + 1)[0]
+            return str(buffer[offset + 5:offset + 5 + length], 'utf-8')
+        elif tag == 0x69: # 'i'
+            return _I64.unpack_from(buffer, offset + 1)[0]
+        elif tag == 0x4F: # 'O'
+            return FrozenConfiguration(buffer, offset=offset, generation=self.__generation, flags=self.__flags)
+        elif tag == 0x64: # 'd'
+            return _F64.unpack_from(buffer, offset + 1)[0]
+        elif tag == 0x54: # 'T'
+            return True
+        elif tag == 0x46: # 'F'
+            return False
+        elif tag == 0x4E: # 'N'
+            return None
+        elif tag == 0x4C: # 'L'
+            count = _U32.unpack_from(buffer, offset + 1)[0]
+            return tuple(self.__decode(o) for o in struct.unpack_from(f'<{count}I', buffer, offset + 5))
+        elif tag == 0x61: # 'a'
+            typecode = chr(buffer[offset + 1])
+            count = _U32.unpack_from(buffer, offset + 2)[0]
+            start = offset + 6
+            start += -start % 8
+            # NOTE: zero-copy, the memoryview refers directly to the underlying buffer
+            return buffer[start:start + count * 8].cast(typecode)
+        elif tag == 0x49: # 'I'
+            length = _U32.unpack_from(buffer, offset + 1)[0]
+            return int(str(buffer[offset + 5:offset + 5 + length], 'ascii'))
+        raise ConfigurationException(f'Invalid frozen configuration value at offset {offset}.')
+
+    def __entries(self) -> typing.Iterator[tuple[str, int]]:
+        buffer = self.__buffer
+        base = self.__offset + 5
+        for i in range(self.__count):
+            koffset, klen, voffset = _ENTRY.unpack_from(buffer, base + i * _ENTRY.size)
+            yield (str(buffer[koffset:koffset + klen], 'utf-8'), voffset)
+
+    def __find(self, part:str) -> int:
+        """Finds the value offset of the (single part) key `part` by binary search, otherwise returns -1."""
+        target = part.upper().encode('utf-8')
+        buffer = self.__buffer
+        base = self.__offset + 5
+        order = base + self.__count * _ENTRY.size
+        lo = 0
+        hi = self.__count
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            koffset, klen, voffset = _ENTRY.unpack_from(buffer, base + _U32.unpack_from(buffer, order + mid * 4)[0] * _ENTRY.size)
+            candidate = buffer[koffset:koffset + klen].tobytes()
+            # NOTE: the upper-cased key is derived rather than stored, `bytes.upper` only agrees with `str.upper` for ascii keys
+            candidate = candidate.upper() if candidate.isascii() else str(candidate, 'utf-8').upper().encode('utf-8')
+            if candidate < target:
+                lo = mid + 1
+            elif candidate > target:
+                hi = mid
+            else:
+                return voffset
+        return -1
+
+    def __getattr__(self, name:str) -> any:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        value = self.get(name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(name)
+        return value
+
+    def __getitem__(self, key:str|tuple[str, type]) -> any:
+        if isinstance(key, tuple):
+            key, hint = key
+        else:
+            hint = None
+        value = self.get(key, _MISSING, hint)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __repr__(self) -> str:
+        return f'FrozenConfiguration(generation={self.__generation}, keys={self.__count})'
+
+    def __setattr__(self, name:str, value:any) -> None:
+        raise ConfigurationException('FrozenConfiguration is read-only.')
+
+    def __setitem__(self, key:str, value:any) -> None:
+        raise ConfigurationException('FrozenConfiguration is read-only.')
+
+    def __str__(self) -> str:
+        return json.dumps(self.toDictionary())
+
+    def __thaw(self, offset:int, arrays:bool, strings:dict[int, str]) -> any:
+        """Decodes the value at `offset` as plain data, decoding each (deduplicated) key and string once."""
+        buffer = self.__buffer
+        tag = buffer[offset]
+        if tag == 0x4F: # 'O'
+            count = _U32.unpack_from(buffer, offset + 1)[0]
+            base = offset + 5
+            result = {}
+            for koffset, klen, voffset in _ENTRY.iter_unpack(buffer[base:base + count * _ENTRY.size]):
+                key = strings.get(koffset)
+                if key is None:
+                    key = strings[koffset] = str(buffer[koffset:koffset + klen], 'utf-8')
+                result[key] = self.__thaw(voffset, arrays, strings)
+            return result
+        elif tag == 0x73: # 's'
+            value = strings.get(offset)
+            if value is None:
+                length = _U32.unpack_from(buffer, offset + 1)[0]
+                value = strings[offset] = str(buffer[offset + 5:offset + 5 + length], 'utf-8')
+            return value
+        elif tag == 0x4C: # 'L'
+            count = _U32.unpack_from(buffer, offset + 1)[0]
+            return [self.__thaw(o, arrays, strings) for o in struct.unpack_from(f'<{count}I', buffer, offset + 5)]
+        elif tag == 0x61: # 'a'
+            value = self.__decode(offset)
+            return array.array(value.format, value) if arrays else value.tolist()
+        return self.__decode(offset)
+
+    def bind(self, target:object, key:str|None = None) -> any:
+        """
+        Binds the configuration values into the target object, see :py:meth:`~appsettings2.Configuration.bind`.
+
+        :param target: The object to bind configuration data into.
+        :param key: An optional confguration key to bind to, defaults to None which binds to the configuration root.
+        :return: The original `target` object, modified in-place.
+        """
+        source = self if key is None else self.get(key)
+        if not isinstance(source, FrozenConfiguration):
+            raise ConfigurationException(f'Bind of source type `{type(source)}` is not supported.')
+        return Configuration.fromDictionary(source.toDictionary()).bind(target)
+
+    @staticmethod
+    def freeze(configuration:Configuration|dict, *, generation:int = 0, options:dict[str, bool] = None) -> bytes:
+        """
+        Serializes a configuration tree into the layout read by :py:class:`~appsettings2.FrozenConfiguration`.
+
+        Values may be `None`, `bool`, `int`, `float`, `str`, `list` (or `tuple`), `array.array` (of type 'q' or 'd'), and nested configurations. Identical strings are stored once.
+
+        :param configuration: The :py:class:`~appsettings2.Configuration` (or `dict`) to serialize.
+        :param generation: Optional generation number recorded in the serialized configuration, defaults to 0.
+        :param options: Optional :py:class:`~appsettings2.Configuration` options (`normalize`, `scrubkeys`, `readonlyLists`, and `numericArrays`) recorded in the serialized configuration, see :py:meth:`getOptions`, defaults to None.
+        :return: The serialized configuration.
+        """
+        flags = 0
+        if options is not None:
+            for i, option in enumerate(_OPTIONS):
+                if options.get(option):
+                    flags |= 1 << i
+        encoder = _Encoder()
+        root = encoder.value(configuration if isinstance(configuration, Configuration | FrozenConfiguration | dict) else dict(configuration))
+        buffer = encoder.buffer
+        if len(buffer) > 0xFFFFFFFF:
+            raise ConfigurationException('Configuration too large to freeze.')
+        _HEADER.pack_into(buffer, 0, _MAGIC, _VERSION, flags, generation, root, len(buffer), zlib.crc32(memoryview(buffer)[_HEADER.size:]))
+        return bytes(buffer)
+
+    def get(self, key:str, default:any = None, type:type = None) -> any:
+        """
+        Gets the configuration data associated with the specified `key`, see :py:meth:`~appsettings2.Configuration.get`.
+
+        Nested configurations are returned as :py:class:`~appsettings2.FrozenConfiguration` views, lists as tuples, and `array.array` values as read-only `memoryview` objects referring directly to the underlying buffer.
+
+        :param key: The configuration key to get data for. Supports `__` and `:` hierarchical delimiters.
+        :param default: The value to be returned if `key` does not exist, defaults to None
+        :param type: Optional type to convert the value to, defaults to None which returns the value as-is.
+        :return: The configuration data associated with `key`, otherwise `default`.
+        """
+        o = self
+        try:
+            for part in key.replace(':', '__').split('__'):
+                if not isinstance(o, FrozenConfiguration):
+                    return default
+                offset = o.__find(part)
+                if offset < 0:
+                    return default
+                o = o.__decode(offset)
+        except _DECODE_ERRORS as ex:
+            raise ConfigurationException(f'Invalid frozen configuration: {ex}') from ex
+        return o if type is None or o is None else self.__convert(o, type)
+
+    def getGeneration(self) -> int:
+        """
+        Gets the generation number recorded by :py:meth:`freeze`.
+
+        :return: The generation number of the frozen configuration.
+        """
+        return self.__generation
+
+    def getOptions(self) -> dict[str, bool]:
+        """
+        Gets the :py:class:`~appsettings2.Configuration` options recorded by :py:meth:`freeze`.
+
+        :return: A dictionary of the options which were set, suitable for passing to the :py:class:`~appsettings2.Configuration` constructor.
+        """
+        return { option: True for i, option in enumerate(_OPTIONS) if self.__flags & (1 << i) }
+
+    def has_key(self, key:str) -> bool:
+        return self.__find(key) >= 0
+
+    def items(self) -> list[tuple[str, any]]:
+        return [(k, self.__decode(o)) for k, o in self.__entries()]
+
+    def keys(self) -> list[str]:
+        return [k for k, _ in self.__entries()]
+
+    def set(self, key:str, value:any) -> None:
+        raise ConfigurationException('FrozenConfiguration is read-only.')
+
+    def toDictionary(self) -> dict:
+        """
+        Creates a dictionary from the `FrozenConfiguration` object, decoding all values.
+
+        :return: A dictionary containing all keys and their associated values.
+        """
+        try:
+            return self.__thaw(self.__offset, False, {})
+        except _DECODE_ERRORS as ex:
+            raise ConfigurationException(f'Invalid frozen configuration: {ex}') from ex
+
+    def values(self) -> list[any]:
+        return [self.__decode(o) for _, o in self.__entries()]
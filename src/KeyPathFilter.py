@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import fnmatch
+import re
+
+class KeyPathFilter:
+    """
+    Matches hierarchical configuration keys against `include` and `exclude` patterns.
+
+    Patterns are configuration keys (`:` and `__` delimited, case-insensitive) where each part may contain `fnmatch`-style wildcards, for example ``Database``, ``Cache:*`` or ``Tenants:*:Url``. A pattern selects the key it matches as well as every key beneath it.
+    """
+
+    __include:list[tuple]
+    __exclude:list[tuple]
+
+    def __init__(self, include:list[str] = None, *, exclude:list[str] = None):
+        """
+        :param include: Optional list of patterns to be included, defaults to None which includes all keys.
+        :param exclude: Optional list of patterns to be excluded, defaults to None which excludes no keys. Exclusions take precedence over inclusions.
+        """
+        self.__include = [KeyPathFilter.__compile(p) for p in include] if include else None
+        self.__exclude = [KeyPathFilter.__compile(p) for p in exclude] if exclude else []
+
+    @staticmethod
+    def __compile(pattern:str) -> tuple:
+        parts = []
+        for part in KeyPathFilter.split(pattern):
+            if part == '*':
+                parts.append(None)
+            elif any(c in part for c in '*?['):
+                parts.append(re.compile(fnmatch.translate(part)))
+            else:
+                parts.append(part)
+        return tuple(parts)
+
+    @staticmethod
+    def __matches(pattern:tuple, parts:list[str], count:int) -> bool:
+        for i in range(count):
+            p = pattern[i]
+            if p is None:
+                continue
+            elif type(p) is str:
+                if p != parts[i]:
+                    return False
+            elif p.match(parts[i]) is None:
+                return False
+        return True
+
+    @staticmethod
+    def split(key:str) -> list[str]:
+        """
+        Splits a configuration key into its normalized (upper-case) parts.
+
+        :param key: A configuration key. Supports `__` and `:` hierarchical delimiters.
+        :return: A list of upper-cased key parts.
+        """
+        return key.upper().replace(':', '__').split('__')
+
+    def canDescend(self, parts:list[str]) -> bool:
+        """
+        Determines whether any key at or beneath `parts` could be selected.
+
+        :param parts: Normalized key parts, as returned by :py:meth:`split`.
+        :return: True if the subtree at `parts` must be visited, otherwise False.
+        """
+        if self.isExcluded(parts):
+            return False
+        if self.__include is None:
+            return True
+        n = len(parts)
+        for pattern in self.__include:
+            if KeyPathFilter.__matches(pattern, parts, min(n, len(pattern))):
+                return True
+        return False
+
+    def isExcluded(self, parts:list[str]) -> bool:
+        """
+        Determines whether the key at `parts` falls under an exclusion.
+
+        :param parts: Normalized key parts, as returned by :py:meth:`split`.
+        :return: True if the key (and its subtree) is excluded, otherwise False.
+        """
+        n = len(parts)
+        for pattern in self.__exclude:
+            if len(pattern) <= n and KeyPathFilter.__matches(pattern, parts, len(pattern)):
+                return True
+        return False
+
+    def isSelected(self, parts:list[str]) -> bool:
+        """
+        Determines whether the key at `parts` is selected by the filter.
+
+        :param parts: Normalized key parts, as returned by :py:meth:`split`.
+        :return: True if the key is included and not excluded, otherwise False.
+        """
+        if self.isExcluded(parts):
+            return False
+        if self.__include is None:
+            return True
+        n = len(parts)
+        for pattern in self.__include:
+            if len(pattern) <= n and KeyPathFilter.__matches(pattern, parts, len(pattern)):
+                return True
+        return False
+
+    def prune(self, source:dict, parts:list[str] = None) -> dict:
+        """
+        Creates a copy of the dictionary `source` containing only the selected keys.
+
+        :param source: A dictionary of configuration data.
+        :param parts: Optional normalized key parts `source` is located at, defaults to None (the root.)
+        :return: A new dictionary, unselected subtrees are not copied.
+        """
+        parts = [] if parts is None else parts
+        result = {}
+        for k, v in source.items():
+            kparts = parts + KeyPathFilter.split(k)
+            if self.isSelected(kparts):
+                if isinstance(v, dict) and len(self.__exclude) > 0:
+                    v = self.prune(v, kparts)
+                result[k] = v
+            elif isinstance(v, dict) and self.canDescend(kparts):
+                v = self.prune(v, kparts)
+                if len(v) > 0:
+                    result[k] = v
+        return result
@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .Configuration import Configuration
+from .ConfigurationException import ConfigurationException
+import array
+import inspect
+import math
+import os
+import typing
+
+type any = typing.Any
+
+_MISSING = object()
+_HEADER = '''# generated by `python -m appsettings2 compile`, do not edit.
+#
+# `settings` is an instance of `{name}` bound from the configuration sources
+# listed in `SOURCES` (and environment variables starting with one of the
+# prefixes in `ENVIRONMENT`), call `isStale()` to determine whether the
+# sources have changed since this module was generated.
+'''
+
+def _fingerprint(sources:tuple[str, ...], environment:tuple[str, ...]) -> str:
+    import hashlib
+    import os
+    digest = hashlib.sha256()
+    for source in sources:
+        paths = [source]
+        if os.path.isdir(source):
+            paths = sorted(os.path.join(source, name) for name in os.listdir(source))
+        for path in paths:
+            digest.update(path.encode('utf-8') + b'\0')
+            try:
+                with open(path, 'rb') as file:
+                    digest.update(file.read())
+            except OSError:
+                digest.update(b'\0missing')
+            digest.update(b'\0')
+    prefixes = tuple(p.upper() for p in environment)
+    for name, value in sorted(os.environ.items()):
+        if name.upper().startswith(prefixes):
+            digest.update(f'{name}={value}'.encode('utf-8') + b'\0')
+    return f'sha256:{digest.hexdigest()}'
+
+class SettingsCompiler:
+    """
+    Generates a Python module containing a settings object bound from a :py:class:`~appsettings2.Configuration`, see ``python -m appsettings2 compile``.
+
+    Each settings class reachable from the settings type is emitted as a class with ``__slots__`` (or as a frozen dataclass), and configuration values are emitted as literals, so importing the generated module costs little more than loading its ``.pyc``. The generated module records a fingerprint of its sources, see :py:meth:`fingerprint`.
+    """
+
+    __classes:dict[type, tuple[str, dict[str, None]]]
+    __dataclasses:bool
+    __names:set[str]
+
+    def __init__(self, *, dataclasses:bool = False):
+        """
+        :param dataclasses: Option indicating whether or not settings classes are emitted as frozen dataclasses (with lists emitted as tuples) rather than classes with ``__slots__``, defaults to False.
+        """
+        self.__classes = {}
+        self.__dataclasses = dataclasses
+        # NOTE: names defined by the generated module
+        self.__names = set([ 'dataclasses', 'typing', 'FINGERPRINT', 'SOURCES', 'ENVIRONMENT', 'isStale', 'settings', '_fingerprint' ])
+
+    def __emitClass(self, name:str, fields:dict[str, None]) -> list[str]:
+        lines = []
+        if self.__dataclasses:
+            lines.append('@dataclasses.dataclass(frozen=True, slots=True)')
+            lines.append(f'class {name}:')
+            for field in fields:
+                lines.append(f'    {field}:typing.Any = None')
+            if len(fields) == 0:
+                lines.append('    pass')
+        else:
+            lines.append(f'class {name}:')
+            lines.append(f'    __slots__ = {tuple(fields)!r}')
+            lines.append('')
+            lines.append(f'    def __init__(self{"".join(f", {f}=None" for f in fields)}):')
+            for field in fields:
+                lines.append(f'        self.{field} = {field}')
+            if len(fields) == 0:
+                lines.append('        pass')
+        return lines
+
+    def __fields(self, target:object) -> list[str]:
+        hints = typing.get_type_hints(type(target))
+        names = list(hints)
+        names.extend(n for n in getattr(target, '__dict__', {}) if n not in hints)
+        return [n for n in names if not n.startswith('_') and n.isidentifier() and not callable(getattr(type(target), n, None))]
+
+    def __literal(self, value:any, depth:int) -> str:
+        if value is None or isinstance(value, bool | int | str | bytes):
+            return repr(value)
+        elif isinstance(value, float):
+            return repr(value) if math.isfinite(value) else f'float({str(value)!r})'
+        elif isinstance(value, array.array | memoryview):
+            return self.__literal(value.tolist(), depth)
+        elif isinstance(value, list | tuple):
+            elements = [self.__literal(e, depth + 1) for e in value]
+            start, end = ('(', ')') if self.__dataclasses or isinstance(value, tuple) else ('[', ']')
+            # NOTE: sequences of multi-line elements (such as settings objects) are emitted one element per line
+            multiline = '\n' in ''.join(elements)
+            if len(elements) == 1 and start == '(' and not multiline:
+                return f'({elements[0]},)'
+            return self.__sequence(start, elements, end, depth, multiline)
+        elif isinstance(value, dict):
+            return '{' + ', '.join(f'{self.__literal(k, depth + 1)}: {self.__literal(v, depth + 1)}' for k, v in value.items()) + '}'
+        elif isinstance(value, Configuration):
+            return self.__literal(value.toDictionary(), depth)
+        elif hasattr(value, '__dict__') and type(value).__module__ != 'builtins':
+            name, fields = self.__register(type(value))
+            args = []
+            for field in self.__fields(value):
+                v = getattr(value, field, _MISSING)
+                if v is _MISSING:
+                    continue
+                fields[field] = None
+                args.append(f'{field}={self.__literal(v, depth + 1)}')
+            return self.__sequence(f'{name}(', args, ')', depth, True)
+        raise ConfigurationException(f'Values of type `{type(value)}` cannot be compiled.')
+
+    def __sequence(self, start:str, elements:list[str], end:str, depth:int, multiline:bool) -> str:
+        if not multiline or len(elements) == 0:
+            return start + ', '.join(elements) + end
+        indent = '    ' * (depth + 1)
+        return start + '\n' + ''.join(f'{indent}{e},\n' for e in elements) + '    ' * depth + end
+
+    def __register(self, settingsType:type) -> tuple[str, dict[str, None]]:
+        entry = self.__classes.get(settingsType)
+        if entry is None:
+            name = settingsType.__name__
+            i = 1
+            while name in self.__names:
+                i += 1
+                name = f'{settingsType.__name__}{i}'
+            self.__names.add(name)
+            entry = (name, {})
+            self.__classes[settingsType] = entry
+        return entry
+
+    @staticmethod
+    def compile(configuration:Configuration, settingsType:type, *, sources:list[str] = None, environment:list[str] = None, dataclasses:bool = False) -> str:
+        """
+        Binds `configuration` to a new instance of `settingsType`, and generates the source code of a module containing the bound instance as ``settings``.
+
+        :param configuration: The :py:class:`~appsettings2.Configuration` to bind.
+        :param settingsType: The settings class to bind, it must be constructable without arguments.
+        :param sources: Optional list of the files (and directories) the configuration was built from, recorded in the generated module as ``SOURCES`` (as absolute paths, so that ``isStale()`` does not depend on the working directory) and fingerprinted, defaults to None.
+        :param environment: Optional list of the environment variable prefixes the configuration was built from, recorded in the generated module as ``ENVIRONMENT`` and fingerprinted, defaults to None.
+        :param dataclasses: Option indicating whether or not settings classes are emitted as frozen dataclasses rather than classes with ``__slots__``, defaults to False.
+        :return: The source code of the generated module.
+        """
+        sources = tuple(os.path.abspath(source) for source in sources or ())
+        environment = tuple(environment or ())
+        compiler = SettingsCompiler(dataclasses=dataclasses)
+        instance = compiler.__literal(configuration.bind(settingsType()), 0)
+        lines = [_HEADER.format(name=compiler.__classes[settingsType][0]).rstrip(), '']
+        if dataclasses:
+            lines.extend([ 'import dataclasses', 'import typing', '' ])
+        lines.append(f'FINGERPRINT = {SettingsCompiler.fingerprint(sources, environment)!r}')
+        lines.append(f'SOURCES = {sources!r}')
+        lines.append(f'ENVIRONMENT = {environment!r}')
+        for name, fields in compiler.__classes.values():
+            lines.extend([ '', '' ])
+            lines.extend(compiler.__emitClass(name, fields))
+        lines.extend([ '', '' ])
+        lines.append(inspect.getsource(_fingerprint).rstrip())
+        lines.extend([ '', '' ])
+        lines.append('def isStale() -> bool:')
+        lines.append('    """Determines whether the sources of this module have changed since it was generated."""')
+        lines.append('    return _fingerprint(SOURCES, ENVIRONMENT) != FINGERPRINT')
+        lines.extend([ '', '' ])
+        lines.append(f'settings = {instance}')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def fingerprint(sources:list[str], environment:list[str] = None) -> str:
+        """
+        Computes a fingerprint of the contents of configuration sources.
+
+        :param sources: A list of files (and directories, whose files are fingerprinted) to fingerprint.
+        :param environment: Optional list of environment variable prefixes, variables starting with any of the prefixes are fingerprinted, defaults to None.
+        :return: The fingerprint, as a string.
+        """
+        return _fingerprint(tuple(sources), tuple(environment or ()))
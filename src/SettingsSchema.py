@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .ConfigurationException import ConfigurationException
+import types
+import typing
+
+type any = typing.Any
+
+_FALSE_LITERALS = frozenset(['false', '0', 'no', 'off', 'n', ''])
+_TRUE_LITERALS = frozenset(['true', '1', 'yes', 'on', 'y'])
+
+class SettingsSchema:
+    """
+    Describes the configuration keys, and their types, expected by a settings type.
+
+    A schema can be compiled from a settings class (following the same type hint rules as :py:meth:`~appsettings2.Configuration.bind`) or from a dictionary mapping configuration keys to types, such as ``{ 'Database:Port': int, 'Endpoints': list[str] }``. Keys are case-insensitive, and keys beneath a `dict`, `list`, or un-typed member are always allowed.
+    """
+
+    __root:dict[str, any]
+
+    def __init__(self, source:type|dict[str, type]):
+        """
+        :param source: A settings class, or a dictionary mapping configuration keys to types.
+        """
+        if isinstance(source, dict):
+            self.__root = {}
+            for key, hint in source.items():
+                parts = key.upper().replace(':', '__').split('__')
+                node = self.__root
+                for part in parts[:-1]:
+                    child = node.get(part)
+                    if not isinstance(child, dict):
+                        child = {}
+                        node[part] = child
+                    node = child
+                node[parts[-1]] = SettingsSchema.__compileHint(hint, {})
+        elif isinstance(source, type):
+            self.__root = SettingsSchema.__compileType(source, {})
+        else:
+            raise ConfigurationException(f'Unsupported schema source `{type(source)}`.')
+
+    @staticmethod
+    def __compileHint(hint:any, memo:dict[type, dict]) -> any:
+        if hint is int or hint is float or hint is str or hint is bool:
+            return hint
+        origin = typing.get_origin(hint)
+        if origin is typing.Union or origin is types.UnionType:
+            args = [a for a in typing.get_args(hint) if a is not type(None)]
+            return SettingsSchema.__compileHint(args[0], memo) if len(args) == 1 else typing.Any
+        elif origin is not None or hint is list or hint is dict:
+            return hint
+        elif isinstance(hint, type) and hint.__module__ != 'builtins':
+            return SettingsSchema.__compileType(hint, memo)
+        return typing.Any
+
+    @staticmethod
+    def __compileType(settingsType:type, memo:dict[type, dict]) -> dict:
+        node = memo.get(settingsType)
+        if node is not None:
+            # NOTE: self-referencing types share a node, the schema is a graph rather than a tree
+            return node
+        node = {}
+        memo[settingsType] = node
+        hints = typing.get_type_hints(settingsType)
+        for name in set(dir(settingsType)) | hints.keys():
+            if name.startswith('_'):
+                continue
+            hint = hints.get(name)
+            if hint is None:
+                prop = getattr(settingsType, name, None)
+                if not isinstance(prop, property) or prop.fget is None:
+                    continue
+                hint = typing.get_type_hints(prop.fget).get('return')
+                if hint is None:
+                    continue
+            node[name.upper()] = SettingsSchema.__compileHint(hint, memo)
+        return node
+
+    @staticmethod
+    def convert(value:any, hint:any) -> any:
+        """
+        Converts `value` to the type `hint` using the same rules as :py:meth:`~appsettings2.Configuration.bind`, with the addition of parsing `bool` from common literals (``true``/``false``, ``1``/``0``, ``yes``/``no``, ``on``/``off``.)
+
+        :param value: The value to be converted.
+        :param hint: The target type, values are returned as-is for types other than `bool`, `float`, `int`, and `str`.
+        :return: The converted value.
+        """
+        try:
+            if hint is bool:
+                if isinstance(value, str):
+                    v = value.strip().lower()
+                    if v in _TRUE_LITERALS:
+                        return True
+                    elif v in _FALSE_LITERALS:
+                        return False
+                    raise ValueError(value)
+                return bool(value)
+            elif hint is int or hint is float or hint is str:
+                return value if type(value) is hint else hint(value)
+            return value
+        except (TypeError, ValueError):
+            raise ConfigurationException(f'Cannot convert `{value}` to `{hint.__name__}`.')
+
+    @staticmethod
+    def __isOpen(hint:any) -> bool:
+        return not (hint is int or hint is float or hint is str or hint is bool)
+
+    def getType(self, key:str) -> any:
+        """
+        Gets the type expected for the specified `key`.
+
+        :param key: The configuration key to get the type of. Supports `__` and `:` hierarchical delimiters.
+        :return: The type hint of the member `key` binds to, otherwise None if `key` is unknown or is not a leaf of the schema.
+        """
+        node = self.__root
+        for part in key.upper().replace(':', '__').split('__'):
+            if not isinstance(node, dict):
+                return None
+            node = node.get(part)
+            if node is None:
+                return None
+        return None if isinstance(node, dict) else node
+
+    def isAllowed(self, key:str) -> bool:
+        """
+        Determines whether the specified `key` would be bound by the schema.
+
+        :param key: The configuration key to check. Supports `__` and `:` hierarchical delimiters.
+        :return: True if `key` is a leaf of the schema, or lies beneath an open (`dict`, `list`, or un-typed) member, otherwise False.
+        """
+        node = self.__root
+        for part in key.upper().replace(':', '__').split('__'):
+            if not isinstance(node, dict):
+                return SettingsSchema.__isOpen(node)
+            node = node.get(part)
+            if node is None:
+                return False
+        return not isinstance(node, dict)
@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .Configuration import Configuration
+from .ConfigurationException import ConfigurationException
+from .FrozenConfiguration import FrozenConfiguration
+from multiprocessing import resource_tracker, shared_memory
+import struct
+import typing
+
+type any = typing.Any
+
+_MAGIC = b'AS2G'
+_CONTROL = struct.Struct('<4sQ')
+
+class SharedConfiguration:
+    """
+    Publishes :py:class:`~appsettings2.FrozenConfiguration` data through `multiprocessing.shared_memory`, so that any number of worker processes can read one copy of a configuration.
+
+    A small control segment named `name` holds the current generation number, each generation is published into its own segment named `{name}_{generation}`. Workers attach with ``create=False`` and call :py:meth:`view`, which re-attaches whenever a newer generation has been published.
+    """
+
+    __control:shared_memory.SharedMemory
+    __create:bool
+    __generation:int
+    __name:str
+    __retired:list[shared_memory.SharedMemory]
+    __segments:dict[int, shared_memory.SharedMemory]
+    __view:FrozenConfiguration
+
+    def __init__(self, name:str, *, create:bool = False):
+        """
+        :param name: The name of the shared configuration, shared by the publishing process and all reading processes.
+        :param create: True if this instance publishes the configuration (creating the control segment), defaults to False which attaches to an existing shared configuration.
+        """
+        self.__create = create
+        self.__generation = -1
+        self.__name = name
+        self.__retired = []
+        self.__segments = {}
+        self.__view = None
+        if create:
+            self.__control = shared_memory.SharedMemory(name, create=True, size=_CONTROL.size)
+            _CONTROL.pack_into(self.__control.buf, 0, _MAGIC, 0)
+        else:
+            self.__control = SharedConfiguration.__attach(name)
+            if bytes(self.__control.buf[:4]) != _MAGIC:
+                self.__control.close()
+                raise ConfigurationException(f'Shared memory `{name}` is not a shared configuration.')
+
+    @staticmethod
+    def __attach(name:str) -> shared_memory.SharedMemory:
+        try:
+            return shared_memory.SharedMemory(name, track=False)
+        except TypeError:
+            # NOTE: prior to Python 3.13 attaching registers the segment with the resource tracker, which would unlink it when this process exits
+            segment = shared_memory.SharedMemory(name)
+            resource_tracker.unregister(segment._name, 'shared_memory')
+            return segment
+
+    def __release(self, generation:int) -> None:
+        segment = self.__segments.pop(generation, None)
+        if segment is not None:
+            # NOTE: views of this generation may still be referenced, in which case the mapping is closed once they have been collected
+            self.__retired.append(segment)
+            self.__sweep()
+            if self.__create:
+                try:
+                    segment.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def __sweep(self) -> None:
+        retired = []
+        for segment in self.__retired:
+            try:
+                segment.close()
+            except BufferError:
+                retired.append(segment)
+        self.__retired = retired
+
+    def close(self) -> None:
+        """Detaches from all shared memory segments, without removing them. Views obtained from :py:meth:`view` must not be used afterwards."""
+        self.__view = None
+        self.__generation = -1
+        self.__retired.extend(self.__segments.values())
+        self.__segments.clear()
+        self.__sweep()
+        self.__control.close()
+
+    def getGeneration(self) -> int:
+        """
+        Gets the generation number most recently published.
+
+        :return: The current generation number, 0 if nothing has been published.
+        """
+        return _CONTROL.unpack_from(self.__control.buf, 0)[1]
+
+    def publish(self, configuration:Configuration|FrozenConfiguration) -> int:
+        """
+        Publishes `configuration` as a new generation. Readers observe the new generation on their next call to :py:meth:`view`.
+
+        The segment of the generation before the previous generation is removed, readers which are still attached to it keep their mapping until they detach.
+
+        :param configuration: The configuration to publish, its options are recorded, see :py:meth:`~appsettings2.FrozenConfiguration.getOptions`.
+        :return: The generation number of the published configuration.
+        """
+        if not self.__create:
+            raise ConfigurationException('Only the creator of a shared configuration can publish.')
+        generation = self.getGeneration() + 1
+        data = FrozenConfiguration.freeze(configuration, generation=generation, options=configuration.getOptions())
+        segment = shared_memory.SharedMemory(f'{self.__name}_{generation}', create=True, size=len(data))
+        segment.buf[:len(data)] = data
+        self.__segments[generation] = segment
+        _CONTROL.pack_into(self.__control.buf, 0, _MAGIC, generation)
+        # NOTE: the previous generation is retained so readers which have just read the control segment can still attach
+        self.__release(generation - 2)
+        return generation
+
+    def unlink(self) -> None:
+        """Removes the control segment, and any segments published by this instance. Call once, from the publishing process, before :py:meth:`close`."""
+        for segment in self.__segments.values():
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+        try:
+            self.__control.unlink()
+        except FileNotFoundError:
+            pass
+
+    def view(self) -> FrozenConfiguration:
+        """
+        Gets a read-only view of the current generation, attaching to it if it is newer than the generation last viewed.
+
+        :return: A :py:class:`~appsettings2.FrozenConfiguration` of the current generation.
+        """
+        while True:
+            generation = self.getGeneration()
+            if generation == 0:
+                raise ConfigurationException(f'Nothing has been published to `{self.__name}`.')
+            if generation == self.__generation:
+                return self.__view
+            segment = self.__segments.get(generation)
+            if segment is None:
+                try:
+                    segment = SharedConfiguration.__attach(f'{self.__name}_{generation}')
+                except FileNotFoundError:
+                    # NOTE: a newer generation was published (and this one removed) since the control segment was read
+                    if self.getGeneration() == generation:
+                        raise
+                    continue
+                self.__segments[generation] = segment
+            previous = self.__generation
+            self.__view = FrozenConfiguration(segment.buf)
+            self.__generation = generation
+            if not self.__create:
+                self.__release(previous)
+            elif len(self.__retired) > 0:
+                self.__sweep()
+            return self.__view
@@ -3,7 +3,56 @@
 
 __version__ = '0.0.0'
 
-from .providers import *
+from . import providers
 from .Configuration import Configuration
+from .ConfigurationAccessor import ConfigurationAccessor
 from .ConfigurationBuilder import ConfigurationBuilder
 from .ConfigurationException import ConfigurationException
+from .ConfigurationList import ConfigurationList, ConfigurationTuple
+from .ConfigurationMetrics import BindMetrics, BuildMetrics, ConfigurationMetrics, ProviderMetrics
+from .ConfigurationProfiler import ConfigurationProfiler
+from .KeyPathFilter import KeyPathFilter
+from .SettingsSchema import SettingsSchema
+from .providers import ConfigurationProvider, _LazyModule
+import importlib
+import sys
+
+# NOTE: the following (and the providers, see `appsettings2.providers`) are imported on first use
+_LAZY = (
+    'FrozenConfiguration',
+    'SettingsCompiler',
+    'SharedConfiguration'
+)
+
+__all__ = [
+    'BindMetrics',
+    'BuildMetrics',
+    'Configuration',
+    'ConfigurationAccessor',
+    'ConfigurationBuilder',
+    'ConfigurationException',
+    'ConfigurationList',
+    'ConfigurationMetrics',
+    'ConfigurationProfiler',
+    'ConfigurationTuple',
+    'KeyPathFilter',
+    'ProviderMetrics',
+    'SettingsSchema',
+    *_LAZY,
+    *providers.__all__
+]
+
+sys.modules[__name__].__class__ = _LazyModule
+
+def __getattr__(name:str) -> type:
+    if name in _LAZY:
+        importlib.import_module(f'.{name}', __name__)
+        return globals()[name]
+    elif name in providers._PROVIDERS:
+        o = getattr(providers, name)
+        globals()[name] = o
+        return o
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
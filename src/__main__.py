@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+#
+# usage:
+#
+#   python -m appsettings2 dump appsettings.json appsettings.Production.yaml --env MYAPP__
+#   python -m appsettings2 get Database:Host appsettings.json --env MYAPP__
+#   python -m appsettings2 diff appsettings.json appsettings.json,appsettings.Production.yaml
+#   python -m appsettings2 snapshot appsettings.json --output appsettings.bin
+#   python -m appsettings2 time appsettings.json conf.d --env MYAPP__
+#   python -m appsettings2 compile appsettings.json --settings myapp.settings:AppSettings --output myapp/_settings.py
+##
+
+from .Configuration import Configuration
+from .ConfigurationBuilder import ConfigurationBuilder
+from .ConfigurationException import ConfigurationException
+from .ConfigurationMetrics import ConfigurationMetrics
+from . import providers as _providers
+from .SettingsCompiler import SettingsCompiler
+from .providers import ConfigurationProvider
+import argparse
+import array
+import importlib
+import json
+import os
+import sys
+import time
+import typing
+
+type any = typing.Any
+
+_MISSING = object()
+
+def _addSourceArguments(parser:argparse.ArgumentParser, sources:bool = True) -> None:
+    if sources:
+        parser.add_argument('sources', nargs='*', metavar='SOURCE', help='configuration files (.json, .yaml, .yml, .toml, .env) and directories, in order of precedence')
+    parser.add_argument('--env', action='append', default=[], metavar='PREFIX', help='load environment variables starting with PREFIX (the prefix is removed from keys), can be specified more than once')
+    parser.add_argument('--interpolate', action='store_true', help='resolve ${Key} references')
+
+def _build(sources:list[str], args:argparse.Namespace) -> Configuration:
+    builder = ConfigurationBuilder(interpolate=args.interpolate)
+    for _, factory in _createProviders(sources, args.env):
+        builder.addProvider(factory())
+    return builder.build()
+
+def _createProviders(sources:list[str], environment:list[str]) -> list[tuple[str, typing.Callable[[], ConfigurationProvider]]]:
+    """Creates a (description, provider factory) pair for each source, constructing a provider may read and parse its source."""
+    providers = []
+    for source in sources:
+        name = os.path.basename(source).lower()
+        ext = os.path.splitext(name)[1]
+        if os.path.isdir(source):
+            providers.append((source, lambda source=source: _providers.DirectoryConfigurationProvider(source)))
+        elif ext == '.json':
+            providers.append((source, lambda source=source: _providers.JsonConfigurationProvider(source)))
+        elif ext == '.yaml' or ext == '.yml':
+            providers.append((source, lambda source=source: _providers.YamlConfigurationProvider(source)))
+        elif ext == '.toml':
+            providers.append((source, lambda source=source: _providers.TomlConfigurationProvider(source)))
+        elif ext == '.env' or name.startswith('.env'):
+            providers.append((source, lambda source=source: _providers.DotEnvConfigurationProvider(source)))
+        else:
+            raise ConfigurationException(f'Unsupported configuration source `{source}`.')
+    if len(environment) > 0:
+        providers.append((f'env:{",".join(environment)}', lambda: _providers.EnvironmentConfigurationProvider(include=environment, strip=True)))
+    return providers
+
+def _flatten(value:any, prefix:str, results:dict[str, any]) -> dict[str, any]:
+    if isinstance(value, dict):
+        for k, v in value.items():
+            _flatten(v, k if prefix is None else f'{prefix}:{k}', results)
+    else:
+        results[prefix] = value
+    return results
+
+def _importType(name:str) -> type:
+    module, _, qualname = name.partition(':')
+    if len(module) == 0 or len(qualname) == 0:
+        raise ConfigurationException(f'Expected `module:Class`, not `{name}`.')
+    if '' not in sys.path and os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    o = importlib.import_module(module)
+    for part in qualname.split('.'):
+        o = getattr(o, part)
+    return o
+
+def _plain(value:any) -> any:
+    if isinstance(value, Configuration):
+        return value.toDictionary()
+    elif isinstance(value, array.array | memoryview):
+        return value.tolist()
+    elif isinstance(value, list | tuple):
+        return [_plain(e) for e in value]
+    return value
+
+def _write(output:str|None, text:str|bytes) -> None:
+    if output is None or output == '-':
+        if isinstance(text, bytes):
+            sys.stdout.buffer.write(text)
+        else:
+            sys.stdout.write(text)
+    else:
+        with open(output, 'wb' if isinstance(text, bytes) else 'w', encoding=None if isinstance(text, bytes) else 'utf-8') as file:
+            file.write(text)
+
+def _compile(args:argparse.Namespace) -> int:
+    configuration = _build(args.sources, args)
+    text = SettingsCompiler.compile(configuration, _importType(args.settings), sources=args.sources, environment=args.env, dataclasses=args.dataclasses)
+    _write(args.output, text)
+    return 0
+
+def _diff(args:argparse.Namespace) -> int:
+    left = _flatten(_build([s for s in args.left.split(',') if s], args).toDictionary(), None, {})
+    right = _flatten(_build([s for s in args.right.split(',') if s], args).toDictionary(), None, {})
+    differences = 0
+    for key in sorted(left.keys() | right.keys(), key=str.upper):
+        a = left.get(key, _MISSING)
+        b = right.get(key, _MISSING)
+        if a is _MISSING:
+            print(f'+ {key} = {json.dumps(b, default=str)}')
+        elif b is _MISSING:
+            print(f'- {key} = {json.dumps(a, default=str)}')
+        elif type(a) is not type(b) or a != b:
+            print(f'~ {key} = {json.dumps(a, default=str)} -> {json.dumps(b, default=str)}')
+        else:
+            continue
+        differences += 1
+    return 1 if differences > 0 else 0
+
+def _dump(args:argparse.Namespace) -> int:
+    data = _build(args.sources, args).toDictionary()
+    write = sys.stdout.write
+    if args.format == 'flat':
+        for key, value in _flatten(data, None, {}).items():
+            write(f'{key}={value if isinstance(value, str) else json.dumps(value, default=str)}\n')
+    else:
+        # NOTE: the document is encoded and written incrementally, rather than as a single string
+        for chunk in json.JSONEncoder(indent=args.indent, ensure_ascii=False, default=str).iterencode(data):
+            write(chunk)
+        write('\n')
+    return 0
+
+def _get(args:argparse.Namespace) -> int:
+    value = _build(args.sources, args).get(args.key, _MISSING)
+    if value is _MISSING:
+        print(f'error: `{args.key}` does not exist.', file=sys.stderr)
+        return 1
+    value = _plain(value)
+    print(value if isinstance(value, str) else json.dumps(value, indent=args.indent, ensure_ascii=False, default=str))
+    return 0
+
+def _snapshot(args:argparse.Namespace) -> int:
+    _write(args.output, _build(args.sources, args).dumpb())
+    return 0
+
+def _time(args:argparse.Namespace) -> int:
+    start = time.perf_counter()
+    metrics = ConfigurationMetrics()
+    builder = ConfigurationBuilder(interpolate=args.interpolate, metrics=metrics)
+    names = []
+    for name, factory in _createProviders(args.sources, args.env):
+        # NOTE: constructing a provider may read and parse its source, which is reported by the first build
+        builder.addProvider(factory())
+        names.append(name)
+    builder.build()
+    elapsed = time.perf_counter() - start
+    build = metrics.getBuilds()[-1]
+    print(f'{"source":<40} {"bytes":>10} {"read":>12} {"parse":>12} {"merge":>12} {"keys":>8}')
+    for name, p in zip(names, build.providers):
+        print(f'{name[-40:]:<40} {p.bytesRead:>10} {p.readTime * 1000:>9.3f} ms {p.parseTime * 1000:>9.3f} ms {p.mergeTime * 1000:>9.3f} ms {p.keys:>8}')
+    if args.interpolate:
+        print(f'{"(interpolate)":<40} {"":>10} {"":>12} {"":>12} {build.interpolateTime * 1000:>9.3f} ms')
+    print(f'{"(total)":<40} {build.getBytesRead():>10} {"":>12} {"":>12} {elapsed * 1000:>9.3f} ms {build.getKeys():>8}')
+    return 0
+
+def main(argv:list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m appsettings2', description='Builds configurations from configuration sources.')
+    commands = parser.add_subparsers(dest='command', required=True, metavar='COMMAND')
+    p = commands.add_parser('dump', help='write the configuration to stdout')
+    _addSourceArguments(p)
+    p.add_argument('--format', choices=[ 'json', 'flat' ], default='json', help='`json`, or `flat` for one `Key=Value` line per value, defaults to `json`')
+    p.add_argument('--indent', type=int, default=2, help='json indentation, defaults to 2')
+    p.set_defaults(handler=_dump)
+    p = commands.add_parser('get', help='write the value of a single key to stdout')
+    p.add_argument('key', metavar='KEY', help='the configuration key, such as `Database:Host`')
+    _addSourceArguments(p)
+    p.add_argument('--indent', type=int, default=None, help='json indentation of non-string values')
+    p.set_defaults(handler=_get)
+    p = commands.add_parser('diff', help='compare the configurations built from two sets of sources, exits with 1 if they differ')
+    p.add_argument('left', metavar='LEFT', help='comma-separated configuration sources')
+    p.add_argument('right', metavar='RIGHT', help='comma-separated configuration sources')
+    _addSourceArguments(p, sources=False)
+    p.set_defaults(handler=_diff)
+    p = commands.add_parser('snapshot', help='write a binary snapshot of the configuration, see `Configuration.loadb()`')
+    _addSourceArguments(p)
+    p.add_argument('-o', '--output', required=True, metavar='FILE', help='the file to write, `-` for stdout')
+    p.set_defaults(handler=_snapshot)
+    p = commands.add_parser('time', help='measure the time taken to read, parse and merge each source, see `ConfigurationMetrics`')
+    _addSourceArguments(p)
+    p.set_defaults(handler=_time)
+    p = commands.add_parser('compile', help='generate a Python module containing a settings object bound from the configuration')
+    _addSourceArguments(p)
+    p.add_argument('--settings', required=True, metavar='MODULE:CLASS', help='the settings class to bind, such as `myapp.settings:AppSettings`')
+    p.add_argument('--dataclasses', action='store_true', help='emit frozen dataclasses rather than classes with __slots__')
+    p.add_argument('-o', '--output', metavar='FILE', help='the file to write, defaults to stdout')
+    p.set_defaults(handler=_compile)
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except ConfigurationException as ex:
+        print(f'error: {ex}', file=sys.stderr)
+        return 2
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,24 +3,84 @@
 
 from .ConfigurationProvider import ConfigurationProvider
 from ..Configuration import Configuration
+from ..ConfigurationException import ConfigurationException
+from ..SettingsSchema import SettingsSchema
 import sys
+import typing
+
+type any = typing.Any
 
 class CommandLineConfigurationProvider(ConfigurationProvider):
     """
     Populates configuration data from Command-Line arguments.
+
+    When a `schema` is provided values are converted to the types expected by the schema as they are parsed, so typed values are stored in the :py:class:`~appsettings2.Configuration`. Additionally, keys of a `list` type collect every occurrence of the key into a list, and keys of a `bool` type are treated as switches which can be negated with a ``no-`` prefix (for example ``--no-Verbose``.)
     """
 
     __argv:list[str]
+    __schema:SettingsSchema
+    __specs:dict[str, tuple]
 
-    def __init__(self, argv:list[str] = None):
+    def __init__(self, argv:list[str] = None, *, schema:type|dict[str, type]|SettingsSchema = None):
         """
         :param argv: Optional arg list used in lieu of `sys.argv`, defaults to None.
+        :param schema: Optional settings class, dictionary mapping keys to types, or :py:class:`~appsettings2.SettingsSchema` used to convert values, defaults to None which stores all values as strings (or `True` for switches.)
         """
         self.__argv = argv if argv is not None else sys.argv
+        self.__schema = schema if schema is None or isinstance(schema, SettingsSchema) else SettingsSchema(schema)
+        self.__specs = {}
+
+    def __getSpec(self, key:str) -> tuple|None:
+        """Gets a memoized `(hint, elementType)` tuple for `key`, or None if `key` is not typed by the schema."""
+        k = key.upper().replace(':', '__')
+        if k in self.__specs:
+            return self.__specs[k]
+        spec = None
+        hint = self.__schema.getType(key)
+        if hint is bool or hint is int or hint is float or hint is str:
+            spec = (hint, None)
+        elif hint is list or typing.get_origin(hint) is list:
+            args = typing.get_args(hint)
+            spec = (list, args[0] if len(args) > 0 else str)
+        self.__specs[k] = spec
+        return spec
+
+    def __setSwitch(self, configuration:Configuration, lists:dict, key:str) -> None:
+        if self.__schema is not None and self.__getSpec(key) is None and key[0:3].lower() == 'no-':
+            spec = self.__getSpec(key[3:])
+            if spec is not None and spec[0] is bool:
+                configuration.set(key[3:], False)
+                return
+        self.__setValue(configuration, lists, key, True)
+
+    def __setValue(self, configuration:Configuration, lists:dict, key:str, value:any) -> None:
+        spec = None if self.__schema is None else self.__getSpec(key)
+        if spec is None:
+            configuration.set(key, value)
+            return
+        hint, elementType = spec
+        if value is True and hint is not bool:
+            raise ConfigurationException(f'Missing value for argument: {key}')
+        if elementType is None:
+            configuration.set(key, SettingsSchema.convert(value, hint))
+        else:
+            k = key.upper().replace(':', '__')
+            if k not in lists:
+                lists[k] = (key, [])
+            lists[k][1].append(SettingsSchema.convert(value, elementType))
+
+    def __isSwitch(self, key:str) -> bool:
+        if self.__schema is None:
+            return False
+        spec = self.__getSpec(key)
+        if spec is None and key[0:3].lower() == 'no-':
+            spec = self.__getSpec(key[3:])
+        return spec is not None and spec[0] is bool
 
     def populateConfiguration(self, configuration:Configuration):
         if self.__argv is None:
             return
+        lists = {}
         pending_key = None
         for arg in self.__argv:
             safe_arg = arg.lstrip('-')
@@ -28,16 +88,24 @@ class CommandLineConfigurationProvider(ConfigurationProvider):
             if pending_key is not None:
                 if (not arg.startswith('-')) and (eqidx < 1):
                     v = safe_arg.lstrip('=')
-                    configuration.set(pending_key, v)
+                    self.__setValue(configuration, lists, pending_key, v)
                     pending_key = None
+                    continue
                 else:
-                    configuration.set(pending_key, True)
+                    self.__setSwitch(configuration, lists, pending_key)
                     pending_key = None
             if eqidx > 0:
                 k = safe_arg[0:eqidx]
                 v = safe_arg[eqidx+1:len(safe_arg)]
-                configuration.set(k, v)
+                self.__setValue(configuration, lists, k, v)
             else:
-                pending_key = safe_arg.lstrip('=')
+                k = safe_arg.lstrip('=')
+                if self.__isSwitch(k):
+                    # NOTE: typed switches never consume the following argument as their value
+                    self.__setSwitch(configuration, lists, k)
+                else:
+                    pending_key = k
         if pending_key is not None:
-            configuration.set(pending_key, True)
+            self.__setSwitch(configuration, lists, pending_key)
+        for key, values in lists.values():
+            configuration.set(key, values)
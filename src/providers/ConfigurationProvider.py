@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 from ..Configuration import Configuration
+from ..ConfigurationMetrics import ProviderMetrics
 from abc import ABC as abstract, abstractmethod
 
 class ConfigurationProvider(abstract):
@@ -9,6 +10,20 @@ class ConfigurationProvider(abstract):
     The abstract base class which all Configuration Providers implement.
     """
 
+    __metrics:ProviderMetrics = None
+
+    def getMetrics(self) -> ProviderMetrics:
+        """
+        Gets the cumulative read and parse metrics of the provider, see :py:class:`~appsettings2.ConfigurationMetrics`.
+
+        Providers record the bytes they read and the time spent reading and parsing their source (whenever it is read, including when the provider is constructed) with :py:meth:`~appsettings2.ProviderMetrics.addRead` and :py:meth:`~appsettings2.ProviderMetrics.addParse`, merge times and key counts are measured by the :py:class:`~appsettings2.ConfigurationBuilder`.
+
+        :return: A :py:class:`~appsettings2.ProviderMetrics` object.
+        """
+        if self.__metrics is None:
+            self.__metrics = ProviderMetrics(type(self).__name__)
+        return self.__metrics
+
     @abstractmethod
     def populateConfiguration(self, configuration:Configuration) -> None:
         """
@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .ConfigurationProvider import ConfigurationProvider
+from .JsonConfigurationProvider import JsonConfigurationProvider
+from .TomlConfigurationProvider import TomlConfigurationProvider
+from .YamlConfigurationProvider import YamlConfigurationProvider
+from ..Configuration import Configuration, _copyRaw
+from ..ConfigurationException import ConfigurationException
+from ..KeyPathFilter import KeyPathFilter
+from concurrent.futures import ThreadPoolExecutor
+import fnmatch
+import os
+import re
+import time
+from typing import Any, Callable
+
+type any = Any
+
+_EXTENSIONS:dict[str, Callable[[str], ConfigurationProvider]] = {
+    '.json': JsonConfigurationProvider,
+    '.toml': TomlConfigurationProvider,
+    '.yaml': YamlConfigurationProvider,
+    '.yml': YamlConfigurationProvider
+}
+
+class _ConfigurationRecorder:
+    """Records the `set` calls made by a provider so they can be replayed later, in order, on another thread."""
+
+    __keyfilter:KeyPathFilter
+    records:list[tuple[str, any]]
+
+    def __init__(self, keyfilter:KeyPathFilter):
+        self.__keyfilter = keyfilter
+        self.records = []
+
+    def getKeyFilter(self) -> KeyPathFilter|None:
+        return self.__keyfilter
+
+    def set(self, key:str, value:any) -> None:
+        self.records.append((key, value))
+
+class DirectoryConfigurationProvider(ConfigurationProvider):
+    """
+    Populates structured configuration data from a directory of configuration fragments, such as ``conf.d/``.
+
+    Files matching `pattern` are read and parsed on a thread pool by the provider matching their extension (:py:class:`~appsettings2.providers.JsonConfigurationProvider`, :py:class:`~appsettings2.providers.TomlConfigurationProvider`, or :py:class:`~appsettings2.providers.YamlConfigurationProvider`) and then merged in order of their file names, so later files take precedence over earlier files. Parse results are cached by modification time and size, subsequent populations only re-parse files which have changed.
+
+    Parsing JSON, YAML and TOML is CPU-bound and holds the GIL, so the thread pool overlaps reading files (and waiting on slow or network file systems) rather than parsing itself; on a free-threaded interpreter files are also parsed in parallel.
+    """
+
+    __cache:dict[str, tuple[int, int, KeyPathFilter, list[tuple[str, any]]]]
+    __maxWorkers:int
+    __path:str
+    __pattern:re.Pattern
+    __required:bool
+
+    def __init__(self, path:str, *, pattern:str = '*.{json,yaml,yml,toml}', required:bool = True, maxWorkers:int = None):
+        """
+        :param path: Path to a directory containing configuration files.
+        :param pattern: Optional `fnmatch`-style file name pattern, supports brace expansion such as ``*.{json,toml}``, defaults to ``*.{json,yaml,yml,toml}``.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified directory is missing, defaults to True.
+        :param maxWorkers: Optional maximum number of files read (and parsed) concurrently, defaults to None which uses the `ThreadPoolExecutor` default.
+        """
+        if required and not os.path.isdir(path):
+            raise ConfigurationException(f'Missing required directory: {path}')
+        self.__cache = {}
+        self.getMetrics().source = path
+        self.__maxWorkers = maxWorkers
+        self.__path = path
+        self.__pattern = re.compile('|'.join(fnmatch.translate(p) for p in DirectoryConfigurationProvider.__expandBraces(pattern)))
+        self.__required = required
+
+    @staticmethod
+    def __expandBraces(pattern:str) -> list[str]:
+        m = re.search(r'\{([^{}]*)\}', pattern)
+        if m is None:
+            return [pattern]
+        results = []
+        for alternative in m[1].split(','):
+            results.extend(DirectoryConfigurationProvider.__expandBraces(pattern[:m.start()] + alternative + pattern[m.end():]))
+        return results
+
+    @staticmethod
+    def __parse(filepath:str, keyfilter:KeyPathFilter) -> tuple[list[tuple[str, any]], int, float, float]:
+        """Parses `filepath`, returning the recorded `set` calls, the number of bytes read, and the time spent reading and parsing."""
+        factory = _EXTENSIONS.get(os.path.splitext(filepath)[1].lower())
+        if factory is None:
+            raise ConfigurationException(f'Unsupported configuration file type: {filepath}')
+        recorder = _ConfigurationRecorder(keyfilter)
+        provider = factory(filepath)
+        start = time.perf_counter()
+        provider.populateConfiguration(recorder)
+        elapsed = time.perf_counter() - start
+        metrics = provider.getMetrics()
+        # NOTE: whatever the provider did not report as reading (including recording its `set` calls) is parsing
+        return (recorder.records, metrics.bytesRead, metrics.readTime, max(metrics.parseTime, elapsed - metrics.readTime))
+
+    def __scan(self) -> list[os.DirEntry]:
+        with os.scandir(self.__path) as it:
+            entries = [e for e in it if e.is_file() and self.__pattern.match(e.name) is not None]
+        entries.sort(key=lambda e: e.name)
+        return entries
+
+    def populateConfiguration(self, configuration:Configuration):
+        if not os.path.isdir(self.__path):
+            if self.__required:
+                raise ConfigurationException(f'Missing required directory: {self.__path}')
+            return
+        keyfilter = configuration.getKeyFilter()
+        metrics = self.getMetrics()
+        start = time.perf_counter()
+        entries = self.__scan()
+        cache = {}
+        pending = []
+        for entry in entries:
+            st = entry.stat()
+            cached = self.__cache.get(entry.path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size and cached[2] is keyfilter:
+                cache[entry.path] = cached
+            else:
+                pending.append((entry.path, st))
+        # NOTE: scanning the directory is measured as reading, files are read and parsed concurrently so their read and parse times are summed across workers
+        metrics.addRead(0, time.perf_counter() - start)
+        results = []
+        if len(pending) == 1:
+            filepath, st = pending[0]
+            results.append((filepath, st, DirectoryConfigurationProvider.__parse(filepath, keyfilter)))
+        elif len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=self.__maxWorkers) as executor:
+                futures = [(filepath, st, executor.submit(DirectoryConfigurationProvider.__parse, filepath, keyfilter)) for filepath, st in pending]
+                for filepath, st, future in futures:
+                    results.append((filepath, st, future.result()))
+        for filepath, st, (records, size, readTime, parseTime) in results:
+            cache[filepath] = (st.st_mtime_ns, st.st_size, keyfilter, records)
+            metrics.addRead(size, readTime)
+            metrics.addParse(parseTime)
+        # NOTE: replacing the cache also evicts files which no longer exist
+        self.__cache = cache
+        for entry in entries:
+            for key, value in cache[entry.path][3]:
+                # NOTE: cached values are copied, so that changes made to (nested) lists of a populated configuration do not leak into the cache
+                configuration.set(key, _copyRaw(value))
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .ConfigurationProvider import ConfigurationProvider
+from ..Configuration import Configuration
+from ..ConfigurationException import ConfigurationException
+import os
+import re
+import time
+from typing import Mapping
+
+type FileDescriptor = int
+
+# NOTE: matches one complete line (or quoted multi-line value) per match, so the text is scanned exactly once without being split into lines
+_LINE = re.compile(r'''
+    [ \t]*
+    (?:
+        (?:export[ \t]+)?
+        (?P<key>[A-Za-z_][A-Za-z0-9_.:\-]*)[ \t]*=[ \t]*
+        (?:
+            '(?P<sq>[^']*)'[ \t]*(?:\#[^\r\n]*)?
+          | "(?P<dq>(?:[^"\\]|\\.)*)"[ \t]*(?:\#[^\r\n]*)?
+          | (?P<uq>[^\r\n]*?)[ \t]*(?:[ \t]\#[^\r\n]*)?
+        )
+      | (?:\#[^\r\n]*)?
+    )
+    (?:\r?\n|\Z)
+    ''', re.VERBOSE | re.DOTALL)
+_ESCAPES = { 'n': '\n', 'r': '\r', 't': '\t' }
+_DQ_TOKENS = re.compile(r'\\(.)|\$\{([^}:]+)(?::-([^}]*))?\}', re.DOTALL)
+_UQ_TOKENS = re.compile(r'\$\{([^}:]+)(?::-([^}]*))?\}')
+
+class DotEnvConfigurationProvider(ConfigurationProvider):
+    """
+    Populates configuration data from a ``.env`` file, without modifying the process environment.
+
+    Supports ``#`` comments, an optional ``export`` prefix, unquoted values (with inline comments preceded by whitespace), single-quoted literal values, and double-quoted values with escape sequences. Single- and double-quoted values may span multiple lines. ``${VAR}`` and ``${VAR:-default}`` references in unquoted and double-quoted values are expanded from preceding keys in the same file, then from the environment.
+    """
+
+    __pairs:list[tuple[str, str]]
+
+    def __init__(self, filepath:str = None, *, dotenv:str = None, fd:FileDescriptor = None, required:bool = True, expand:bool = True, environ:Mapping[str, str] = None):
+        """
+        The `filepath`, `dotenv`, and `fd` parameters are mutually exclusive.
+
+        :param filepath: Optional path to a .env file used as a configuration source, defaults to None.
+        :param dotenv: Optional .env formatted string used as a configuration source, defaults to None.
+        :param fd: Optional file descriptor (int) to be used as a configuration source, defaults to None.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified configuration source is missing, defaults to True.
+        :param expand: Option indicating whether or not ``${VAR}`` references are expanded, defaults to True.
+        :param environ: Optional mapping used in lieu of `os.environ` when expanding references, defaults to None.
+        """
+        metrics = self.getMetrics()
+        metrics.source = filepath
+        if filepath:
+            if os.path.isfile(filepath):
+                with open(filepath, 'rb') as file:
+                    dotenv = metrics.read(file).decode('utf-8-sig')
+            elif required:
+                raise ConfigurationException(f'Missing required file: {filepath}')
+        elif fd:
+            with open(fd, 'rb') as file:
+                dotenv = metrics.read(file).decode('utf-8-sig')
+        if dotenv:
+            start = time.perf_counter()
+            self.__pairs = DotEnvConfigurationProvider.__parse(dotenv, expand, os.environ if environ is None else environ)
+            metrics.addParse(time.perf_counter() - start)
+        else:
+            self.__pairs = None
+
+    @staticmethod
+    def __parse(text:str, expand:bool, environ:Mapping[str, str]) -> list[tuple[str, str]]:
+        values = {}
+        def lookup(m:re.Match, name:int, default:int) -> str:
+            v = values.get(m[name])
+            if v is None:
+                v = environ.get(m[name])
+            return (m[default] or '') if not v else v
+        def replaceDq(m:re.Match) -> str:
+            if m[1] is not None:
+                return _ESCAPES.get(m[1], m[1])
+            return lookup(m, 2, 3) if expand else m[0]
+        def replaceUq(m:re.Match) -> str:
+            return lookup(m, 1, 2)
+        pairs = []
+        pos = 0
+        end = len(text)
+        while pos < end:
+            m = _LINE.match(text, pos)
+            if m is None or m.end() == pos:
+                line = text.count('\n', 0, pos) + 1
+                raise ConfigurationException(f'Invalid .env syntax on line {line}.')
+            pos = m.end()
+            key = m['key']
+            if key is None:
+                continue
+            if m['sq'] is not None:
+                value = m['sq']
+            elif m['dq'] is not None:
+                value = _DQ_TOKENS.sub(replaceDq, m['dq'])
+            else:
+                value = m['uq']
+                if expand and '$' in value:
+                    value = _UQ_TOKENS.sub(replaceUq, value)
+            values[key] = value
+            pairs.append((key, value))
+        return pairs
+
+    def populateConfiguration(self, configuration:Configuration):
+        if self.__pairs is None:
+            return
+        for key, value in self.__pairs:
+            configuration.set(key, value)
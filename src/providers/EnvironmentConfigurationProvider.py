@@ -3,13 +3,63 @@
 
 from .ConfigurationProvider import ConfigurationProvider
 from ..Configuration import Configuration
+from ..SettingsSchema import SettingsSchema
 import os
+import re
+from typing import Mapping
 
 class EnvironmentConfigurationProvider(ConfigurationProvider):
     """
     Populates configuration data from Environment variables.
+
+    Variables can be filtered by name prefix, and by the keys of a settings type, before any configuration data is set. This keeps unrelated variables (such as Kubernetes service links) out of the :py:class:`~appsettings2.Configuration` and avoids the cost of processing them.
     """
 
+    __environ:Mapping[str, str]
+    __exclude:re.Pattern
+    __include:re.Pattern
+    __schema:SettingsSchema
+    __strip:bool
+
+    def __init__(self, *, include:list[str] = None, exclude:list[str] = None, strip:bool = False, schema:type|dict[str, type]|SettingsSchema = None, environ:Mapping[str, str] = None):
+        """
+        :param include: Optional list of (case-insensitive) name prefixes, only variables starting with one of these prefixes are loaded, defaults to None which loads all variables.
+        :param exclude: Optional list of (case-insensitive) name prefixes, variables starting with one of these prefixes are not loaded, defaults to None.
+        :param strip: Option indicating whether or not the matching `include` prefix is removed from the variable name to form the configuration key, along with any ``_`` delimiters following it, for example ``MYAPP__Database__Host`` becomes ``Database__Host`` given either ``MYAPP`` or ``MYAPP__``, defaults to False.
+        :param schema: Optional settings class (or :py:class:`~appsettings2.SettingsSchema`), only variables which would be bound to the settings class are loaded, defaults to None. The schema is applied after `strip`.
+        :param environ: Optional mapping used in lieu of `os.environ`, defaults to None.
+        """
+        self.__environ = environ
+        self.__exclude = EnvironmentConfigurationProvider.__compilePrefixes(exclude)
+        self.__include = EnvironmentConfigurationProvider.__compilePrefixes(include)
+        self.__schema = schema if schema is None or isinstance(schema, SettingsSchema) else SettingsSchema(schema)
+        self.__strip = strip
+
+    @staticmethod
+    def __compilePrefixes(prefixes:list[str]) -> re.Pattern|None:
+        if not prefixes:
+            return None
+        # NOTE: longest prefixes first, so `strip` removes the most specific match
+        prefixes = sorted(prefixes, key=len, reverse=True)
+        return re.compile('|'.join(re.escape(p) for p in prefixes), re.IGNORECASE)
+
     def populateConfiguration(self, configuration:Configuration):
-        for k in os.environ:
-            configuration.set(k, os.environ[k])
+        environ = os.environ if self.__environ is None else self.__environ
+        include = self.__include
+        exclude = self.__exclude
+        schema = self.__schema
+        for k, v in environ.items():
+            if exclude is not None and exclude.match(k) is not None:
+                continue
+            if include is not None:
+                m = include.match(k)
+                if m is None:
+                    continue
+                elif self.__strip:
+                    # NOTE: delimiters between the prefix and the key are also removed, so `MYAPP` and `MYAPP__` are equivalent prefixes
+                    k = k[m.end():].lstrip('_')
+                    if len(k) == 0:
+                        continue
+            if schema is not None and not schema.isAllowed(k):
+                continue
+            configuration.set(k, v)
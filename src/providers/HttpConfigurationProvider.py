@@ -0,0 +1,226 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .ConfigurationProvider import ConfigurationProvider
+from ..Configuration import Configuration
+from ..ConfigurationException import ConfigurationException
+from concurrent.futures import ThreadPoolExecutor
+import http.client
+import json
+import threading
+import time
+from typing import Any
+import urllib.parse
+
+type any = Any
+
+_RETRY_STATUSES = frozenset([ 429, 500, 502, 503, 504 ])
+
+class _StaleConnectionError(ConnectionError):
+    """Raised when a reused keep-alive connection was closed by the server while idle."""
+
+class _ConnectionPool:
+    """A pool of keep-alive connections to a single origin."""
+
+    __factory:type
+    __host:str
+    __idle:list[http.client.HTTPConnection]
+    __lock:threading.Lock
+    __port:int
+    __size:int
+    __timeout:float
+
+    def __init__(self, scheme:str, host:str, port:int, size:int, timeout:float):
+        self.__factory = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        self.__host = host
+        self.__idle = []
+        self.__lock = threading.Lock()
+        self.__port = port
+        self.__size = size
+        self.__timeout = timeout
+
+    def acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Acquires a connection, returning `(connection, reused)`."""
+        with self.__lock:
+            if len(self.__idle) > 0:
+                return (self.__idle.pop(), True)
+        return (self.__factory(self.__host, self.__port, timeout=self.__timeout), False)
+
+    def release(self, connection:http.client.HTTPConnection) -> None:
+        with self.__lock:
+            if len(self.__idle) < self.__size:
+                self.__idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self.__lock:
+            idle = self.__idle
+            self.__idle = []
+        for connection in idle:
+            connection.close()
+
+class HttpConfigurationProvider(ConfigurationProvider):
+    """
+    Populates configuration data from an HTTP key-value service.
+
+    When no `keys` are specified a single ``GET`` of `url` is expected to return a JSON object. When `keys` are specified they are requested in batches of `batchSize` as ``GET {url}?keys=k1,k2,...``, which is expected to return a JSON object of the requested keys; a `batchSize` of 1 instead requests each key as ``GET {url}/{key}``, which is expected to return a JSON value. Missing (404) keys are ignored.
+
+    Connections are kept alive and reused from a pool across populations, and batches are requested concurrently using up to `poolSize` connections. Responses are cached by their ``ETag`` and revalidated with ``If-None-Match``, so unchanged data costs a ``304 Not Modified`` response. Connection failures, timeouts, and ``429``/``5xx`` responses are retried with exponential backoff.
+    """
+
+    __backoff:float
+    __batchSize:int
+    __cache:dict[str, tuple[str, any]]
+    __headers:dict[str, str]
+    __keys:list[str]
+    __path:str
+    __pool:_ConnectionPool
+    __poolSize:int
+    __required:bool
+    __retries:int
+
+    def __init__(self, url:str, *, keys:list[str] = None, batchSize:int = 50, headers:dict[str, str] = None, timeout:float = 10.0, retries:int = 3, backoff:float = 0.5, poolSize:int = 4, required:bool = True):
+        """
+        :param url: The ``http`` or ``https`` url of the key-value service.
+        :param keys: Optional list of keys to request, defaults to None which requests the whole document at `url`.
+        :param batchSize: Optional maximum number of keys per request, 1 requests each key individually, defaults to 50.
+        :param headers: Optional headers sent with every request (for example, ``Authorization``), defaults to None.
+        :param timeout: Optional connect and read timeout in seconds, defaults to 10.0.
+        :param retries: Optional number of times a failed request is retried, defaults to 3.
+        :param backoff: Optional delay in seconds before the first retry, doubled for each subsequent retry, defaults to 0.5.
+        :param poolSize: Optional maximum number of pooled (and concurrent) connections, defaults to 4.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the service cannot be reached, defaults to True. When False, the last successfully fetched data (if any) is used instead.
+        """
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ConfigurationException(f'Invalid url: {url}')
+        if batchSize < 1:
+            raise ConfigurationException(f'Invalid batchSize: {batchSize}')
+        self.__backoff = backoff
+        self.__batchSize = batchSize
+        self.__cache = {}
+        self.__headers = { 'Accept': 'application/json' }
+        if headers is not None:
+            self.__headers.update(headers)
+        self.__keys = keys
+        self.getMetrics().source = url
+        self.__path = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        self.__pool = _ConnectionPool(parts.scheme, parts.hostname, parts.port, poolSize, timeout)
+        self.__poolSize = poolSize
+        self.__required = required
+        self.__retries = retries
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        self.__pool.close()
+
+    def __targets(self) -> list[str]:
+        if self.__keys is None:
+            return [self.__path]
+        base, _, query = self.__path.partition('?')
+        if self.__batchSize == 1:
+            base = base.rstrip('/')
+            return [f'{base}/{urllib.parse.quote(key, safe=":")}' + (f'?{query}' if query else '') for key in self.__keys]
+        targets = []
+        for i in range(0, len(self.__keys), self.__batchSize):
+            keys = ','.join(urllib.parse.quote(key, safe=':') for key in self.__keys[i:i+self.__batchSize])
+            targets.append(f'{base}?' + (f'{query}&' if query else '') + f'keys={keys}')
+        return targets
+
+    def __request(self, target:str) -> tuple[int, str, bytes, str]:
+        """Performs a single `GET` of `target` on a pooled connection, returning `(status, etag, body, retryAfter)`."""
+        headers = self.__headers
+        cached = self.__cache.get(target)
+        if cached is not None and cached[0] is not None:
+            headers = dict(headers)
+            headers['If-None-Match'] = cached[0]
+        connection, reused = self.__pool.acquire()
+        try:
+            connection.request('GET', target, headers=headers)
+            response = connection.getresponse()
+            # NOTE: the body must be fully read before the connection can be reused
+            body = response.read()
+        except Exception as ex:
+            connection.close()
+            if reused and isinstance(ex, http.client.RemoteDisconnected | ConnectionResetError | BrokenPipeError):
+                raise _StaleConnectionError(str(ex)) from ex
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self.__pool.release(connection)
+        return (response.status, response.getheader('ETag'), body, response.getheader('Retry-After'))
+
+    def __fetch(self, target:str) -> tuple[bool, any, int]:
+        """Fetches `target` with retries, returning `(found, data, size)` where `size` is the number of bytes received, and updating the ETag cache."""
+        attempt = 0
+        size = 0
+        while True:
+            delay = self.__backoff * (2 ** attempt)
+            try:
+                status, etag, body, retryAfter = self.__request(target)
+                size += len(body)
+            except _StaleConnectionError:
+                # NOTE: the server closed an idle pooled connection, which is not a failure of the service, so it is retried immediately
+                continue
+            except (OSError, http.client.HTTPException) as ex:
+                if attempt >= self.__retries:
+                    raise ConfigurationException(f'Request failed: {target}: {ex}')
+            else:
+                if status == 200:
+                    try:
+                        data = json.loads(body)
+                    except ValueError as ex:
+                        raise ConfigurationException(f'Invalid JSON: {target}: {ex}')
+                    self.__cache[target] = (etag, data)
+                    return (True, data, size)
+                elif status == 304:
+                    cached = self.__cache.get(target)
+                    if cached is None:
+                        # NOTE: only revalidation requests (which carry `If-None-Match`) may be answered with 304
+                        raise ConfigurationException(f'Request failed: {target}: unexpected HTTP 304')
+                    return (True, cached[1], size)
+                elif status == 404:
+                    self.__cache.pop(target, None)
+                    return (False, None, size)
+                elif status not in _RETRY_STATUSES or attempt >= self.__retries:
+                    raise ConfigurationException(f'Request failed: {target}: HTTP {status}')
+                if retryAfter is not None and retryAfter.isdigit():
+                    delay = max(delay, float(retryAfter))
+            attempt += 1
+            time.sleep(delay)
+
+    def __fetchOrStale(self, target:str) -> tuple[bool, any, int]:
+        try:
+            return self.__fetch(target)
+        except ConfigurationException:
+            if self.__required:
+                raise
+            cached = self.__cache.get(target)
+            return (False, None, 0) if cached is None else (True, cached[1], 0)
+
+    def populateConfiguration(self, configuration:Configuration):
+        targets = self.__targets()
+        start = time.perf_counter()
+        if len(targets) == 1 or self.__poolSize < 2:
+            results = [self.__fetchOrStale(target) for target in targets]
+        else:
+            with ThreadPoolExecutor(max_workers=self.__poolSize) as executor:
+                results = list(executor.map(self.__fetchOrStale, targets))
+        # NOTE: responses are fetched (and decoded) concurrently, so decoding is measured as part of reading
+        self.getMetrics().addRead(sum(r[2] for r in results), time.perf_counter() - start)
+        if self.__keys is not None and self.__batchSize == 1:
+            for key, (found, value, _) in zip(self.__keys, results):
+                if found:
+                    configuration.set(key, value)
+            return
+        for found, data, _ in results:
+            if not found:
+                if self.__keys is None and self.__required:
+                    raise ConfigurationException(f'Missing required resource: {self.__path}')
+                continue
+            if not isinstance(data, dict):
+                raise ConfigurationException(f'Expected a JSON object: {self.__path}')
+            for key, value in data.items():
+                configuration.set(key, value)
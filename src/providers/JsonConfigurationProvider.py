@@ -4,8 +4,10 @@
 from .ConfigurationProvider import ConfigurationProvider
 from ..Configuration import Configuration
 from ..ConfigurationException import ConfigurationException
+from ..KeyPathFilter import KeyPathFilter
 import json as _json
 import os
+import time
 from typing import Any
 
 type FileDescriptor = int
@@ -27,17 +29,21 @@ class JsonConfigurationProvider(ConfigurationProvider):
         :param fd: Optional file descriptor (int) to be used as a configuration source, defaults to None.
         :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified configuration source is missing, defaults to True.
         """
+        metrics = self.getMetrics()
+        metrics.source = filepath
         if filepath:
             if os.path.isfile(filepath):
                 with open(filepath, 'rt') as file:
-                    json = file.read()
+                    json = metrics.read(file)
             elif required:
                 raise ConfigurationException(f'Missing required file: {filepath}')
         elif fd:
             with open(fd, 'rt') as file:
-                json = file.read()
+                json = metrics.read(file)
         if json:
+            start = time.perf_counter()
             self.__obj = _json.loads(json)
+            metrics.addParse(time.perf_counter() - start)
         else:
             self.__obj = None
 
@@ -51,7 +57,10 @@ class JsonConfigurationProvider(ConfigurationProvider):
     def populateConfiguration(self, configuration:Configuration):
         if self.__obj is None:
             return
+        keyfilter = configuration.getKeyFilter()
         for kvp in self.__obj.items():
+            if keyfilter is not None and not keyfilter.canDescend(KeyPathFilter.split(f'{kvp[0]}')):
+                continue
             if isinstance(kvp[1], dict):
                 self.__populateRecursive(configuration, kvp[0], kvp[1])
             else:
@@ -0,0 +1,282 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .ConfigurationProvider import ConfigurationProvider
+from ..Configuration import Configuration
+from ..ConfigurationException import ConfigurationException
+from ..ConfigurationMetrics import ProviderMetrics
+from ..KeyPathFilter import KeyPathFilter
+from io import StringIO
+import json as _json
+import json.decoder as _decoder
+import json.scanner as _scanner
+import os
+import re
+import time
+from typing import Any, TextIO
+
+type FileDescriptor = int
+type any = Any
+
+_NUMERIC = frozenset('0123456789+-.eE')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_STRING_RUN = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_CONSTANTS = {
+    'true': True,
+    'false': False,
+    'null': None,
+    'NaN': float('nan'),
+    'Infinity': float('inf'),
+    '-Infinity': float('-inf')
+}
+
+class _JsonTokenReader:
+    """An incremental JSON tokenizer which reads its input in fixed-size chunks."""
+
+    __buf:str
+    __chunksize:int
+    __eof:bool
+    __file:TextIO
+    __metrics:ProviderMetrics
+    __pos:int
+
+    def __init__(self, file:TextIO, chunksize:int, metrics:ProviderMetrics):
+        self.__buf = ''
+        self.__chunksize = chunksize
+        self.__eof = False
+        self.__file = file
+        self.__metrics = metrics
+        self.__pos = 0
+
+    def __fill(self) -> bool:
+        if self.__eof:
+            return False
+        start = time.perf_counter()
+        chunk = self.__file.read(self.__chunksize)
+        self.__metrics.addRead(len(chunk), time.perf_counter() - start)
+        if not chunk:
+            self.__eof = True
+            return False
+        self.__buf = self.__buf[self.__pos:] + chunk
+        self.__pos = 0
+        return True
+
+    def __error(self, reason:str) -> ConfigurationException:
+        return ConfigurationException(f'Invalid JSON: {reason}')
+
+    def peek(self) -> str|None:
+        """Skips whitespace and returns the next significant character, or None at end of input."""
+        while True:
+            self.__pos = _WHITESPACE.match(self.__buf, self.__pos).end()
+            if self.__pos < len(self.__buf):
+                return self.__buf[self.__pos]
+            if not self.__fill():
+                return None
+
+    def expect(self, c:str) -> None:
+        if self.peek() != c:
+            raise self.__error(f'expected `{c}`')
+        self.__pos += 1
+
+    def next(self) -> str|None:
+        """Consumes and returns the next structural character, or None at end of input."""
+        c = self.peek()
+        if c is not None:
+            self.__pos += 1
+        return c
+
+    def readString(self) -> str:
+        """Reads a string token, the opening quote must not have been consumed."""
+        self.expect('"')
+        while True:
+            try:
+                s, end = _decoder.scanstring(self.__buf, self.__pos)
+                self.__pos = end
+                return s
+            except _json.JSONDecodeError as ex:
+                if not self.__fill():
+                    raise self.__error(ex.msg)
+
+    def readScalar(self) -> any:
+        """Reads a number or constant token."""
+        while True:
+            m = _scanner.NUMBER_RE.match(self.__buf, self.__pos)
+            # NOTE: a number is only complete once a non-numeric character (or eof) follows it
+            if m is not None and (self.__eof or (m.end() < len(self.__buf) and self.__buf[m.end()] not in _NUMERIC)):
+                integer, frac, exp = m.groups()
+                self.__pos = m.end()
+                if frac or exp:
+                    return float(integer + (frac or '') + (exp or ''))
+                return int(integer)
+            if m is None:
+                for literal, value in _CONSTANTS.items():
+                    if self.__buf.startswith(literal, self.__pos):
+                        self.__pos += len(literal)
+                        return value
+                if len(self.__buf) - self.__pos >= 9 or self.__eof:
+                    raise self.__error(f'unexpected `{self.__buf[self.__pos]}`')
+            if not self.__fill():
+                if m is None:
+                    raise self.__error('unexpected end of input')
+
+    def skipString(self) -> None:
+        """Skips a string token without decoding it."""
+        self.expect('"')
+        while True:
+            # NOTE: the scanned prefix is consumed before each fill so that long strings are skipped in linear time, a trailing unpaired `\\` is left in the buffer until its escaped character arrives
+            self.__pos = _STRING_RUN.match(self.__buf, self.__pos).end()
+            if self.__pos < len(self.__buf) and self.__buf[self.__pos] == '"':
+                self.__pos += 1
+                return
+            if not self.__fill():
+                raise self.__error('unterminated string')
+
+class JsonStreamConfigurationProvider(ConfigurationProvider):
+    """
+    Populates structured configuration data from JSON, incrementally.
+
+    Unlike :py:class:`~appsettings2.providers.JsonConfigurationProvider` the JSON source is not read until :py:meth:`populateConfiguration` is called, and it is then tokenized in fixed-size chunks with each value merged into the :py:class:`~appsettings2.Configuration` as soon as it is read. Memory use is bounded by the chunk size and the largest array or string in the document, rather than by the size of the document. Subtrees which are not selected by the `include` and `exclude` filters are skipped without being decoded.
+    """
+
+    __chunksize:int
+    __fd:FileDescriptor
+    __filepath:str
+    __filter:KeyPathFilter
+    __json:str
+    __stream:TextIO
+
+    def __init__(self, filepath:str = None, *, json:str = None, fd:FileDescriptor = None, stream:TextIO = None, required:bool = True, include:list[str] = None, exclude:list[str] = None, chunksize:int = 65536):
+        """
+        The `filepath`, `json`, `fd`, and `stream` parameters are mutually exclusive.
+
+        :param filepath: Optional path to a JSON file used as a configuration source, defaults to None.
+        :param json: Optional JSON string used as a configuration source, defaults to None.
+        :param fd: Optional file descriptor (int) to be used as a configuration source, defaults to None. A file descriptor can only be read once.
+        :param stream: Optional text file object to be used as a configuration source, defaults to None. The stream is read from its current position and is not closed.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified configuration source is missing, defaults to True.
+        :param include: Optional list of key patterns to be loaded, see :py:class:`~appsettings2.KeyPathFilter`, defaults to None which loads all keys.
+        :param exclude: Optional list of key patterns to be skipped, see :py:class:`~appsettings2.KeyPathFilter`, defaults to None.
+        :param chunksize: Optional number of characters read from the source at a time, defaults to 65536.
+        """
+        if filepath and required and not os.path.isfile(filepath):
+            raise ConfigurationException(f'Missing required file: {filepath}')
+        self.__chunksize = chunksize
+        self.__fd = fd
+        self.__filepath = filepath
+        self.getMetrics().source = filepath
+        self.__filter = None if include is None and exclude is None else KeyPathFilter(include, exclude=exclude)
+        self.__json = json
+        self.__stream = stream
+
+    def __populateObject(self, configuration:Configuration, reader:_JsonTokenReader, filters:list[KeyPathFilter], prefix:str|None, parts:list[str]|None) -> None:
+        # NOTE: the opening `{` has already been consumed
+        if reader.peek() == '}':
+            reader.next()
+            return
+        while True:
+            key = reader.readString()
+            reader.expect(':')
+            kparts = None if len(filters) == 0 else parts + KeyPathFilter.split(key)
+            k = key if prefix is None else f'{prefix}__{key}'
+            c = reader.peek()
+            if len(filters) == 0 or all(f.isSelected(kparts) for f in filters):
+                if c == '{':
+                    reader.next()
+                    self.__populateObject(configuration, reader, filters, k, kparts)
+                else:
+                    configuration.set(k, self.__readValue(reader))
+            elif c == '{' and all(f.canDescend(kparts) for f in filters):
+                reader.next()
+                self.__populateObject(configuration, reader, filters, k, kparts)
+            else:
+                self.__skipValue(reader)
+            c = reader.next()
+            if c == '}':
+                return
+            elif c != ',':
+                raise ConfigurationException('Invalid JSON: expected `,` or `}`')
+
+    def __readValue(self, reader:_JsonTokenReader) -> any:
+        c = reader.peek()
+        if c == '"':
+            return reader.readString()
+        elif c == '{':
+            reader.next()
+            result = {}
+            if reader.peek() == '}':
+                reader.next()
+                return result
+            while True:
+                key = reader.readString()
+                reader.expect(':')
+                result[key] = self.__readValue(reader)
+                c = reader.next()
+                if c == '}':
+                    return result
+                elif c != ',':
+                    raise ConfigurationException('Invalid JSON: expected `,` or `}`')
+        elif c == '[':
+            reader.next()
+            result = []
+            if reader.peek() == ']':
+                reader.next()
+                return result
+            while True:
+                result.append(self.__readValue(reader))
+                c = reader.next()
+                if c == ']':
+                    return result
+                elif c != ',':
+                    raise ConfigurationException('Invalid JSON: expected `,` or `]`')
+        elif c is None:
+            raise ConfigurationException('Invalid JSON: unexpected end of input')
+        else:
+            return reader.readScalar()
+
+    def __skipValue(self, reader:_JsonTokenReader) -> None:
+        depth = 0
+        while True:
+            c = reader.peek()
+            if c == '"':
+                reader.skipString()
+            elif c == '{' or c == '[':
+                reader.next()
+                depth += 1
+            elif c == '}' or c == ']':
+                reader.next()
+                depth -= 1
+            elif c == ',' or c == ':':
+                reader.next()
+            elif c is None:
+                raise ConfigurationException('Invalid JSON: unexpected end of input')
+            else:
+                reader.readScalar()
+            if depth == 0:
+                return
+
+    def __populateFrom(self, configuration:Configuration, file:TextIO) -> None:
+        reader = _JsonTokenReader(file, self.__chunksize, self.getMetrics())
+        c = reader.peek()
+        if c is None:
+            return
+        elif c != '{':
+            raise ConfigurationException('Invalid JSON: expected an object at the document root')
+        reader.next()
+        filters = [f for f in (self.__filter, configuration.getKeyFilter()) if f is not None]
+        self.__populateObject(configuration, reader, filters, None, [])
+        if reader.peek() is not None:
+            raise ConfigurationException('Invalid JSON: unexpected data after the document root')
+
+    def populateConfiguration(self, configuration:Configuration):
+        if self.__filepath:
+            if os.path.isfile(self.__filepath):
+                with open(self.__filepath, 'rt') as file:
+                    self.__populateFrom(configuration, file)
+        elif self.__fd:
+            with open(self.__fd, 'rt') as file:
+                self.__populateFrom(configuration, file)
+        elif self.__stream is not None:
+            self.__populateFrom(configuration, self.__stream)
+        elif self.__json:
+            with StringIO(self.__json) as file:
+                self.__populateFrom(configuration, file)
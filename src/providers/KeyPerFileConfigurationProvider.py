@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .ConfigurationProvider import ConfigurationProvider
+from ..Configuration import Configuration
+from ..ConfigurationException import ConfigurationException
+import os
+
+_DATA_LINK = '..data'
+
+class KeyPerFileConfigurationProvider(ConfigurationProvider):
+    """
+    Populates configuration data from a directory containing one file per key, such as a Kubernetes Secret or ConfigMap volume, or a Docker secrets mount.
+
+    Each file name is used as a configuration key (so ``Database__Password`` populates ``Database:Password``) and the file content is used as its value. Names starting with ``..`` are ignored.
+
+    The `(inode, mtime, size)` of each file is remembered, so subsequent populations only read files which have changed. For volumes which are updated by atomically swapping a ``..data`` symlink (as Kubernetes does) files are read through the ``..data`` target, which provides a consistent view of the volume, and no files are read at all while the ``..data`` target is unchanged.
+    """
+
+    __cache:dict[str, tuple[int, int, int, str]]
+    __dataTarget:str
+    __encoding:str
+    __path:str
+    __prefix:str
+    __required:bool
+    __trim:bool
+
+    def __init__(self, path:str, *, prefix:str = None, required:bool = True, trim:bool = True, encoding:str = 'utf-8'):
+        """
+        :param path: Path to a directory containing one file per key.
+        :param prefix: Optional key prefix, for example ``Secrets`` populates ``Secrets:Database:Password`` from a ``Database__Password`` file, defaults to None.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified directory is missing, defaults to True.
+        :param trim: Option indicating whether or not trailing line breaks are removed from values, defaults to True.
+        :param encoding: Optional text encoding of the files, defaults to 'utf-8'.
+        """
+        if required and not os.path.isdir(path):
+            raise ConfigurationException(f'Missing required directory: {path}')
+        self.__cache = {}
+        self.__dataTarget = None
+        self.getMetrics().source = path
+        self.__encoding = encoding
+        self.__path = path
+        self.__prefix = prefix
+        self.__required = required
+        self.__trim = trim
+
+    def __read(self, filepath:str) -> str:
+        with open(filepath, 'rt', encoding=self.__encoding) as file:
+            value = self.getMetrics().read(file)
+        return value.rstrip('\r\n') if self.__trim else value
+
+    def __refresh(self) -> None:
+        root = self.__path
+        dataTarget = None
+        if os.path.islink(os.path.join(self.__path, _DATA_LINK)):
+            dataTarget = os.readlink(os.path.join(self.__path, _DATA_LINK))
+            if dataTarget == self.__dataTarget:
+                return
+            root = os.path.join(self.__path, dataTarget)
+        cache = {}
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.name.startswith('..') or not entry.is_file():
+                    continue
+                st = entry.stat()
+                cached = self.__cache.get(entry.name)
+                if cached is not None and cached[0] == st.st_ino and cached[1] == st.st_mtime_ns and cached[2] == st.st_size:
+                    cache[entry.name] = cached
+                else:
+                    cache[entry.name] = (st.st_ino, st.st_mtime_ns, st.st_size, self.__read(entry.path))
+        self.__cache = cache
+        self.__dataTarget = dataTarget
+
+    def populateConfiguration(self, configuration:Configuration):
+        if not os.path.isdir(self.__path):
+            if self.__required:
+                raise ConfigurationException(f'Missing required directory: {self.__path}')
+            return
+        try:
+            self.__refresh()
+        except FileNotFoundError:
+            # NOTE: the volume was swapped while it was being read, the new `..data` target is consistent
+            self.__dataTarget = None
+            self.__refresh()
+        for name in sorted(self.__cache):
+            cached = self.__cache[name]
+            configuration.set(name if self.__prefix is None else f'{self.__prefix}__{name}', cached[3])
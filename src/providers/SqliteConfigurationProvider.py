@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from .ConfigurationProvider import ConfigurationProvider
+from ..Configuration import Configuration
+from ..ConfigurationException import ConfigurationException
+import os
+import pathlib
+import re
+import sqlite3
+import time
+from typing import Any, Iterator
+
+type any = Any
+
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+def _upperBound(prefix:str) -> str|None:
+    """Gets the least string greater than every string starting with `prefix`, or None if there is no such string."""
+    # NOTE: U+10FFFF cannot be incremented, every string starting with `prefix` sorts before the increment of the preceding character
+    prefix = prefix.rstrip('\U0010FFFF')
+    if len(prefix) == 0:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+class SqliteConfigurationProvider(ConfigurationProvider):
+    """
+    Populates configuration data from a `(key, value)` table in a SQLite database.
+
+    A `prefix` restricts the rows read to keys starting with the prefix, such as ``Tenants:acme:``, using a range predicate which SQLite answers from an index on the key column. Rows are fetched in batches of `batchSize`.
+
+    When a `versionColumn` is specified (for example ``rowid``, or a column maintained by a trigger) rows are cached by the provider and subsequent populations only fetch rows with a version greater than the greatest version previously read. Rows with a NULL value are treated as deletions.
+    """
+
+    __batchSize:int
+    __connection:sqlite3.Connection
+    __filepath:str
+    __prefix:str
+    __upper:str|None
+    __required:bool
+    __rows:dict[str, any]
+    __sql:str
+    __version:any
+    __versioned:bool
+
+    def __init__(self, filepath:str = None, *, connection:sqlite3.Connection = None, table:str = 'Configuration', keyColumn:str = 'key', valueColumn:str = 'value', versionColumn:str = None, prefix:str = None, batchSize:int = 1000, required:bool = True):
+        """
+        The `filepath` and `connection` parameters are mutually exclusive.
+
+        :param filepath: Optional path to a SQLite database file, opened read-only for each population, defaults to None.
+        :param connection: Optional open `sqlite3.Connection`, which is not closed by the provider, defaults to None.
+        :param table: Optional name of the table to read, defaults to 'Configuration'.
+        :param keyColumn: Optional name of the key column, defaults to 'key'.
+        :param valueColumn: Optional name of the value column, defaults to 'value'.
+        :param versionColumn: Optional name of a monotonically increasing version column (or ``rowid``) enabling incremental re-reads, defaults to None which reads all rows on every population.
+        :param prefix: Optional key prefix, only keys starting with `prefix` (case-sensitive) are read, defaults to None.
+        :param batchSize: Optional number of rows fetched at a time, defaults to 1000.
+        :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified database file is missing, defaults to True.
+        """
+        for identifier in (table, keyColumn, valueColumn) if versionColumn is None else (table, keyColumn, valueColumn, versionColumn):
+            if _IDENTIFIER.fullmatch(identifier) is None:
+                raise ConfigurationException(f'Invalid SQL identifier: {identifier}')
+        if filepath and required and not os.path.isfile(filepath):
+            raise ConfigurationException(f'Missing required file: {filepath}')
+        self.__batchSize = batchSize
+        self.__connection = connection
+        self.__filepath = filepath
+        self.getMetrics().source = filepath
+        self.__prefix = prefix
+        self.__upper = _upperBound(prefix) if prefix else None
+        self.__required = required
+        self.__rows = {}
+        self.__version = None
+        self.__versioned = versionColumn is not None
+        columns = f'"{keyColumn}", "{valueColumn}"' if versionColumn is None else f'"{keyColumn}", "{valueColumn}", "{versionColumn}"'
+        predicates = []
+        if prefix:
+            # NOTE: a range (rather than LIKE) can be answered from an index using the default BINARY collation
+            predicates.append(f'"{keyColumn}" >= :lower' if self.__upper is None else f'"{keyColumn}" >= :lower AND "{keyColumn}" < :upper')
+        if versionColumn is not None:
+            predicates.append(f'"{versionColumn}" > :version')
+        self.__sql = f'SELECT {columns} FROM "{table}"'
+        if len(predicates) > 0:
+            self.__sql += ' WHERE ' + ' AND '.join(predicates)
+        if versionColumn is not None:
+            self.__sql += f' ORDER BY "{versionColumn}"'
+
+    def __fetch(self, connection:sqlite3.Connection) -> Iterator[list[tuple]]:
+        parameters = {}
+        if self.__prefix:
+            parameters['lower'] = self.__prefix
+            if self.__upper is not None:
+                parameters['upper'] = self.__upper
+        if self.__versioned:
+            parameters['version'] = self.__version if self.__version is not None else -1
+        metrics = self.getMetrics()
+        start = time.perf_counter()
+        cursor = connection.execute(self.__sql, parameters)
+        try:
+            while True:
+                batch = cursor.fetchmany(self.__batchSize)
+                metrics.addRead(SqliteConfigurationProvider.__sizeOf(batch), time.perf_counter() - start)
+                if not batch:
+                    return
+                yield batch
+                start = time.perf_counter()
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def __sizeOf(batch:list[tuple]) -> int:
+        """Gets the number of bytes of the values of `batch`, as stored by SQLite (numbers as 8 bytes, text as utf-8)."""
+        size = 0
+        for row in batch:
+            for v in row:
+                if isinstance(v, str):
+                    size += len(v) if v.isascii() else len(v.encode('utf-8'))
+                elif isinstance(v, bytes):
+                    size += len(v)
+                elif v is not None:
+                    size += 8
+        return size
+
+    def __populateFrom(self, configuration:Configuration, connection:sqlite3.Connection) -> None:
+        if not self.__versioned:
+            for batch in self.__fetch(connection):
+                for row in batch:
+                    if row[1] is not None:
+                        configuration.set(row[0], row[1])
+            return
+        rows = self.__rows
+        for batch in self.__fetch(connection):
+            for row in batch:
+                if row[1] is None:
+                    rows.pop(row[0], None)
+                else:
+                    rows[row[0]] = row[1]
+            self.__version = batch[-1][2]
+        for key, value in rows.items():
+            configuration.set(key, value)
+
+    def populateConfiguration(self, configuration:Configuration):
+        if self.__connection is not None:
+            self.__populateFrom(configuration, self.__connection)
+        elif self.__filepath:
+            if not os.path.isfile(self.__filepath):
+                if self.__required:
+                    raise ConfigurationException(f'Missing required file: {self.__filepath}')
+                return
+            connection = sqlite3.connect(f'{pathlib.Path(self.__filepath).resolve().as_uri()}?mode=ro', uri=True)
+            try:
+                self.__populateFrom(configuration, connection)
+            finally:
+                connection.close()
@@ -4,10 +4,11 @@
 from .ConfigurationProvider import ConfigurationProvider
 from ..Configuration import Configuration
 from ..ConfigurationException import ConfigurationException
+from ..KeyPathFilter import KeyPathFilter
 from io import StringIO
 import os
-from typing import Any
-import yaml as _yaml
+import time
+from typing import Any, Iterator, TextIO
 
 type FileDescriptor = int
 type any = Any
@@ -15,34 +16,71 @@ type any = Any
 class YamlConfigurationProvider(ConfigurationProvider):
     """
     Populates structured configuration data from YAML.
+
+    Multi-document YAML streams (documents separated by ``---``) are supported, each document is merged as a successive layer in the order it appears, so later documents take precedence over earlier documents. Documents are parsed lazily, one at a time, when :py:meth:`populateConfiguration` is called.
     """
 
-    __obj:dict
+    __documents:frozenset[int]
+    __filepath:str
+    __required:bool
+    __selector:dict[str, any]
+    __yaml:str
 
-    def __init__(self, filepath:str = None, *, yaml:str = None, fd:FileDescriptor = None, required:bool = True):
+    def __init__(self, filepath:str = None, *, yaml:str = None, fd:FileDescriptor = None, required:bool = True, documents:list[int] = None, selector:dict[str, any] = None):
         """
         The `filepath`, `yaml`, and `fd` parameters are mutually exclusive.
-        
-        :param filepath: Optional path to a TAML file used as a configuration source, defaults to None.
-        :param yaml: Optional TAML string used as a configuration source, defaults to None.
+
+        :param filepath: Optional path to a YAML file used as a configuration source, defaults to None.
+        :param yaml: Optional YAML string used as a configuration source, defaults to None.
         :param fd: Optional file descriptor (int) to be used as a configuration source, defaults to None.
         :param required: Optional parameter indicating whether the configuration source will raise `ConfigurationException` if the specified configuration source is missing, defaults to True.
+        :param documents: Optional list of zero-based document indexes to be loaded, defaults to None which loads all documents.
+        :param selector: Optional dictionary of configuration keys and values, only documents which contain all of the specified key-value pairs are loaded, defaults to None which loads all documents.
         """
+        self.__documents = None if documents is None else frozenset(documents)
+        self.__filepath = None
+        self.__required = required
+        self.__selector = selector
+        self.__yaml = None
         if filepath:
-            if os.path.isfile(filepath):
-                with open(filepath, 'rt') as file:
-                    self.__obj = _yaml.safe_load(file)
-            elif required:
+            if required and not os.path.isfile(filepath):
                 raise ConfigurationException(f'Missing required file: {filepath}')
+            self.__filepath = filepath
+            self.getMetrics().source = filepath
         elif fd:
+            # NOTE: a file descriptor can only be read once, so the text is retained for subsequent populations
             with open(fd, 'rt') as file:
-                self.__obj = _yaml.safe_load(file)
+                self.__yaml = self.getMetrics().read(file)
         elif yaml:
-            stream = StringIO(yaml)
-            self.__obj = _yaml.safe_load(stream)
-            stream.close()
-        else:
-            self.__obj = None
+            self.__yaml = yaml
+
+    def __isSelected(self, obj:dict) -> bool:
+        for k, expected in self.__selector.items():
+            o = obj
+            for part in k.replace(':', '__').split('__'):
+                if not isinstance(o, dict):
+                    return False
+                o = next((v for kk, v in o.items() if str(kk).upper() == part.upper()), None)
+            if o != expected:
+                return False
+        return True
+
+    def __loadDocuments(self, stream:TextIO) -> Iterator[dict]:
+        # NOTE: `yaml` is imported on first use, it is comparatively expensive to import
+        import yaml as _yaml
+        last = None if self.__documents is None else max(self.__documents, default=-1)
+        for i, obj in enumerate(_yaml.safe_load_all(stream)):
+            if obj is None:
+                pass
+            elif not isinstance(obj, dict):
+                raise ConfigurationException(f'YAML document {i} is not a mapping.')
+            elif self.__documents is not None and i not in self.__documents:
+                pass
+            elif self.__selector is None or self.__isSelected(obj):
+                yield obj
+            if last is not None and i >= last:
+                # NOTE: stop before the remainder of the stream is parsed
+                break
 
     def __populateRecursive(self, configuration:Configuration, prefix:str, o:dict):
         for kvp in o.items():
@@ -51,11 +89,34 @@ class YamlConfigurationProvider(ConfigurationProvider):
             else:
                 configuration.set(f'{prefix}__{kvp[0]}', kvp[1])
 
+    def __populateFrom(self, configuration:Configuration, stream:TextIO):
+        keyfilter = configuration.getKeyFilter()
+        metrics = self.getMetrics()
+        documents = self.__loadDocuments(stream)
+        while True:
+            start = time.perf_counter()
+            obj = next(documents, None)
+            metrics.addParse(time.perf_counter() - start)
+            if obj is None:
+                return
+            for kvp in obj.items():
+                if keyfilter is not None and not keyfilter.canDescend(KeyPathFilter.split(f'{kvp[0]}')):
+                    continue
+                if isinstance(kvp[1], dict):
+                    self.__populateRecursive(configuration, kvp[0], kvp[1])
+                else:
+                    configuration.set(f'{kvp[0]}', kvp[1])
+
     def populateConfiguration(self, configuration:Configuration):
-        if self.__obj is None:
-            return
-        for kvp in self.__obj.items():
-            if isinstance(kvp[1], dict):
-                self.__populateRecursive(configuration, kvp[0], kvp[1])
-            else:
-                configuration.set(f'{kvp[0]}', kvp[1])
+        if self.__filepath is not None:
+            if os.path.isfile(self.__filepath):
+                # NOTE: the file is read before it is parsed, so reading and parsing are measured separately
+                with open(self.__filepath, 'rt') as file:
+                    text = self.getMetrics().read(file)
+                with StringIO(text) as stream:
+                    self.__populateFrom(configuration, stream)
+            elif self.__required:
+                raise ConfigurationException(f'Missing required file: {self.__filepath}')
+        elif self.__yaml is not None:
+            with StringIO(self.__yaml) as stream:
+                self.__populateFrom(configuration, stream)
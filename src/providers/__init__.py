@@ -2,8 +2,44 @@
 # SPDX-License-Identifier: MIT
 
 from .ConfigurationProvider import ConfigurationProvider
-from .CommandLineConfigurationProvider import CommandLineConfigurationProvider
-from .EnvironmentConfigurationProvider import EnvironmentConfigurationProvider
-from .JsonConfigurationProvider import JsonConfigurationProvider
-from .TomlConfigurationProvider import TomlConfigurationProvider
-from .YamlConfigurationProvider import YamlConfigurationProvider
+import importlib
+import sys
+import types
+
+# NOTE: providers are imported on first use, so that (for example) an application using only environment variables does not import `yaml`
+_PROVIDERS = (
+    'CommandLineConfigurationProvider',
+    'DirectoryConfigurationProvider',
+    'DotEnvConfigurationProvider',
+    'EnvironmentConfigurationProvider',
+    'HttpConfigurationProvider',
+    'JsonConfigurationProvider',
+    'JsonStreamConfigurationProvider',
+    'KeyPerFileConfigurationProvider',
+    'SqliteConfigurationProvider',
+    'TomlConfigurationProvider',
+    'YamlConfigurationProvider'
+)
+
+__all__ = ['ConfigurationProvider', *_PROVIDERS]
+
+class _LazyModule(types.ModuleType):
+    """Binds the class of a lazily imported submodule to the package, rather than the submodule itself."""
+
+    def __setattr__(self, name:str, value:object) -> None:
+        # NOTE: the import system binds each submodule to its package once it has been imported (by any importer), and each submodule is named for its class
+        if type(value) is types.ModuleType and value.__name__ == f'{self.__name__}.{name}' and name in self.__dict__.get('_LAZY', ()):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+_LAZY = _PROVIDERS
+sys.modules[__name__].__class__ = _LazyModule
+
+def __getattr__(name:str) -> type:
+    if name in _LAZY:
+        importlib.import_module(f'.{name}', __name__)
+        return globals()[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
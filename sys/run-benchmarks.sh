@@ -0,0 +1,11 @@
+#!/bin/bash
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+##
+set -eo pipefail
+source .venv/bin/activate
+for f in benchmarks/*Benchmarks.py; do
+    m=${f%.py}
+    echo "== ${m##*/}"
+    python -m ${m//\//.}
+done
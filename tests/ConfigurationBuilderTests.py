@@ -1,8 +1,12 @@
 # SPDX-FileCopyrightText: © 2024 Shaun Wilson
 # SPDX-License-Identifier: MIT
 
+from fakes import *
+import json
 import os
 import src as appsettings2
+import subprocess
+import sys
 import unittest
 
 class ConfigurationBuilderTests(unittest.TestCase):
@@ -122,3 +126,140 @@ class ConfigurationBuilderTests(unittest.TestCase):
         self.assertEqual(3, configuration.get('some_subobj:some_int'))
         self.assertEqual(3.3, configuration.get('some_subobj:some_float'))
         self.assertEqual('rand3', configuration.get('some_subobj:some_string'))
+
+    def test_Select_ProjectsSelectedSubtreesOnly(self):
+        builder = appsettings2.ConfigurationBuilder()
+        builder.addCommandLine([
+            'Database__Host=cmdline',
+            'Logging__Level=Debug'
+        ])
+        builder.addJson(json="""
+            {
+                "Database": { "Host": "localhost", "Port": 5432 },
+                "Cache": { "Redis": { "Host": "cache1", "Port": 6379 }, "Enabled": true },
+                "Routes": [ { "path": "/a" }, { "path": "/b" } ]
+            }""")
+        builder.addJsonStream(json="""{ "Cache": { "Memory": { "Host": "mem1" } }, "Other": { "x": 1 } }""")
+        builder.addYaml(yaml="""
+Cache:
+  Redis:
+    Port: 6380
+Logging:
+  Level: Info
+""")
+        builder.select('database', 'Cache:*:Port')
+        builder.select('Cache:Memory')
+        configuration = builder.build()
+        self.assertDictEqual({
+            'Database': { 'Host': 'localhost', 'Port': 5432 },
+            'Cache': { 'Redis': { 'Port': 6380 }, 'Memory': { 'Host': 'mem1' } }
+        }, configuration.toDictionary())
+        self.assertFalse(configuration.has_key('Routes'))
+        self.assertFalse(configuration.has_key('Logging'))
+        # the projection applies to providers only, keys set by the application are not discarded
+        self.assertIsNone(configuration.getKeyFilter())
+        configuration.set('Routes', [ { 'path': '/c' } ])
+        configuration.set('Cache:Enabled', False)
+        self.assertEqual('/c', configuration.Routes[0].path)
+        self.assertIs(False, configuration.get('Cache:Enabled'))
+        builder.reload(configuration)
+        self.assertFalse(configuration.has_key('Routes'))
+        self.assertIsNone(configuration.get('Cache:Enabled'))
+
+    def test_Interpolate_ResolvesAcrossProviders(self):
+        builder = appsettings2.ConfigurationBuilder(interpolate=True)
+        builder.addJson(json='{ "Services": { "Api": { "Host": "localhost", "Port": 80 } }, "Url": "http://${Services:Api:Host}:${Services:Api:Port}" }')
+        builder.addCommandLine([ 'Services:Api:Host=api.example.com' ])
+        configuration = builder.build()
+        self.assertEqual('http://api.example.com:80', configuration.Url)
+
+    def test_Reload_PreservesAccessorsAndInterpolation(self):
+        document = { 'Host': 'a.example.com', 'Url': 'https://${Host}/' }
+        builder = appsettings2.ConfigurationBuilder(interpolate=True)
+        builder.addProvider(appsettings2.providers.JsonConfigurationProvider(json=json.dumps(document)))
+        configuration = builder.build()
+        url = configuration.accessor('Url')
+        self.assertEqual('https://a.example.com/', url.value)
+        document['Host'] = 'b.example.com'
+        builder = appsettings2.ConfigurationBuilder(interpolate=True)
+        builder.addProvider(appsettings2.providers.JsonConfigurationProvider(json=json.dumps(document)))
+        self.assertIs(configuration, builder.reload(configuration))
+        self.assertEqual('https://b.example.com/', url.value)
+        configuration.set('Host', 'c.example.com')
+        self.assertEqual('https://c.example.com/', url.value)
+
+    def test_Metrics_RecordsProvidersAndBinds(self):
+        recorded = []
+        metrics = appsettings2.ConfigurationMetrics(recorded.append)
+        builder = appsettings2.ConfigurationBuilder(metrics=metrics)
+        builder.addJson('tests/configs/subset.json')
+        builder.addYaml('tests/configs/subset.yaml')
+        configuration = builder.build()
+        build = metrics.getBuilds()[0]
+        self.assertEqual([ 'JsonConfigurationProvider', 'YamlConfigurationProvider' ], [p.name for p in build.providers])
+        self.assertEqual([ 2, 2 ], [p.keys for p in build.providers])
+        self.assertEqual([ os.path.getsize('tests/configs/subset.json'), os.path.getsize('tests/configs/subset.yaml') ], [p.bytesRead for p in build.providers])
+        self.assertGreater(build.providers[0].parseTime, 0)
+        self.assertGreater(build.providers[1].readTime, 0)
+        self.assertIs(metrics, configuration.some_subobj.getMetrics())
+        configuration.some_subobj.bind(FakeConfigObj())
+        self.assertEqual([ build, metrics.getBinds()[0] ], recorded)
+        self.assertEqual(1, metrics.getReport()['binds']['fakes.FakeConfigObj.FakeConfigObj']['count'])
+        # NOTE: sources read by provider constructors are reported by the first build only
+        builder.reload(configuration)
+        self.assertEqual([ 0, os.path.getsize('tests/configs/subset.yaml') ], [p.bytesRead for p in metrics.getBuilds()[1].providers])
+        self.assertIsNone(appsettings2.ConfigurationBuilder().build().getMetrics())
+
+    def test_Profiler_CountsReadsOfEachKeyAndLayer(self):
+        profiler = appsettings2.ConfigurationProfiler()
+        builder = appsettings2.ConfigurationBuilder(profiler=profiler)
+        builder.addJson('tests/configs/subset.json')
+        builder.addYaml('tests/configs/subset.yaml')
+        configuration = builder.build()
+        self.assertIsInstance(configuration, appsettings2.Configuration)
+        configuration.some_subobj.some_int
+        configuration['some_subobj:some_int']
+        configuration.get('some_subobj:some_int')
+        configuration.some_subobj.bind(FakeConfigObj())
+        self.assertEqual([ ('some_subobj:some_int', 4), ('some_subobj:some_string', 1) ], profiler.getHotKeys())
+        self.assertEqual([ 'some_float', 'some_string' ], profiler.getUnreadKeys())
+        self.assertEqual({ 'JsonConfigurationProvider(tests/configs/subset.json)': 1, 'YamlConfigurationProvider(tests/configs/subset.yaml)': 4 }, profiler.getLayerReads())
+        # NOTE: reads made while reloading are not counted
+        builder.reload(configuration)
+        self.assertEqual(4, profiler.getReads()['some_subobj:some_int'])
+        self.assertEqual(configuration.toDictionary(), appsettings2.Configuration.loadb(configuration.dumpb()).toDictionary())
+        profiler.detach()
+        profiler.reset()
+        configuration.some_float
+        self.assertEqual([], profiler.getHotKeys())
+        self.assertIs(appsettings2.Configuration, type(configuration.some_subobj))
+        with self.assertRaises(appsettings2.ConfigurationException):
+            configuration.some_subobj.profile(profiler)
+
+    def test_Profiler_SamplesReads(self):
+        configuration = appsettings2.ConfigurationBuilder().addJson(json='{ "a": 1, "b": 2 }').build()
+        profiler = configuration.profile(appsettings2.ConfigurationProfiler(sampleRate=10))
+        for _ in range(100):
+            configuration.a
+        self.assertEqual({ 'a': 100, 'b': 0 }, profiler.getReads())
+        self.assertEqual({ '(none)': 100 }, profiler.getLayerReads())
+
+    def test_Metrics_CustomProviderPopulatesConfiguration(self):
+        class IndexerProvider(appsettings2.providers.ConfigurationProvider):
+            def populateConfiguration(self, configuration:appsettings2.Configuration) -> None:
+                assert isinstance(configuration, appsettings2.Configuration)
+                configuration['X'] = 1
+                configuration['Y:Z'] = configuration['X'] + 1
+        metrics = appsettings2.ConfigurationMetrics()
+        profiler = appsettings2.ConfigurationProfiler()
+        configuration = appsettings2.ConfigurationBuilder(metrics=metrics, profiler=profiler).addProvider(IndexerProvider()).build()
+        self.assertDictEqual({ 'X': 1, 'Y': { 'Z': 2 } }, configuration.toDictionary())
+        self.assertEqual([ 2 ], [p.keys for p in metrics.getBuilds()[0].providers])
+        # NOTE: the configuration is only observed while providers populate it
+        configuration['W'] = 3
+        self.assertEqual(2, metrics.getBuilds()[0].getKeys())
+
+    def test_Import_DefersProvidersAndTheirDependencies(self):
+        script = 'import sys, src; assert "yaml" not in sys.modules and "src.providers.YamlConfigurationProvider" not in sys.modules; src.ConfigurationBuilder().addYaml(yaml="a: 1").build(); assert "yaml" in sys.modules; print(isinstance(src.YamlConfigurationProvider, type))'
+        result = subprocess.run([ sys.executable, '-c', script ], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), capture_output=True, text=True)
+        self.assertEqual('True', result.stdout.strip(), result.stderr)
@@ -2,8 +2,11 @@
 # SPDX-License-Identifier: MIT
 
 from fakes import *
+import array
+import copy
 import json
 import os
+import pickle
 import src as appsettings2
 import unittest
 
@@ -434,3 +437,366 @@ class ConfigurationTests(unittest.TestCase):
         self.assertEqual('2', obj.second)
         self.assertIsNotNone(obj.first)
         self.assertEqual('1', obj.first)
+
+    def test_Interpolate_ResolvesReferencesInDependencyOrder(self):
+        config = appsettings2.Configuration.fromDictionary({
+            'Url': 'https://${Services:Api:Authority}/v1',
+            'Services': {
+                'Api': {
+                    'Authority': '${Services:Api:Host}:${Services:Api:Port}',
+                    'Host': 'api.example.com',
+                    'Port': 8443,
+                    'ActualPort': '${Services:Api:Port}',
+                    'Literal': '$${NotAReference}'
+                }
+            }
+        })
+        config.interpolate()
+        self.assertEqual('https://api.example.com:8443/v1', config.Url)
+        self.assertEqual('api.example.com:8443', config.get('Services:Api:Authority'))
+        self.assertEqual(8443, config.get('Services:Api:ActualPort'))
+        self.assertEqual('${NotAReference}', config.get('Services:Api:Literal'))
+
+    def test_Interpolate_SetReResolvesDependentsOnly(self):
+        config = appsettings2.Configuration()
+        config.set('Host', 'a.example.com')
+        config.set('Url', 'https://${Host}/')
+        config.set('Health', '${Url}health')
+        config.set('Other', '${Unrelated}')
+        config.set('Unrelated', 'x')
+        config.interpolate()
+        self.assertEqual('https://a.example.com/health', config.Health)
+        # NOTE: attribute assignment is not observed, if `Other` were re-resolved it would become 'y'
+        config.Unrelated = 'y'
+        config.set('Host', 'b.example.com')
+        self.assertEqual('https://b.example.com/', config.Url)
+        self.assertEqual('https://b.example.com/health', config.Health)
+        self.assertEqual('x', config.Other)
+        config.set('Url', 'http://${Host}:8080/')
+        self.assertEqual('http://b.example.com:8080/health', config.Health)
+
+    def test_Interpolate_DeleteReferencedKey_MustRaiseWithoutDeleting(self):
+        config = appsettings2.Configuration.fromDictionary({
+            'Host': 'h',
+            'Url': 'http://${Host}/',
+            'Db': { 'Name': 'n', 'Dsn': 'db://${Db:Name}' }
+        })
+        config.interpolate()
+        with self.assertRaises(appsettings2.ConfigurationException) as ctx:
+            del config['Host']
+        self.assertIn('Url', str(ctx.exception))
+        self.assertDictEqual({ 'Host': 'h', 'Url': 'http://h/', 'Db': { 'Name': 'n', 'Dsn': 'db://n' } }, config.toDictionary())
+        # NOTE: values referenced only from within the deleted subtree (or by deleted values) can be deleted
+        config.Db.clear()
+        del config['Url']
+        del config['Host']
+        self.assertDictEqual({ 'Db': {} }, config.toDictionary())
+
+    def test_Interpolate_CircularReference_MustRaise(self):
+        config = appsettings2.Configuration()
+        config.set('A', 'a${B}')
+        config.set('B', 'b${C}')
+        config.set('C', 'c${A}')
+        config.set('D', '${A}')
+        with self.assertRaises(appsettings2.ConfigurationException) as ctx:
+            config.interpolate()
+        self.assertIn('A -> B -> C -> A', str(ctx.exception))
+
+    def test_Interpolate_UnresolvedReference_MustRaise(self):
+        config = appsettings2.Configuration()
+        config.set('A', '${Missing:Key}')
+        self.assertRaises(appsettings2.ConfigurationException, config.interpolate)
+
+    def test_Accessor_ReadsTypedValueAndDefault(self):
+        config = appsettings2.Configuration()
+        config.set('Services:Api:Port', '8443')
+        port = config.accessor('services:api:port', type=int, default=80)
+        missing = config.accessor('Services:Api:Timeout', type=float, default=2.5)
+        self.assertEqual(8443, port.value)
+        self.assertEqual(8443, port())
+        self.assertEqual(2.5, missing.value)
+        config.set('Services:Api:Timeout', '10')
+        self.assertEqual(10.0, missing.value)
+        del config['Services']
+        self.assertEqual(80, port.value)
+        self.assertEqual(2.5, missing.value)
+
+    def test_Accessor_RefreshesOnlyWhenPathChanges(self):
+        config = appsettings2.Configuration()
+        config.set('A:B:C', 1)
+        config.set('A:X', 1)
+        accessor = config.A.accessor('B:C')
+        self.assertEqual('A:B:C', accessor.key)
+        # NOTE: overwrite the cached value, it must survive changes to unrelated keys
+        accessor.value = 'sentinel'
+        config.set('A:X', 2)
+        config.set('A:B:D', 2)
+        self.assertEqual('sentinel', accessor.value)
+        config.set('A:B', { 'C': 3 })
+        self.assertEqual(3, accessor.value)
+        config.A.B.set('C', 4)
+        self.assertEqual(4, accessor.value)
+
+    def test_Reload_InvalidTypedAccessorValue_MustApplyWholeMerge(self):
+        config = appsettings2.Configuration.fromDictionary({ 'A': '1', 'Port': '80', 'Z': 'old' })
+        port = config.accessor('Port', type=int)
+        with self.assertLogs('appsettings2', 'WARNING'):
+            config.reload(appsettings2.Configuration.fromDictionary({ 'A': '2', 'Port': 'eighty' }))
+        self.assertDictEqual({ 'A': '2', 'Port': 'eighty' }, config.toDictionary())
+        self.assertEqual(80, port.value)
+        with self.assertRaises(appsettings2.ConfigurationException):
+            config.accessor('Port', type=int)
+
+    def test_Accessor_InvalidSettingsClassValue_KeepsPreviousValue(self):
+        config = appsettings2.Configuration.fromDictionary({ 'Db': { 'some_int': '1' } })
+        db = config.accessor('Db', type=FakeConfigObj)
+        with self.assertLogs('appsettings2', 'WARNING'):
+            config.set('Db:some_int', 'abc')
+        self.assertEqual('abc', config.get('Db:some_int'))
+        self.assertEqual(1, db.value.some_int)
+
+    def test_Reload_UpdatesInPlace(self):
+        config = appsettings2.Configuration.fromDictionary({
+            'Database': { 'Host': 'a', 'Port': 1 },
+            'Removed': True
+        })
+        database = config.Database
+        host = config.accessor('Database:Host')
+        port = config.accessor('Database:Port', type=str)
+        port.value = 'sentinel'
+        config.reload(appsettings2.Configuration.fromDictionary({
+            'Database': { 'Host': 'b', 'Port': 1 },
+            'Added': True
+        }))
+        self.assertIs(database, config.Database)
+        self.assertEqual('b', host.value)
+        self.assertEqual('sentinel', port.value)
+        self.assertDictEqual({ 'Database': { 'Host': 'b', 'Port': 1 }, 'Added': True }, config.toDictionary())
+
+    def test_Get_ConvertsToType(self):
+        config = appsettings2.Configuration()
+        config.set('Port', '8443')
+        config.set('Ratio', '0.5')
+        config.set('Enabled', 'yes')
+        config.set('Disabled', 'off')
+        config.set('Ports', [ '1', '2' ])
+        config.set('Database', { 'Host': 'localhost', 'Port': '5432' })
+        self.assertEqual(8443, config.get('Port', type=int))
+        self.assertEqual(8443, config['port', int])
+        self.assertEqual(0.5, config.get('Ratio', type=float))
+        self.assertIs(True, config.get('Enabled', type=bool))
+        self.assertIs(False, config.get('Disabled', type=bool))
+        self.assertEqual([ 1, 2 ], config.get('Ports', type=list[int]))
+        self.assertEqual({ 'Host': 'localhost', 'Port': '5432' }, config.get('Database', type=dict))
+        self.assertEqual(5432, config.get('Database:Port', type=int))
+        self.assertEqual(80, config.get('Missing:Port', 80, int))
+        self.assertEqual(80, config.get('Port:Nested', 80, int))
+        self.assertRaises(KeyError, config.__getitem__, ('Missing', int))
+        self.assertRaises(appsettings2.ConfigurationException, config.get, 'Database:Host', type=int)
+        config.set('Obj', { 'some_int': 'abc' })
+        self.assertRaises(appsettings2.ConfigurationException, config.get, 'Obj', type=FakeConfigObj)
+
+    def test_Get_CachesConversionUntilMutated(self):
+        config = appsettings2.Configuration()
+        config.set('A:Port', '8443')
+        first = config.get('A:Port', type=float)
+        self.assertIs(first, config.get('A:Port', type=float))
+        self.assertEqual('8443', config.get('A:Port', type=str))
+        config.set('A:Port', '443')
+        self.assertEqual(443.0, config.get('A:Port', type=float))
+        config.A.Port = '80'
+        self.assertEqual(80.0, config.get('A:Port', type=float))
+
+    def test_GetMany_ResolvesInOrder(self):
+        config = appsettings2.Configuration.fromDictionary({
+            'Services': {
+                'Api': { 'Url': 'http://api', 'Timeout': 5 },
+                'Auth': { 'Url': 'http://auth' }
+            },
+            'Name': 'gateway'
+        })
+        self.assertEqual(
+            ('http://api', 5, 'gateway', None, 'http://auth', None),
+            config.getMany([ 'Services:Api:Url', 'services__api__timeout', 'Name', 'Services:Api:Missing', 'Services:Auth:Url', 'Name:Nested' ]))
+        self.assertEqual((0,), config.getMany([ 'Missing' ], 0))
+
+    def test_Select_MatchesWildcardPatterns(self):
+        config = appsettings2.Configuration.fromDictionary({
+            'Services': {
+                'Api': { 'Url': 'http://api', 'Timeout': 5 },
+                'Auth': { 'Url': 'http://auth' },
+                'Cache': 'redis'
+            },
+            'Name': 'gateway'
+        })
+        self.assertDictEqual(
+            { 'Services:Api:Url': 'http://api', 'Services:Auth:Url': 'http://auth' },
+            config.select('Services:*:Url'))
+        self.assertDictEqual(
+            { 'Services:Api:Timeout': 5, 'Name': 'gateway' },
+            config.select('services:a?i:t*', 'Name'))
+        self.assertDictEqual({}, config.select('Missing:*'))
+
+    def test_KeysWithPrefix_MaintainedIncrementally(self):
+        config = appsettings2.Configuration.fromDictionary({
+            'Features': {
+                'Beta': { 'Search': True, 'Export': False },
+                'BetaSearch': True
+            },
+            'Tenants': { 'acme': { 'Url': 'http://acme' } }
+        })
+        self.assertEqual([ 'Features:Beta:Export', 'Features:Beta:Search' ], config.keysWithPrefix('features:beta'))
+        self.assertEqual(3, config.countWithPrefix('Features'))
+        self.assertEqual(4, config.countWithPrefix())
+        self.assertTrue(config.hasPrefix('Tenants:acme'))
+        self.assertFalse(config.hasPrefix('Tenants:globex'))
+        config.set('Tenants:globex:Url', 'http://globex')
+        config.set('Features:Beta', { 'Import': True })
+        del config['Tenants']['acme']
+        self.assertEqual([ 'Features:Beta:Import' ], config.keysWithPrefix('Features:Beta'))
+        self.assertEqual([ 'Tenants:globex:Url' ], config.keysWithPrefix('Tenants'))
+        self.assertEqual([ 'globex:Url' ], config.Tenants.keysWithPrefix())
+        self.assertEqual(3, config.countWithPrefix())
+        config.clear()
+        self.assertEqual(0, config.countWithPrefix())
+
+    def test_ListOfDicts_ConvertedLazily(self):
+        config = appsettings2.Configuration()
+        config.set('Routes', [ { 'Path': '/a', 'Port': 1 }, { 'Path': '/b', 'Port': 2 }, 3 ])
+        routes = config.Routes
+        self.assertIsInstance(routes, appsettings2.ConfigurationList)
+        self.assertTrue(all(isinstance(e, dict) for e in list(routes.raw())[:2]))
+        # toDictionary and bind read the raw elements
+        self.assertEqual([ { 'Path': '/a', 'Port': 1 }, { 'Path': '/b', 'Port': 2 }, 3 ], config.toDictionary()['Routes'])
+        config.set('keyValuePairs', [ { 'KEY': 'a', 'value': 'b' } ])
+        obj = config.bind(FakeComplexObject())
+        self.assertEqual('a', obj.keyValuePairs[0].key)
+        self.assertIsInstance(next(config.keyValuePairs.raw()), dict)
+        self.assertTrue(all(isinstance(e, dict) for e in list(routes.raw())[:2]))
+        # elements are converted once, as they are accessed
+        self.assertEqual('/b', routes[1].Path)
+        self.assertIs(routes[1], routes[1])
+        self.assertIsInstance(list(routes.raw())[0], dict)
+        self.assertEqual([ '/a', '/b' ], [ r.Path for r in routes[:2] ])
+        self.assertEqual({ 'Path': '/a', 'Port': 1 }, config.toDictionary()['Routes'][0])
+
+    def test_ReadonlyLists_AreCompactTuples(self):
+        config = appsettings2.Configuration.fromDictionary({
+            'Routes': [ { 'Path': '/a' }, { 'Path': '/b' } ],
+            'Nested': { 'Ports': [ 1, 2 ] }
+        }, readonlyLists=True)
+        self.assertIsInstance(config.Routes, appsettings2.ConfigurationTuple)
+        self.assertIsInstance(config.Nested.Ports, appsettings2.ConfigurationTuple)
+        self.assertEqual('/b', config.Routes[-1].Path)
+        self.assertIs(config.Routes[1], config.Routes[-1])
+        self.assertEqual([ '/a', '/b' ], [ r.Path for r in config.Routes ])
+        self.assertEqual({ 'Routes': [ { 'Path': '/a' }, { 'Path': '/b' } ], 'Nested': { 'Ports': [ 1, 2 ] } }, config.toDictionary())
+
+    def test_NumericArrays_StoreAndBindInBulk(self):
+        config = appsettings2.Configuration.fromDictionary({
+            'buckets': [ 10, 20, 30 ],
+            'thresholds': [ 0.5, 0.95, 0.99 ],
+            'weights': [ 1.5, 2.5 ],
+            'mixed': [ 1, 2.5 ],
+            'flags': [ True, False ]
+        }, numericArrays=True)
+        self.assertIsInstance(config.buckets, array.array)
+        self.assertEqual('q', config.buckets.typecode)
+        self.assertEqual('d', config.thresholds.typecode)
+        self.assertNotIsInstance(config.mixed, array.array)
+        self.assertNotIsInstance(config.flags, array.array)
+        obj = config.bind(FakeNumericTables())
+        self.assertEqual([ 10, 20, 30 ], obj.buckets)
+        self.assertEqual([ 0.5, 0.95, 0.99 ], obj.thresholds)
+        self.assertEqual([ 1.5, 2.5 ], obj.weights.tolist())
+        self.assertTrue(obj.weights.readonly)
+        self.assertIs(config.weights, obj.weights.obj)
+        view = config.get('buckets', type=memoryview)
+        self.assertEqual(20, view[1])
+        self.assertEqual([ float ] * 3, [ type(e) for e in config.get('buckets', type=list[float]) ])
+        self.assertEqual([ 10, 20, 30 ], config.toDictionary()['buckets'])
+
+    def test_NumericArrays_UnsupportedMemoryviewConversion_MustRaise(self):
+        config = appsettings2.Configuration.fromDictionary({ 'buckets': [ 10, 20 ], 'mixed': [ 1, 'x' ], 'name': 'n' })
+        self.assertEqual([ 10, 20 ], config.get('buckets', type=memoryview).tolist())
+        for key in ('mixed', 'name'):
+            with self.assertRaises(appsettings2.ConfigurationException):
+                config.get(key, type=memoryview)
+        with self.assertRaises(appsettings2.ConfigurationException):
+            config.get('mixed', type=array.array)
+
+    def test_Pickle_RoundTripsTreeAndOptions(self):
+        config = appsettings2.Configuration.fromDictionary({
+            'Database': { 'Host': 'localhost', 'Port': 5432 },
+            'Routes': [ { 'Path': '/a' }, { 'Path': '/b' } ],
+            'Buckets': [ 1, 2, 3 ]
+        }, numericArrays=True, scrubkeys=True)
+        config.Routes[0].Path
+        clone = pickle.loads(pickle.dumps(config))
+        self.assertEqual(config.toDictionary(), clone.toDictionary())
+        self.assertEqual(5432, clone.Database.Port)
+        self.assertIsInstance(clone.Buckets, array.array)
+        self.assertEqual('/b', clone.Routes[1].Path)
+        # options are restored, and apply to subsequent sets
+        clone.set('Some-Key', [ 4, 5 ])
+        self.assertIsInstance(clone.Some_Key, array.array)
+        # changes to the restored tree are observed by accessors and the index
+        port = clone.accessor('Database:Port')
+        clone.set('Database:Port', 5433)
+        self.assertEqual(5433, port.value)
+        self.assertEqual([ 'Database:Host', 'Database:Port' ], clone.keysWithPrefix('Database'))
+        self.assertEqual({ 'Host': 'localhost', 'Port': 5432 }, pickle.loads(pickle.dumps(config.Database)).toDictionary())
+
+    def test_Copy_CopiesNodesAndDeepCopyCopiesValues(self):
+        config = appsettings2.Configuration.fromDictionary({ 'Database': { 'Hosts': [ 'a', 'b' ], 'Options': [ { 'k': 'v' } ] } }, readonlyLists=True)
+        shallow = copy.copy(config)
+        deep = copy.deepcopy(config)
+        shallow.set('Database:Port', 1)
+        self.assertIsNone(config.get('Database:Port'))
+        self.assertIsNot(config.Database, shallow.Database)
+        self.assertIs(next(config.Database.Options.raw()), next(shallow.Database.Options.raw()))
+        self.assertIsNot(next(config.Database.Options.raw()), next(deep.Database.Options.raw()))
+        self.assertIsInstance(deep.Database.Hosts, appsettings2.ConfigurationTuple)
+        self.assertEqual(config.toDictionary(), deep.toDictionary())
+        deep.Database.Options[0].set('k', 'w')
+        self.assertEqual('v', config.Database.Options[0].k)
+
+    def test_DumpbLoadb_RoundTripsTreeAndOptions(self):
+        source = {
+            'Database': { 'Host': 'localhost', 'Port': 5432, 'Timeout': 2.5, 'Enabled': True },
+            'Routes': [ { 'Path': '/a' }, { 'Path': '/b' } ],
+            'Buckets': [ 1, 2, 3 ],
+            'Zebra': None
+        }
+        config = appsettings2.Configuration.fromDictionary(source, numericArrays=True, readonlyLists=True)
+        data = config.dumpb()
+        loaded = appsettings2.Configuration.loadb(data)
+        self.assertEqual(source, loaded.toDictionary())
+        self.assertEqual(list(source.keys()), list(loaded.keys()))
+        self.assertIsInstance(loaded.Buckets, array.array)
+        self.assertIsInstance(loaded.Routes, appsettings2.ConfigurationTuple)
+        self.assertEqual('/b', loaded.Routes[1].Path)
+        loaded.set('Database:Port', 5433)
+        self.assertEqual(5433, loaded.Database.Port)
+        # the serialized configuration can also be queried without loading it
+        self.assertEqual(5432, appsettings2.FrozenConfiguration(data).get('database:port'))
+        with self.assertRaises(appsettings2.ConfigurationException):
+            appsettings2.Configuration.loadb(b'not a configuration')
+
+    def test_Loadb_TruncatedOrCorruptData_MustRaise(self):
+        data = appsettings2.Configuration.fromDictionary({ 'Database': { 'Host': 'localhost', 'Port': 5432 }, 'Zebra': 'z' }).dumpb()
+        corrupt = bytearray(data)
+        corrupt[-1] ^= 0xFF
+        for truncated in (data[:-3], data[:30], bytes(corrupt)):
+            with self.assertRaises(appsettings2.ConfigurationException):
+                appsettings2.Configuration.loadb(truncated)
+        # NOTE: trailing bytes (such as the padding of a shared memory segment) are ignored
+        self.assertEqual('z', appsettings2.FrozenConfiguration(data + bytes(64)).Zebra)
+        # NOTE: the checksum is only verified on request when opening a view, the length always is
+        corrupt = bytearray(data)
+        corrupt[data.index(b'localhost')] ^= 0x20
+        self.assertEqual('Localhost', appsettings2.FrozenConfiguration(bytes(corrupt)).Database.Host)
+        with self.assertRaises(appsettings2.ConfigurationException):
+            appsettings2.FrozenConfiguration(bytes(corrupt), verify=True)
+        with self.assertRaises(appsettings2.ConfigurationException):
+            appsettings2.FrozenConfiguration(data[:-3])
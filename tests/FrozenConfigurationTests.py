@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from fakes import *
+import os
+import src as appsettings2
+import unittest
+
+class FrozenConfigurationTests(unittest.TestCase):
+
+    def test_Freeze_RoundTripsValues(self):
+        source = {
+            'Database': { 'Host': 'localhost', 'Port': 5432, 'Timeout': 2.5, 'Enabled': True, 'Password': None },
+            'Routes': [ { 'Path': '/a' }, { 'Path': '/b' }, 'fallback' ],
+            'Buckets': [ 10, 20, 30 ],
+            'Big': 2 ** 80,
+            'Ünïcode': 'värde'
+        }
+        config = appsettings2.Configuration.fromDictionary(source, numericArrays=True)
+        frozen = appsettings2.FrozenConfiguration(appsettings2.FrozenConfiguration.freeze(config, generation=7))
+        self.assertEqual(7, frozen.getGeneration())
+        self.assertEqual(source, frozen.toDictionary())
+        self.assertEqual(5432, frozen.get('database:port'))
+        self.assertEqual(5432, frozen.Database.Port)
+        self.assertEqual('5432', frozen['DATABASE__PORT', str])
+        self.assertEqual('/b', frozen.Routes[1].Path)
+        self.assertEqual(20, frozen.Buckets[1])
+        self.assertEqual([ 10.0, 20.0, 30.0 ], frozen.get('Buckets', type=list[float]))
+        self.assertEqual('värde', frozen.get('ÜNÏCODE'))
+        self.assertIsNone(frozen.get('Database:Missing'))
+        self.assertIsNone(frozen.get('Database:Host:Missing'))
+        self.assertEqual(5, len(frozen))
+        with self.assertRaises(KeyError):
+            frozen['Missing']
+        with self.assertRaises(appsettings2.ConfigurationException):
+            frozen.set('Database:Port', 1)
+        with self.assertRaises(appsettings2.ConfigurationException):
+            frozen.Database = None
+
+    def test_Freeze_BindsLikeConfiguration(self):
+        config = appsettings2.Configuration.fromDictionary({ 'some_int': '1', 'some_string': 'two', 'some_subobj': { 'some_float': 3 } })
+        frozen = appsettings2.FrozenConfiguration(appsettings2.FrozenConfiguration.freeze(config))
+        obj = frozen.bind(FakeConfigObj())
+        self.assertEqual(1, obj.some_int)
+        self.assertEqual('two', obj.some_string)
+        self.assertEqual(3.0, obj.some_subobj.some_float)
+
+    def test_SharedConfiguration_PublishesGenerations(self):
+        name = f'as2test{os.getpid()}'
+        publisher = appsettings2.SharedConfiguration(name, create=True)
+        try:
+            self.assertEqual(1, publisher.publish(appsettings2.Configuration.fromDictionary({ 'Workers': 4 })))
+            reader = appsettings2.SharedConfiguration(name)
+            view = None
+            try:
+                view = reader.view()
+                self.assertEqual(4, view.Workers)
+                self.assertIs(view, reader.view())
+                self.assertEqual(2, publisher.publish(appsettings2.Configuration.fromDictionary({ 'Workers': 8 })))
+                self.assertEqual(3, publisher.publish(appsettings2.Configuration.fromDictionary({ 'Workers': 16 })))
+                view = reader.view()
+                self.assertEqual(3, view.getGeneration())
+                self.assertEqual(16, view.Workers)
+                self.assertEqual({}, view.getOptions())
+                self.assertEqual(4, publisher.publish(appsettings2.Configuration.fromDictionary({ 'Buckets': [ 1, 2 ] }, numericArrays=True)))
+                view = reader.view()
+                self.assertEqual({ 'numericArrays': True }, view.getOptions())
+                self.assertEqual({ 'numericArrays': True }, appsettings2.Configuration(**view.getOptions()).getOptions())
+            finally:
+                del view
+                reader.close()
+        finally:
+            publisher.unlink()
+            publisher.close()
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import contextlib
+import io
+import json
+import os
+import src as appsettings2
+import src.__main__
+import tempfile
+import unittest
+
+class MainTests(unittest.TestCase):
+
+    def run_main(self, *argv:str) -> tuple[int, str]:
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(io.StringIO()):
+            code = src.__main__.main(list(argv))
+        return (code, stdout.getvalue())
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.base = os.path.join(self.tmpdir.name, 'appsettings.json')
+        self.override = os.path.join(self.tmpdir.name, 'appsettings.Production.toml')
+        with open(self.base, 'w') as file:
+            file.write('{ "Database": { "Host": "localhost", "Port": 5432 }, "Tags": [ "a", "b" ] }')
+        with open(self.override, 'w') as file:
+            file.write('[Database]\nHost = "db.example.com"\nPool = 10\n')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_Dump_WritesMergedConfiguration(self):
+        code, output = self.run_main('dump', self.base, self.override)
+        self.assertEqual(0, code)
+        self.assertEqual({ 'Database': { 'Host': 'db.example.com', 'Port': 5432, 'Pool': 10 }, 'Tags': [ 'a', 'b' ] }, json.loads(output))
+        code, output = self.run_main('dump', self.base, '--format', 'flat')
+        self.assertEqual([ 'Database:Host=localhost', 'Database:Port=5432', 'Tags=["a", "b"]' ], output.splitlines())
+
+    def test_Get_WritesSingleValue(self):
+        self.assertEqual((0, 'db.example.com\n'), self.run_main('get', 'database:host', self.base, self.override))
+        self.assertEqual((0, '["a", "b"]\n'), self.run_main('get', 'Tags', self.base))
+        self.assertEqual(1, self.run_main('get', 'Missing', self.base)[0])
+
+    def test_Diff_ReportsChangedKeys(self):
+        code, output = self.run_main('diff', self.base, f'{self.base},{self.override}')
+        self.assertEqual(1, code)
+        self.assertEqual([ '~ Database:Host = "localhost" -> "db.example.com"', '+ Database:Pool = 10' ], output.splitlines())
+        self.assertEqual((0, ''), self.run_main('diff', self.base, self.base))
+
+    def test_Snapshot_WritesLoadableSnapshot(self):
+        output = os.path.join(self.tmpdir.name, 'appsettings.bin')
+        self.assertEqual(0, self.run_main('snapshot', self.base, '--output', output)[0])
+        with open(output, 'rb') as file:
+            config = appsettings2.Configuration.loadb(file.read())
+        self.assertEqual(5432, config.Database.Port)
+
+    def test_Time_ReportsEachSource(self):
+        code, output = self.run_main('time', self.base, self.override)
+        self.assertEqual(0, code)
+        lines = output.splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertTrue(lines[1].startswith(self.base[-40:]))
+        self.assertEqual('2', lines[2].split()[-1])
+        self.assertEqual(2, self.run_main('time', os.path.join(self.tmpdir.name, 'missing.json'))[0])
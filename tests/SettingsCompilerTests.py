@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from fakes import *
+import contextlib
+import io
+import os
+import src as appsettings2
+import src.__main__
+import tempfile
+import types
+import unittest
+
+def load(text:str) -> types.ModuleType:
+    module = types.ModuleType('generated')
+    exec(compile(text, 'generated.py', 'exec'), module.__dict__)
+    return module
+
+class SettingsCompilerTests(unittest.TestCase):
+
+    def test_Compile_EmitsSlottedClassesAndLiterals(self):
+        config = appsettings2.Configuration.fromDictionary({
+            'some_int': '1',
+            'some_float': 'inf',
+            'some_list': [ 1, 2, 3 ],
+            'some_string': "it's",
+            'some_subobj': { 'some_int': 2 }
+        })
+        generated = load(appsettings2.SettingsCompiler.compile(config, FakeConfigObj))
+        settings = generated.settings
+        self.assertEqual(1, settings.some_int)
+        self.assertEqual(float('inf'), settings.some_float)
+        self.assertEqual([ 1, 2, 3 ], settings.some_list)
+        self.assertEqual("it's", settings.some_string)
+        self.assertEqual(2, settings.some_subobj.some_int)
+        self.assertEqual('FakeConfigObj', type(settings).__name__)
+        self.assertFalse(hasattr(settings, '__dict__'))
+        self.assertIs(type(settings), type(settings.some_subobj))
+
+    def test_Compile_EmitsFrozenDataclasses(self):
+        config = appsettings2.Configuration.fromDictionary({ 'keyValuePairs': [ { 'key': 'a', 'value': 'b' } ] })
+        generated = load(appsettings2.SettingsCompiler.compile(config, FakeComplexObject, dataclasses=True))
+        pair = generated.settings.keyValuePairs[0]
+        self.assertEqual(('a', 'b'), (pair.key, pair.value))
+        self.assertIsInstance(generated.settings.keyValuePairs, tuple)
+        with self.assertRaises(AttributeError):
+            pair.key = 'c'
+
+    def test_Main_CompileDetectsStaleSources(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            source = os.path.join(dirpath, 'appsettings.json')
+            output = os.path.join(dirpath, 'generated.py')
+            with open(source, 'w') as file:
+                file.write('{ "keyValuePairs": [ { "key": "a", "value": "b" } ] }')
+            with contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(2, src.__main__.main([ 'compile', os.path.join(dirpath, 'missing.json'), '--settings', 'fakes:FakeComplexObject' ]))
+            self.assertEqual(0, src.__main__.main([ 'compile', source, '--settings', 'fakes:FakeComplexObject', '--output', output ]))
+            with open(output) as file:
+                generated = load(file.read())
+            self.assertEqual('b', generated.settings.keyValuePairs[0].value)
+            self.assertFalse(generated.isStale())
+            # NOTE: sources are recorded as absolute paths, so staleness does not depend on the working directory
+            cwd = os.getcwd()
+            os.chdir(dirpath)
+            try:
+                self.assertEqual(0, src.__main__.main([ 'compile', 'appsettings.json', '--settings', 'fakes:FakeComplexObject', '--output', 'relative.py' ]))
+            finally:
+                os.chdir(cwd)
+            with open(os.path.join(dirpath, 'relative.py')) as file:
+                relative = load(file.read())
+            self.assertTrue(os.path.isabs(relative.SOURCES[0]))
+            self.assertFalse(relative.isStale())
+            with open(source, 'w') as file:
+                file.write('{ "keyValuePairs": [] }')
+            self.assertTrue(generated.isStale())
+            self.assertTrue(relative.isStale())
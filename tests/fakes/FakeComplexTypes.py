@@ -7,3 +7,8 @@ class FakeKeyValuePair:
 
 class FakeComplexObject:
     keyValuePairs:list[FakeKeyValuePair]
+
+class FakeNumericTables:
+    buckets:list[int]
+    thresholds:list[float]
+    weights:memoryview
@@ -37,3 +37,62 @@ class CommandLineConfigurationProviderTests(unittest.TestCase):
         self.assertTrue(configuration.get('switch1'))
         self.assertEqual('3', configuration.get('switched-arg'))
         self.assertTrue(configuration.get('switch2'))
+
+    def test_PositionalValue_IsNotAlsoASwitch(self):
+        provider = appsettings2.providers.CommandLineConfigurationProvider([
+            '--switched-arg', '3',
+            '--switch1'
+        ])
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertEqual('3', configuration.get('switched-arg'))
+        self.assertTrue(configuration.get('switch1'))
+        self.assertFalse(configuration.has_key('3'))
+
+    def test_Schema_ConvertsValuesToTypes(self):
+        class ServerSettings:
+            Port:int
+            Ratio:float
+        class AppSettings:
+            Server:ServerSettings
+            Endpoints:list[str]
+            Weights:list[int]
+            Verbose:bool
+            Colors:bool
+            Name:str
+        provider = appsettings2.providers.CommandLineConfigurationProvider([
+            '--Server__Port=8080',
+            '--server:ratio', '0.5',
+            '--Endpoints=a',
+            '--Verbose', 'positional',
+            '--endpoints', 'b',
+            '--no-Colors',
+            '--Weights=1', '--Weights=2',
+            '--Name', '42',
+            '--untyped', '7'
+        ], schema=AppSettings)
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertEqual(8080, configuration.get('Server:Port'))
+        self.assertEqual(0.5, configuration.get('Server:Ratio'))
+        self.assertEqual([ 'a', 'b' ], configuration.get('Endpoints'))
+        self.assertEqual([ 1, 2 ], configuration.get('Weights'))
+        self.assertIs(True, configuration.get('Verbose'))
+        self.assertIs(False, configuration.get('Colors'))
+        self.assertEqual('42', configuration.get('Name'))
+        self.assertEqual('7', configuration.get('untyped'))
+        self.assertTrue(configuration.get('positional'))
+
+    def test_Schema_TypeMap_RejectsInvalidValues(self):
+        provider = appsettings2.providers.CommandLineConfigurationProvider([
+            '--Port=eighty'
+        ], schema={ 'Port': int })
+        self.assertRaises(appsettings2.ConfigurationException, provider.populateConfiguration, appsettings2.Configuration())
+        provider = appsettings2.providers.CommandLineConfigurationProvider([
+            '--Port'
+        ], schema={ 'Port': int })
+        self.assertRaises(appsettings2.ConfigurationException, provider.populateConfiguration, appsettings2.Configuration())
+        provider = appsettings2.providers.CommandLineConfigurationProvider([
+            '--Verbose=maybe'
+        ], schema={ 'Verbose': bool })
+        self.assertRaises(appsettings2.ConfigurationException, provider.populateConfiguration, appsettings2.Configuration())
@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import os
+import src as appsettings2
+import tempfile
+import unittest
+
+class DirectoryConfigurationProviderTests(unittest.TestCase):
+
+    def __write(self, dirpath:str, name:str, text:str) -> str:
+        filepath = os.path.join(dirpath, name)
+        with open(filepath, 'wt') as file:
+            file.write(text)
+        return filepath
+
+    def test_BasicVerification(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            self.__write(dirpath, '10-base.json', '{ "dir_test": "1", "some_subobj": { "dir_test": 1, "json_only": true } }')
+            self.__write(dirpath, '20-override.yaml', 'some_subobj:\n  dir_test: 2\n')
+            self.__write(dirpath, '30-override.toml', '[some_subobj]\ntoml_only = 3\n')
+            self.__write(dirpath, 'README.txt', 'not configuration')
+            provider = appsettings2.providers.DirectoryConfigurationProvider(dirpath)
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual('1', configuration.get('dir_test'))
+            self.assertEqual(2, configuration.get('some_subobj:dir_test'))
+            self.assertTrue(configuration.get('some_subobj:json_only'))
+            self.assertEqual(3, configuration.get('some_subobj:toml_only'))
+            metrics = provider.getMetrics()
+            self.assertEqual(sum(os.path.getsize(os.path.join(dirpath, name)) for name in ('10-base.json', '20-override.yaml', '30-override.toml')), metrics.bytesRead)
+            self.assertGreater(metrics.readTime, 0)
+            self.assertGreater(metrics.parseTime, 0)
+
+    def test_MergesInSortedNameOrder(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            for i in range(12):
+                self.__write(dirpath, f'{i:02}.json', f'{{ "value": {i} }}')
+            configuration = appsettings2.ConfigurationBuilder()\
+                .addDirectory(dirpath, '*.{json,yaml}')\
+                .build()
+            self.assertEqual(11, configuration.get('value'))
+
+    def test_CachedValuesAreNotShared(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            self.__write(dirpath, 'a.json', '{ "Matrix": [ [ 1, 2 ], [ 3 ] ] }')
+            provider = appsettings2.providers.DirectoryConfigurationProvider(dirpath)
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            configuration.Matrix[0].append(99)
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual([ [ 1, 2 ], [ 3 ] ], configuration.toDictionary()['Matrix'])
+
+    def test_ReparsesOnlyChangedFiles(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            a = self.__write(dirpath, 'a.json', '{ "a": 1 }')
+            b = self.__write(dirpath, 'b.json', '{ "b": 1 }')
+            provider = appsettings2.providers.DirectoryConfigurationProvider(dirpath)
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            # rewrite `a` with the same size and mtime (cached), change `b` (re-parsed)
+            st = os.stat(a)
+            self.__write(dirpath, 'a.json', '{ "a": 2 }')
+            os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns))
+            self.__write(dirpath, 'b.json', '{ "b": 22 }')
+            os.utime(b, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            self.__write(dirpath, 'c.json', '{ "c": 1 }')
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual(1, configuration.get('a'))
+            self.assertEqual(22, configuration.get('b'))
+            self.assertEqual(1, configuration.get('c'))
+            os.remove(b)
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertFalse(configuration.has_key('b'))
+
+    def test_MissingRequiredDirectory_MustRaise(self):
+        self.assertRaises(
+            appsettings2.ConfigurationException,
+            appsettings2.providers.DirectoryConfigurationProvider,
+            'tests/configs/does-not-exist.d')
+        provider = appsettings2.providers.DirectoryConfigurationProvider('tests/configs/does-not-exist.d', required=False)
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertEqual(0, len(configuration))
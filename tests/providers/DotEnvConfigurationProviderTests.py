@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import os
+import src as appsettings2
+import unittest
+
+class DotEnvConfigurationProviderTests(unittest.TestCase):
+
+    def test_BasicVerification(self):
+        provider = appsettings2.providers.DotEnvConfigurationProvider(
+            dotenv="""
+# a comment
+dotenv_test=1
+some_subobj__dotenv_test=2
+""")
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertEqual('1', configuration.get('dotenv_test'))
+        self.assertEqual('2', configuration.get('some_subobj:dotenv_test'))
+
+    def test_Syntax(self):
+        environ = { 'HOME': '/home/test', 'EMPTY': '' }
+        provider = appsettings2.providers.DotEnvConfigurationProvider(
+            dotenv="""
+export EXPORTED = exported value   # trailing comment
+UNQUOTED=a#b
+SINGLE='literal ${HOME} \\n'
+DOUBLE="line1\\nline2 \\"quoted\\" \\${HOME}"
+MULTI="first
+second"
+Host=localhost
+Url=http://${Host}:${Port:-8080}/${HOME}
+Fallback=${EMPTY:-default}
+Db:Name = app\r
+\t
+""",
+            environ=environ)
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertEqual('exported value', configuration.get('EXPORTED'))
+        self.assertEqual('a#b', configuration.get('UNQUOTED'))
+        self.assertEqual('literal ${HOME} \\n', configuration.get('SINGLE'))
+        self.assertEqual('line1\nline2 "quoted" ${HOME}', configuration.get('DOUBLE'))
+        self.assertEqual('first\nsecond', configuration.get('MULTI'))
+        self.assertEqual('http://localhost:8080//home/test', configuration.get('Url'))
+        self.assertEqual('default', configuration.get('Fallback'))
+        self.assertEqual('app', configuration.get('Db:Name'))
+
+    def test_DoesNotModifyEnvironment(self):
+        provider = appsettings2.providers.DotEnvConfigurationProvider(dotenv='DOTENV_MUST_NOT_EXIST=1')
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertEqual('1', configuration.get('DOTENV_MUST_NOT_EXIST'))
+        self.assertNotIn('DOTENV_MUST_NOT_EXIST', os.environ)
+
+    def test_InvalidSyntax_MustRaise(self):
+        self.assertRaises(
+            appsettings2.ConfigurationException,
+            appsettings2.providers.DotEnvConfigurationProvider,
+            dotenv='VALID=1\nnot a valid line\n')
+        self.assertRaises(
+            appsettings2.ConfigurationException,
+            appsettings2.providers.DotEnvConfigurationProvider,
+            'tests/configs/does-not-exist.env')
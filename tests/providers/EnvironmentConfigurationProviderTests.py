@@ -15,3 +15,56 @@ class EnvironmentConfigurationProviderTests(unittest.TestCase):
         provider.populateConfiguration(configuration)
         self.assertEqual('1', configuration.get('ENV_TEST'))
         self.assertEqual('2', configuration.get('some_subobj:ENV_TEST'))
+
+    def test_PrefixFilters_AreAppliedBeforeSet(self):
+        environ = {
+            'MYAPP__Database__Host': 'db1',
+            'myapp__Database__Port': '5432',
+            'MYAPP__Secrets__Password': 'hunter2',
+            'FOO_SERVICE_PORT_HTTP': '80',
+            'PATH': '/usr/bin'
+        }
+        provider = appsettings2.providers.EnvironmentConfigurationProvider(
+            include=[ 'MYAPP__' ],
+            exclude=[ 'MYAPP__Secrets' ],
+            strip=True,
+            environ=environ)
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertDictEqual({
+            'Database': { 'Host': 'db1', 'Port': '5432' }
+        }, configuration.toDictionary())
+        environ['MYAPP_Debug'] = '1'
+        provider = appsettings2.providers.EnvironmentConfigurationProvider(include=[ 'myapp' ], exclude=[ 'MYAPP__Secrets' ], strip=True, environ=environ)
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertDictEqual({
+            'Database': { 'Host': 'db1', 'Port': '5432' },
+            'Debug': '1'
+        }, configuration.toDictionary())
+
+    def test_SchemaFilter_AllowsOnlyBoundKeys(self):
+        class DatabaseSettings:
+            Host:str
+            Port:int
+        class AppSettings:
+            Database:DatabaseSettings
+            Tags:dict[str, str]
+            Debug:bool|None
+        environ = {
+            'Database__Host': 'db1',
+            'DATABASE__PORT': '5432',
+            'Database__Unknown': 'x',
+            'Tags__region': 'west',
+            'debug': 'true',
+            'Database': 'not-a-leaf',
+            'FOO_SERVICE_PORT_HTTP': '80'
+        }
+        provider = appsettings2.providers.EnvironmentConfigurationProvider(schema=AppSettings, environ=environ)
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertDictEqual({
+            'Database': { 'Host': 'db1', 'PORT': '5432' },
+            'Tags': { 'region': 'west' },
+            'debug': 'true'
+        }, configuration.toDictionary())
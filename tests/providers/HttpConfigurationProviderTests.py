@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import http.server
+import json
+import src as appsettings2
+import threading
+import unittest
+import urllib.parse
+
+class FakeKeyValueHandler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def __send(self, status:int, body:bytes = b'', etag:str = None) -> None:
+        self.send_response(status)
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.client_address, self.headers.get('If-None-Match')))
+        if server.failures > 0:
+            server.failures -= 1
+            self.__send(503)
+            return
+        if server.notModified:
+            self.__send(304)
+            return
+        if server.html:
+            self.__send(200, b'<html>proxy error</html>')
+            return
+        parts = urllib.parse.urlsplit(self.path)
+        if parts.path == '/kv':
+            query = urllib.parse.parse_qs(parts.query)
+            if 'keys' in query:
+                keys = query['keys'][0].split(',')
+                data = { k: server.data[k] for k in keys if k in server.data }
+            else:
+                data = server.data
+        elif parts.path.startswith('/kv/'):
+            key = urllib.parse.unquote(parts.path[4:])
+            if key not in server.data:
+                self.__send(404)
+                return
+            data = server.data[key]
+        else:
+            self.__send(404)
+            return
+        body = json.dumps(data).encode('utf-8')
+        etag = f'"{hash(body) & 0xFFFFFFFF:x}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.__send(304, etag=etag)
+        else:
+            self.__send(200, body, etag)
+        # NOTE: simulates a server closing idle keep-alive connections, without a `Connection: close` header
+        self.close_connection = server.closeIdle
+
+class HttpConfigurationProviderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), FakeKeyValueHandler)
+        self.server.daemon_threads = True
+        self.server.data = { 'a': 1, 'b': 'two', 'c:d': True, 'e': { 'f': 3.5 } }
+        self.server.closeIdle = False
+        self.server.failures = 0
+        self.server.html = False
+        self.server.notModified = False
+        self.server.requests = []
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/kv'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_BasicVerification(self):
+        provider = appsettings2.providers.HttpConfigurationProvider(self.url)
+        try:
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual(1, configuration.get('a'))
+            self.assertEqual('two', configuration.get('b'))
+            self.assertEqual(True, configuration.get('c:d'))
+            self.assertEqual(3.5, configuration.get('e:f'))
+            self.assertEqual(len(json.dumps(self.server.data)), provider.getMetrics().bytesRead)
+        finally:
+            provider.close()
+
+    def test_ETag_UnchangedDataCosts304(self):
+        provider = appsettings2.providers.HttpConfigurationProvider(self.url)
+        try:
+            provider.populateConfiguration(appsettings2.Configuration())
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual('two', configuration.get('b'))
+            self.assertIsNone(self.server.requests[0][2])
+            self.assertIsNotNone(self.server.requests[1][2])
+            # the connection was kept alive and reused
+            self.assertEqual(self.server.requests[0][1], self.server.requests[1][1])
+            self.server.data['b'] = 'three'
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual('three', configuration.get('b'))
+        finally:
+            provider.close()
+
+    def test_Keys_AreBatched(self):
+        provider = appsettings2.providers.HttpConfigurationProvider(self.url, keys=['a', 'b', 'c:d', 'missing'], batchSize=3)
+        try:
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual(2, len(self.server.requests))
+            self.assertDictEqual({ 'a': 1, 'b': 'two', 'c': { 'd': True } }, configuration.toDictionary())
+        finally:
+            provider.close()
+
+    def test_Keys_PerKeyRequests(self):
+        provider = appsettings2.providers.HttpConfigurationProvider(self.url, keys=['a', 'e', 'missing'], batchSize=1, poolSize=1)
+        try:
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual(3, len(self.server.requests))
+            self.assertEqual(1, len(set(r[1] for r in self.server.requests)))
+            self.assertDictEqual({ 'a': 1, 'e': { 'f': 3.5 } }, configuration.toDictionary())
+        finally:
+            provider.close()
+
+    def test_Retry_WithBackoff(self):
+        self.server.failures = 2
+        provider = appsettings2.providers.HttpConfigurationProvider(self.url, retries=2, backoff=0.01)
+        try:
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual(3, len(self.server.requests))
+            self.assertEqual(1, configuration.get('a'))
+        finally:
+            provider.close()
+
+    def test_Unavailable_NotRequired_UsesLastData(self):
+        provider = appsettings2.providers.HttpConfigurationProvider(self.url, retries=1, backoff=0.01, required=False)
+        try:
+            provider.populateConfiguration(appsettings2.Configuration())
+            self.server.failures = 2
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual(1, configuration.get('a'))
+        finally:
+            provider.close()
+
+    def test_Unavailable_Required_MustRaise(self):
+        self.server.failures = 2
+        provider = appsettings2.providers.HttpConfigurationProvider(self.url, retries=1, backoff=0.01)
+        try:
+            self.assertRaises(
+                appsettings2.ConfigurationException,
+                provider.populateConfiguration,
+                appsettings2.Configuration())
+        finally:
+            provider.close()
+
+    def test_InvalidJson_NotRequired_UsesLastData(self):
+        provider = appsettings2.providers.HttpConfigurationProvider(self.url, retries=0, required=False)
+        try:
+            provider.populateConfiguration(appsettings2.Configuration())
+            self.server.html = True
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual(1, configuration.get('a'))
+        finally:
+            provider.close()
+        provider = appsettings2.providers.HttpConfigurationProvider(self.url, retries=0)
+        try:
+            with self.assertRaises(appsettings2.ConfigurationException) as ctx:
+                provider.populateConfiguration(appsettings2.Configuration())
+            self.assertIn('Invalid JSON', str(ctx.exception))
+        finally:
+            provider.close()
+
+    def test_StaleConnection_IsRetriedImmediately(self):
+        self.server.closeIdle = True
+        provider = appsettings2.providers.HttpConfigurationProvider(self.url, retries=0, backoff=60)
+        try:
+            provider.populateConfiguration(appsettings2.Configuration())
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual(2, len(self.server.requests))
+            self.assertEqual(1, configuration.get('a'))
+        finally:
+            provider.close()
+
+    def test_UnexpectedNotModified_MustRaise(self):
+        self.server.notModified = True
+        builder = appsettings2.ConfigurationBuilder().addHttp(self.url, retries=0, backoff=0.01, poolSize=1, required=False)
+        self.assertDictEqual({}, builder.build().toDictionary())
+        provider = appsettings2.providers.HttpConfigurationProvider(self.url, retries=0)
+        try:
+            with self.assertRaises(appsettings2.ConfigurationException) as ctx:
+                provider.populateConfiguration(appsettings2.Configuration())
+            self.assertIn('304', str(ctx.exception))
+        finally:
+            provider.close()
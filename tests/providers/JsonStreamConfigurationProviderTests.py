@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+from io import StringIO
+import src as appsettings2
+import unittest
+
+SAMPLE_JSON = """
+{
+    "json_test": "1",
+    "some_subobj": {
+        "json_test": 2,
+        "some_float": -3.5e2,
+        "some_escaped": "a\\"b\\\\c\\u00e9",
+        "some_empty": {},
+        "some_list": [ 1, { "key": "value", "deep": [ true, false, null ] }, [] ]
+    },
+    "Database": {
+        "Host": "localhost",
+        "Port": 5432
+    },
+    "Cache": {
+        "Redis": { "Host": "cache1" },
+        "Memory": { "Size": 1024 }
+    },
+    "Routes": [ { "path": "/a" }, { "path": "/b" } ]
+}"""
+
+class JsonStreamConfigurationProviderTests(unittest.TestCase):
+
+    def test_BasicVerification(self):
+        provider = appsettings2.providers.JsonStreamConfigurationProvider(
+            json="""
+            {
+                "json_test": "1",
+                "some_subobj": {
+                    "json_test": 2
+                }
+            }""")
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertEqual('1', configuration.get('json_test'))
+        self.assertEqual(2, configuration.get('some_subobj:json_test'))
+
+    def test_MatchesJsonConfigurationProvider_AtAnyChunkSize(self):
+        expected = appsettings2.Configuration()
+        appsettings2.providers.JsonConfigurationProvider(json=SAMPLE_JSON).populateConfiguration(expected)
+        for chunksize in [ 1, 2, 3, 7, 64, 65536 ]:
+            provider = appsettings2.providers.JsonStreamConfigurationProvider(stream=StringIO(SAMPLE_JSON), chunksize=chunksize)
+            actual = appsettings2.Configuration()
+            provider.populateConfiguration(actual)
+            self.assertDictEqual(expected.toDictionary(), actual.toDictionary())
+        self.assertEqual('a"b\\cé', actual.get('some_subobj:some_escaped'))
+        self.assertEqual(-350.0, actual.get('some_subobj:some_float'))
+        self.assertIsInstance(actual.Routes[0], appsettings2.Configuration)
+
+    def test_IncludeFilter_SkipsUnselectedSubtrees(self):
+        provider = appsettings2.providers.JsonStreamConfigurationProvider(
+            json=SAMPLE_JSON,
+            include=[ 'database', 'Cache:*:Host' ],
+            chunksize=5)
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertDictEqual({
+            'Database': { 'Host': 'localhost', 'Port': 5432 },
+            'Cache': { 'Redis': { 'Host': 'cache1' } }
+        }, configuration.toDictionary())
+
+    def test_ExcludeFilter_SkipsLongStringsAcrossChunks(self):
+        blob = 'x\\"' * 100000
+        json = f'{{ "Blob": "{blob}", "Escaped": "\\\\", "Name": "a" }}'
+        for chunksize in [ 1, 2, 3, 16 ]:
+            provider = appsettings2.providers.JsonStreamConfigurationProvider(
+                json=json,
+                exclude=[ 'Blob', 'Escaped' ],
+                chunksize=chunksize)
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertDictEqual({ 'Name': 'a' }, configuration.toDictionary())
+
+    def test_ExcludeFilter_TakesPrecedence(self):
+        provider = appsettings2.providers.JsonStreamConfigurationProvider(
+            json=SAMPLE_JSON,
+            include=[ 'Database', 'some_subobj' ],
+            exclude=[ 'Database:Port', 'some_subobj:some_list' ])
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertEqual('localhost', configuration.get('Database:Host'))
+        self.assertIsNone(configuration.get('Database:Port'))
+        self.assertEqual(2, configuration.get('some_subobj:json_test'))
+        self.assertIsNone(configuration.get('some_subobj:some_list'))
+        self.assertFalse(configuration.has_key('Routes'))
+
+    def test_InvalidJson_MustRaise(self):
+        for json in [ '{ "a": 1', '{ "a": tru }', '[ 1, 2 ]', '{ "a": "b }', '{ "a": 1 } x' ]:
+            provider = appsettings2.providers.JsonStreamConfigurationProvider(json=json, chunksize=2)
+            self.assertRaises(appsettings2.ConfigurationException, provider.populateConfiguration, appsettings2.Configuration())
+
+    def test_MissingRequiredFile_MustRaise(self):
+        self.assertRaises(
+            appsettings2.ConfigurationException,
+            appsettings2.providers.JsonStreamConfigurationProvider,
+            'tests/configs/does-not-exist.json')
+        provider = appsettings2.providers.JsonStreamConfigurationProvider('tests/configs/does-not-exist.json', required=False)
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertEqual(0, len(configuration))
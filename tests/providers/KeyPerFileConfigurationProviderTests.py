@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import os
+import src as appsettings2
+import tempfile
+import unittest
+
+class KeyPerFileConfigurationProviderTests(unittest.TestCase):
+
+    def __write(self, dirpath:str, name:str, text:str) -> str:
+        filepath = os.path.join(dirpath, name)
+        with open(filepath, 'wt') as file:
+            file.write(text)
+        return filepath
+
+    def __swap(self, dirpath:str, name:str, values:dict[str, str]) -> None:
+        # mimics the kubernetes "atomic writer" used for secret/configmap volumes
+        os.mkdir(os.path.join(dirpath, name))
+        for k, v in values.items():
+            self.__write(os.path.join(dirpath, name), k, v)
+        os.symlink(name, os.path.join(dirpath, '..data_tmp'))
+        os.replace(os.path.join(dirpath, '..data_tmp'), os.path.join(dirpath, '..data'))
+        for k in values.keys():
+            if not os.path.lexists(os.path.join(dirpath, k)):
+                os.symlink(os.path.join('..data', k), os.path.join(dirpath, k))
+
+    def test_BasicVerification(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            self.__write(dirpath, 'Database__Password', 'hunter2\n')
+            self.__write(dirpath, 'ApiKey', 'abc')
+            self.__write(dirpath, '..hidden', 'x')
+            provider = appsettings2.providers.KeyPerFileConfigurationProvider(dirpath, prefix='Secrets')
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertDictEqual({
+                'Secrets': {
+                    'ApiKey': 'abc',
+                    'Database': { 'Password': 'hunter2' }
+                }
+            }, configuration.toDictionary())
+
+    def test_ReadsOnlyChangedFiles(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            a = self.__write(dirpath, 'a', '1')
+            self.__write(dirpath, 'b', '1')
+            provider = appsettings2.providers.KeyPerFileConfigurationProvider(dirpath)
+            provider.populateConfiguration(appsettings2.Configuration())
+            # same inode, size, and mtime: the cached value is used
+            st = os.stat(a)
+            self.__write(dirpath, 'a', '2')
+            os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns))
+            self.__write(dirpath, 'b', '22')
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual('1', configuration.get('a'))
+            self.assertEqual('22', configuration.get('b'))
+
+    def test_DataSymlinkSwap(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            self.__swap(dirpath, '..2024_01_01', { 'Database__Password': 'one', 'ApiKey': 'abc' })
+            provider = appsettings2.providers.KeyPerFileConfigurationProvider(dirpath)
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual('one', configuration.get('Database:Password'))
+            self.assertEqual('abc', configuration.get('ApiKey'))
+            self.__swap(dirpath, '..2024_01_02', { 'Database__Password': 'two', 'ApiKey': 'abc' })
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual('two', configuration.get('Database:Password'))
+            self.assertEqual('abc', configuration.get('ApiKey'))
+            self.assertEqual(2, len(configuration))
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: © 2024 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import os
+import sqlite3
+import src as appsettings2
+import tempfile
+import unittest
+
+class SqliteConfigurationProviderTests(unittest.TestCase):
+
+    def __createDatabase(self, filepath:str) -> sqlite3.Connection:
+        connection = sqlite3.connect(filepath)
+        connection.execute('CREATE TABLE Configuration (key TEXT PRIMARY KEY, value, version INTEGER NOT NULL)')
+        connection.execute('CREATE INDEX IX_Configuration_version ON Configuration (version)')
+        connection.executemany('INSERT INTO Configuration VALUES (?, ?, ?)', [
+            ('sqlite_test', '1', 1),
+            ('some_subobj:sqlite_test', 2, 2),
+            ('Tenants:acme:Name', 'Acme', 3),
+            ('Tenants:acme:Plan', 'gold', 4),
+            ('Tenants:acme2:Name', 'Acme II', 5),
+            ('Tenants:globex:Name', 'Globex', 6)
+        ])
+        connection.commit()
+        return connection
+
+    def test_BasicVerification(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            filepath = os.path.join(dirpath, 'config.db')
+            self.__createDatabase(filepath).close()
+            provider = appsettings2.providers.SqliteConfigurationProvider(filepath)
+            configuration = appsettings2.Configuration()
+            provider.populateConfiguration(configuration)
+            self.assertEqual('1', configuration.get('sqlite_test'))
+            self.assertEqual(2, configuration.get('some_subobj:sqlite_test'))
+            self.assertEqual('Globex', configuration.get('Tenants:globex:Name'))
+            # NOTE: text is counted as utf-8, numbers as 8 bytes
+            self.assertEqual(sum(len(k) + (8 if isinstance(v, int) else len(v)) for k, v in [ ('sqlite_test', '1'), ('some_subobj:sqlite_test', 2), ('Tenants:acme:Name', 'Acme'), ('Tenants:acme:Plan', 'gold'), ('Tenants:acme2:Name', 'Acme II'), ('Tenants:globex:Name', 'Globex') ]), provider.getMetrics().bytesRead)
+
+    def test_PrefixQuery_UsesIndex(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            connection = self.__createDatabase(os.path.join(dirpath, 'config.db'))
+            try:
+                provider = appsettings2.providers.SqliteConfigurationProvider(connection=connection, prefix='Tenants:acme:', batchSize=1)
+                configuration = appsettings2.Configuration()
+                # NOTE: the statement the provider executes (with its parameters bound) is captured, and its query plan inspected
+                statements = []
+                connection.set_trace_callback(statements.append)
+                try:
+                    provider.populateConfiguration(configuration)
+                finally:
+                    connection.set_trace_callback(None)
+                self.assertDictEqual({
+                    'Tenants': { 'acme': { 'Name': 'Acme', 'Plan': 'gold' } }
+                }, configuration.toDictionary())
+                statement = [s for s in statements if s.lstrip().upper().startswith('SELECT')][0]
+                plan = connection.execute(f'EXPLAIN QUERY PLAN {statement}').fetchall()
+                self.assertIn('INDEX', ' '.join(str(row[-1]) for row in plan))
+                connection.execute('INSERT INTO Configuration VALUES (?, ?, ?)', ('Tenants:\U0010FFFF:Name', 'Max', 9))
+                configuration = appsettings2.Configuration()
+                appsettings2.providers.SqliteConfigurationProvider(connection=connection, prefix='Tenants:\U0010FFFF').populateConfiguration(configuration)
+                self.assertDictEqual({ 'Tenants': { '\U0010FFFF': { 'Name': 'Max' } } }, configuration.toDictionary())
+            finally:
+                connection.close()
+
+    def test_VersionColumn_ReadsIncrementally(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            connection = self.__createDatabase(os.path.join(dirpath, 'config.db'))
+            try:
+                provider = appsettings2.providers.SqliteConfigurationProvider(connection=connection, versionColumn='version', prefix='Tenants:', batchSize=2)
+                provider.populateConfiguration(appsettings2.Configuration())
+                connection.execute("UPDATE Configuration SET value = 'platinum', version = 7 WHERE key = 'Tenants:acme:Plan'")
+                connection.execute("UPDATE Configuration SET value = NULL, version = 8 WHERE key = 'Tenants:acme2:Name'")
+                # NOTE: not visible to an incremental read, the version was not advanced
+                connection.execute("UPDATE Configuration SET value = 'Globex Corp' WHERE key = 'Tenants:globex:Name'")
+                connection.commit()
+                configuration = appsettings2.Configuration()
+                provider.populateConfiguration(configuration)
+                self.assertDictEqual({
+                    'Tenants': {
+                        'acme': { 'Name': 'Acme', 'Plan': 'platinum' },
+                        'globex': { 'Name': 'Globex' }
+                    }
+                }, configuration.toDictionary())
+            finally:
+                connection.close()
+
+    def test_InvalidIdentifier_MustRaise(self):
+        self.assertRaises(
+            appsettings2.ConfigurationException,
+            appsettings2.providers.SqliteConfigurationProvider,
+            connection=None,
+            table='Configuration; DROP TABLE Configuration')
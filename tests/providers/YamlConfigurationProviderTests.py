@@ -17,3 +17,56 @@ some_subobj:
         provider.populateConfiguration(configuration)
         self.assertEqual('1', configuration.get('yaml_test'))
         self.assertEqual(2, configuration.get('some_subobj:yaml_test'))
+
+    def test_MultiDocument_MergesEachDocumentAsLayer(self):
+        provider = appsettings2.providers.YamlConfigurationProvider(
+            yaml="""
+yaml_test: "1"
+some_subobj:
+  yaml_test: 2
+  other_test: 3
+---
+---
+some_subobj:
+  yaml_test: 4
+""")
+        configuration = appsettings2.Configuration()
+        provider.populateConfiguration(configuration)
+        self.assertEqual('1', configuration.get('yaml_test'))
+        self.assertEqual(4, configuration.get('some_subobj:yaml_test'))
+        self.assertEqual(3, configuration.get('some_subobj:other_test'))
+
+    def test_MultiDocument_SelectsDocumentsByIndex(self):
+        yaml = """
+layer: 0
+---
+layer: 1
+---
+layer: 2
+---
+: invalid [ yaml
+"""
+        configuration = appsettings2.Configuration()
+        appsettings2.providers.YamlConfigurationProvider(yaml=yaml, documents=[ 0, 1 ]).populateConfiguration(configuration)
+        self.assertEqual(1, configuration.get('layer'))
+        appsettings2.providers.YamlConfigurationProvider(yaml=yaml, documents=[ 2, 0 ]).populateConfiguration(configuration)
+        self.assertEqual(2, configuration.get('layer'))
+
+    def test_MultiDocument_SelectsDocumentsByKey(self):
+        yaml = """
+profile:
+  name: default
+value: 1
+---
+profile:
+  name: production
+value: 2
+---
+profile:
+  name: development
+value: 3
+"""
+        configuration = appsettings2.Configuration()
+        appsettings2.providers.YamlConfigurationProvider(yaml=yaml, selector={ 'Profile:Name': 'production' }).populateConfiguration(configuration)
+        self.assertEqual(2, configuration.get('value'))
+        self.assertEqual('production', configuration.get('profile:name'))